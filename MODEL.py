@@ -1,9 +1,11 @@
 import node
 import struct
 import glob as g
-import linecache
 from copy import copy
+from array import array
 from functools import reduce
+from bisect import bisect_right
+from itertools import compress
 from enum import IntEnum, auto
 from mnemonic import mnemonic as opc
 
@@ -29,7 +31,38 @@ class ConflictingTypesException(Exception):
     pass
 
 
+# the classes created by the hundred thousand (Type, Inst, Symbol,
+# TokenInfo and the node classes) keep their attributes in __slots__.
+# fields() reads them back by name where a __dict__ used to be read.
+
+_slotnames = {} # class -> names of its slots, base classes first
+
+def fields(obj):
+    """the attributes set on obj, by name, whether it has __slots__ or a __dict__"""
+    cls = obj.__class__
+    names = _slotnames.get(cls)
+    if names is None:
+        names = []
+        for klass in reversed(cls.__mro__):
+            for name in klass.__dict__.get('__slots__', ()):
+                if name not in names and name not in ('__dict__', '__weakref__'):
+                    names.append(name)
+        _slotnames[cls] = names
+
+    result = {}
+    for name in names:
+        try:
+            result[name] = getattr(obj, name)
+        except AttributeError: # not assigned yet
+            pass
+    if hasattr(obj, '__dict__'):
+        result.update(obj.__dict__)
+    return result
+
+
 class Type:
+    __slots__ = ('basetype', 'refcount', 'length', 'quals', 'members', 'name', 'hint')
+
     def __init__(self, basetype = 'void'):
         self.basetype = basetype
         self.refcount = 0
@@ -48,6 +81,17 @@ class Type:
             buff += f'[{self.length}]'
         return buff
 
+    def __copy__(self): # shallow, as copy() of the plain object was
+        new = Type.__new__(Type)
+        new.basetype = self.basetype
+        new.refcount = self.refcount
+        new.length = self.length
+        new.quals = self.quals
+        new.members = self.members
+        new.name = self.name
+        new.hint = self.hint
+        return new
+
     def __eq__(self, other):
         if not isinstance(other, Type):
             return NotImplemented
@@ -108,6 +152,11 @@ class StructField:
         self.typ = typ
         self.offset = offset
 
+class Address (int):
+    """address in the data segment. Inst args of this type are relocated by
+    the linker together with the data they point to"""
+    pass
+
 class VarRegion (IntEnum):
     GLOBAL = auto()
     ARGUMENT = auto()
@@ -126,7 +175,12 @@ class GlobalVar:
         self.typ = typ
         self.insts = insts
 
+# opcode -> serialized opcode number, built once per process
+opcstr = {op: str(op.value) for op in opc}
+
 class Inst:
+    __slots__ = ('opc', 'arg')
+
     def __init__(self, opc, arg):
         self.opc = opc
         self.arg = arg
@@ -143,19 +197,175 @@ class Inst:
             return "0"
 
         if arg == '0':
-            return f'{self.opc.value}'
+            return opcstr[self.opc]
         else:
-            return f'{self.opc.value}.{arg}'
+            return f'{opcstr[self.opc]}.{arg}'
 
     def debugserial(self):
         return f'{self.opc.name} {self.arg}'
 
 class Insts:
-    def __init__(self, typ = Type(), bytecodes = []):
+    """result of gencode: the type of the value the code leaves on the stack
+    and the code, as a list of Inst.
+
+    an element of the list may itself be such a list, standing for all of
+    its instructions: gencode links the code of its children in with append
+    instead of copying it with extend, so nested code is not copied once per
+    level. flatten lays the instructions out, once per function."""
+    __slots__ = ('typ', 'bytecodes')
+
+    def __init__(self, typ = Type(), bytecodes = None):
         self.typ = typ
-        self.bytecodes = bytecodes
+        self.bytecodes = bytecodes if bytecodes is not None else []
+
+def flatten(code):
+    """the instructions of code, a list as Insts.bytecodes is"""
+    result = []
+    stack = [iter(code)]
+    while stack:
+        for elem in stack[-1]:
+            if elem.__class__ is list:
+                stack.append(iter(elem))
+                break
+            result.append(elem)
+        else:
+            stack.pop()
+    return result
+
+class InstArray:
+    """instruction sequence as a struct of arrays: the code of a function
+    from Func.gencode on, and the linked program.
+
+    opcodes and int arguments live in typed arrays. an argument that is not
+    an int, a function name or goto label (SYMBOL) or a float (FLOAT), is
+    held in the operands side table under its instruction index; kinds
+    tells an argument apart, and keeps data addresses (ADDRESS) separate
+    from plain ints for relocation. indexing and iteration give Inst."""
+    __slots__ = ('opcodes', 'args', 'kinds', 'operands')
+
+    INT, ADDRESS, FLOAT, SYMBOL = range(4)
+
+    def __init__(self, insts = ()):
+        self.opcodes = array('b')
+        self.args = array('q')
+        self.kinds = array('b')
+        self.operands = {} # index -> argument of kind FLOAT or SYMBOL
+        if insts:
+            self.extend(insts)
+
+    def __len__(self):
+        return len(self.opcodes)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self.opcodes)
+        return Inst(opc(self.opcodes[i]), self.arg(i))
+
+    def __iter__(self):
+        for i in range(len(self.opcodes)):
+            yield self[i]
+
+    def arg(self, i):
+        kind = self.kinds[i]
+        if kind == InstArray.INT:
+            return self.args[i]
+        if kind == InstArray.ADDRESS:
+            return Address(self.args[i])
+        return self.operands[i]
+
+    def append(self, op, arg):
+        self.opcodes.append(op)
+        self.args.append(0)
+        self.kinds.append(0)
+        self.setArg(len(self.opcodes) - 1, arg)
+
+    def setArg(self, i, arg):
+        if isinstance(arg, int):
+            self.args[i] = arg
+            self.kinds[i] = InstArray.ADDRESS if isinstance(arg, Address) else InstArray.INT
+            self.operands.pop(i, None)
+        else:
+            self.args[i] = 0
+            self.kinds[i] = InstArray.FLOAT if isinstance(arg, float) else InstArray.SYMBOL
+            self.operands[i] = arg
+
+    def extend(self, other):
+        """appends other, an InstArray as a whole or any iterable of Inst"""
+        if not isinstance(other, InstArray):
+            other = list(other)
+            self.extendColumns([elem.opc for elem in other], [elem.arg for elem in other])
+            return
+        base = len(self.opcodes)
+        self.opcodes.extend(other.opcodes)
+        self.args.extend(other.args)
+        self.kinds.extend(other.kinds)
+        self.operands.update((i + base, arg) for i, arg in other.operands.items())
+
+    def extendColumns(self, opcodes, args):
+        """appends the instructions of a list of opcodes and the list of their arguments"""
+        kinds = [ARGKINDS.get(arg.__class__) for arg in args]
+        if None in kinds: # some other int subclass
+            kinds = [InstArray.INT if kind is None and isinstance(arg, int) else
+                     InstArray.SYMBOL if kind is None else kind for arg, kind in zip(args, kinds)]
+        base = len(self.opcodes)
+        self.opcodes.extend(opcodes)
+        self.args.extend([arg if kind <= InstArray.ADDRESS else 0 for arg, kind in zip(args, kinds)])
+        self.kinds.extend(kinds)
+        if kinds and max(kinds) >= InstArray.FLOAT:
+            self.operands.update((base + i, args[i]) for i, kind in enumerate(kinds) if kind >= InstArray.FLOAT)
+
+    def extendRange(self, other, start, stop):
+        """appends the instructions of other from start up to stop"""
+        base = len(self.opcodes) - start
+        kinds = other.kinds[start:stop]
+        self.opcodes.extend(other.opcodes[start:stop])
+        self.args.extend(other.args[start:stop])
+        self.kinds.extend(kinds)
+        if kinds and max(kinds) >= InstArray.FLOAT:
+            self.operands.update((base + i, other.operands[i]) for i in range(start, stop) if i in other.operands)
+
+    def truncate(self, length):
+        """drops the instructions from length on"""
+        if max(self.kinds[length:], default=InstArray.INT) >= InstArray.FLOAT:
+            for i in range(length, len(self.opcodes)):
+                self.operands.pop(i, None)
+        del self.opcodes[length:]
+        del self.args[length:]
+        del self.kinds[length:]
+
+    def drop(self, indices):
+        """a copy without the instructions at indices, in ascending order"""
+        keep = bytearray(b'\x01') * len(self.opcodes)
+        for i in indices:
+            keep[i] = 0
+        result = InstArray()
+        result.opcodes = array('b', compress(self.opcodes, keep))
+        result.args = array('q', compress(self.args, keep))
+        result.kinds = array('b', compress(self.kinds, keep))
+        result.operands = {i - bisect_right(indices, i): arg for i, arg in self.operands.items() if keep[i]}
+        return result
+
+    def serialize(self):
+        """one line of the .code section per instruction. the arguments are
+        converted to words all at once, as 32 bit patterns"""
+        count = len(self.opcodes)
+        words = list(struct.unpack(f'>{count}I', struct.pack(f'>{count}i', *self.args)))
+        for i, arg in self.operands.items():
+            if self.kinds[i] == InstArray.FLOAT:
+                words[i] = struct.unpack('>I', struct.pack('>f', arg))[0]
+        lines = [f'{opcstr[op]}.{word}' if word else opcstr[op] for op, word in zip(self.opcodes, words)]
+        for i, arg in self.operands.items():
+            if self.kinds[i] == InstArray.SYMBOL:
+                print(f"serialize arg unkown type error: {arg=}")
+                lines[i] = "0"
+        return lines
+
+# argument class -> its InstArray kind
+ARGKINDS = {int: InstArray.INT, bool: InstArray.INT, Address: InstArray.ADDRESS, float: InstArray.FLOAT, str: InstArray.SYMBOL}
 
 class Symbol:
+    __slots__ = ('name', 'typ', 'initvalue', 'id', 'region') # id and region are set once it is placed
+
     def __init__(self, name, typ, initvalue = 0):
         self.name = name
         self.typ = typ
@@ -223,10 +433,12 @@ class Env:
         self.args = []
         self.argItr = 0
         self.localItr = 0
+        self.scratch = None # local of the current frame for compiler temporaries
 
         self.currentFuncName = '__DEFAULT'
 
         self.calledFunc = []
+        self.lazyFunctions = {} # name -> definition to generate once it is called
 
     def markCalledFunc(self, funcname):
         if not funcname in self.calledFunc:
@@ -263,7 +475,7 @@ class Env:
 
     def issueString(self, string):
         if (string not in self.strings):
-            self.strings[string] = self.staticItr
+            self.strings[string] = Address(self.staticItr)
             self.statics.append(string)
             self.staticItr += len(string) + 1
 
@@ -282,9 +494,12 @@ class Env:
                 return
         self.functions.append(function)
 
+    def addLazyFunction(self, name, definition):
+        self.lazyFunctions[name] = definition
+
     def addStatic(self, symbol):
         symbol.setRegion(VarRegion.GLOBAL)
-        symbol.setID(self.staticItr)
+        symbol.setID(Address(self.staticItr))
         self.staticItr += self.calcTypeSize(symbol.typ)
         self.statics.append(symbol)
 
@@ -301,6 +516,14 @@ class Env:
         self.scopeStack[-1].variables.append(symbol)
         return symbol
 
+    def issueScratch(self):
+        """one word of the current frame that no variable uses. code holds a
+        value there only between two instructions of the same node."""
+        if self.scratch is None:
+            self.scratch = self.localItr
+            self.localItr += 1
+        return self.scratch
+
     def pushScope(self):
         self.scopeStack.append(scopedEnv())
 
@@ -310,8 +533,9 @@ class Env:
     def resetFrame(self, funcname):
         self.localItr = 0
         self.argItr = 0
+        self.scratch = None
         self.args.clear()
-        currentFuncName = funcname
+        self.currentFuncName = funcname
 
     def issueLabel(self):
         newlabel = self.labelitr
@@ -336,10 +560,13 @@ class Env:
             raise TypeRedefineException(f"Redefined Struct '{name}'")
 
         for elem in typ.members:
-            self.scopeStack[-1].enumMembers[elem[0]] = elem[1]
+            self.addEnumMember(*elem)
 
         target[name] = typ
 
+    def addEnumMember(self, name, value):
+        self.scopeStack[-1].enumMembers[name] = value
+
     def getType(self, name, hint = ""):
 
         if hint == 'struct':
@@ -385,7 +612,9 @@ class Env:
             length = typ.length
 
         if isinstance(typ.length, node.AST):
-            length = typ.length.eval()
+            length = typ.length.eval(self)
+            if length is None:
+                raise SymbolLengthNotSpecifiedException
             typ.length = length
 
         if typ.refcount > 0:
@@ -416,6 +645,8 @@ class Env:
 
 
 class TokenInfo:
+    __slots__ = ('lineno', 'colno', 'filename')
+
     def __init__(self, lineno, colno, filename = "input.c"):
         self.lineno = lineno
         self.colno = colno
@@ -424,11 +655,77 @@ class TokenInfo:
     def __str__(self):
         return f"{self.filename}:{self.lineno}:{self.colno}"
 
+class Positions:
+    """source positions of the nodes of a compilation. a node keeps the index
+    of its position (node.tok) and a TokenInfo is made out of it only once a
+    Report refers to it. index 0 is the unknown position.
+
+    glob.positions is the table of the compilation in progress."""
+
+    def __init__(self):
+        self.filenames = ['<ERROR>'] # file id -> filename
+        self.fileids = {'<ERROR>': 0}
+        self.files = array('I', [0])
+        self.lines = array('I', [0])
+        self.columns = array('I', [0])
+
+    def __len__(self):
+        return len(self.lines)
+
+    def add(self, lineno, colno, filename):
+        fileid = self.fileids.get(filename)
+        if fileid is None:
+            fileid = self.fileids[filename] = len(self.filenames)
+            self.filenames.append(filename)
+        self.files.append(fileid)
+        self.lines.append(lineno)
+        self.columns.append(colno)
+        return len(self.lines) - 1
+
+    def token(self, index):
+        return TokenInfo(self.lines[index], self.columns[index], self.filenames[self.files[index]])
+
+    def lineno(self, index):
+        return self.lines[index]
+
+    def shift(self, span, delta):
+        """moves the positions of span, a (start, end) range of indices, by delta lines"""
+        lines = self.lines
+        for i in range(*span):
+            if lines[i] != 0:
+                lines[i] += delta
+
+    def extract(self, spans):
+        """a new table with only the positions of the given spans, in that
+        order, and where the first index of each of them went"""
+        table = Positions()
+        table.filenames = list(self.filenames)
+        table.fileids = dict(self.fileids)
+        starts = []
+        for start, end in spans:
+            starts.append(len(table))
+            table.files.extend(self.files[start:end])
+            table.lines.extend(self.lines[start:end])
+            table.columns.extend(self.columns[start:end])
+        return table, starts
+
 class ErrorModule:
     def __init__(self):
         self.reports = []
         self.fail = 0
         self.notice = 0
+        self.sources = {} # filename -> lines of sources that only exist in memory
+
+    def addSource(self, filename, text):
+        self.sources[filename] = text.splitlines(keepends=True)
+
+    def getline(self, filename, lineno):
+        if filename in self.sources:
+            lines = self.sources[filename]
+            return lines[lineno - 1] if 0 < lineno <= len(lines) else ''
+
+        import linecache # only needed once something is actually reported
+        return linecache.getline(filename, lineno)
 
     def addReport(self, report):
         if (report.level == 'fatal' or report.level == 'error'):
@@ -443,6 +740,7 @@ class ErrorModule:
         return self.notice != 0
 
     def report(self):
+
         fatal = 0
         error = 0
         warning = 0
@@ -468,7 +766,7 @@ class ErrorModule:
             else:
 
                 print(f"\033[1m{elem.tok}: {level}\033[1m: {elem.message}\033[0m")
-                rawline = linecache.getline(elem.tok.filename, elem.tok.lineno)
+                rawline = self.getline(elem.tok.filename, elem.tok.lineno)
                 line = rawline.lstrip()
                 deleted = len(rawline) - len(line)
                 line = line.rstrip()
@@ -495,5 +793,5 @@ class ErrorModule:
 class Report:
     def __init__(self, level, tok, message):
         self.level = level
-        self.tok = tok
+        self.tok = g.positions.token(tok) if isinstance(tok, int) else tok
         self.message = message
@@ -1,8 +1,11 @@
-import json
+import re
 import node
+import hashlib
+from bisect import bisect_right
 import glob as g
 import MODEL as m
-from pycparser import CParser, c_parser, c_ast, parse_file
+from pycparser import c_ast
+from pycparser._tables import make_parser
 
 def escapeString(string):
     string = string.replace(r'\n', '\n')
@@ -14,335 +17,423 @@ def escapeString(string):
     return string
 
 
+# projectAST dispatches on the exact c_ast class of a node: PROJECTORS maps
+# every class to the function that turns it into node / MODEL objects.
+PROJECTORS = {}
+
+def projector(*classes):
+    def register(func):
+        for cls in classes:
+            PROJECTORS[cls] = func
+        return func
+    return register
+
 def projectAST(ast, s = 0):
 
     if (ast is None):
         return None
 
-    elif isinstance(ast, c_ast.ArrayDecl):
-        return projectAST(ast.type, s).setLength(projectAST(ast.dim, s)) #MEMO dim_quals unused
-
-    elif isinstance(ast, c_ast.ArrayRef): # [name*, subscript*]
-        return node.Indirect(a2t(ast), node.Add(a2t(ast), projectAST(ast.name, s), projectAST(ast.subscript, s)))
-
-    elif isinstance(ast, c_ast.Assignment): # [op, lvalue*, rvalue*]
-        if ast.op == '=':
-            return node.Assign(a2t(ast), projectAST(ast.lvalue, s), projectAST(ast.rvalue, s))
-        elif ast.op == '+=':
-            return node.Assign(a2t(ast), projectAST(ast.lvalue, s), node.Add(a2t(ast), projectAST(ast.lvalue, s), projectAST(ast.rvalue, s)))
-        elif ast.op == '-=':
-            return node.Assign(a2t(ast), projectAST(ast.lvalue, s), node.Sub(a2t(ast), projectAST(ast.lvalue, s), projectAST(ast.rvalue, s)))
-        elif ast.op == '*=':
-            return node.Assign(a2t(ast), projectAST(ast.lvalue, s), node.Mul(a2t(ast), projectAST(ast.lvalue, s), projectAST(ast.rvalue, s)))
-        elif ast.op == '/=':
-            return node.Assign(a2t(ast), projectAST(ast.lvalue, s), node.Div(a2t(ast), projectAST(ast.lvalue, s), projectAST(ast.rvalue, s)))
-        elif ast.op == '%=':
-            return node.Assign(a2t(ast), projectAST(ast.lvalue, s), node.Mod(a2t(ast), projectAST(ast.lvalue, s), projectAST(ast.rvalue, s)))
-        elif ast.op == '<<=':
-            return node.Assign(a2t(ast), projectAST(ast.lvalue, s), node.LShift(a2t(ast), projectAST(ast.lvalue, s), projectAST(ast.rvalue, s)))
-        elif ast.op == '>>=':
-            return node.Assign(a2t(ast), projectAST(ast.lvalue, s), node.RShift(a2t(ast), projectAST(ast.lvalue, s), projectAST(ast.rvalue, s)))
-        elif ast.op == '&=':
-            return node.Assign(a2t(ast), projectAST(ast.lvalue, s), node.And(a2t(ast), projectAST(ast.lvalue, s), projectAST(ast.rvalue, s)))
-        elif ast.op == '|=':
-            return node.Assign(a2t(ast), projectAST(ast.lvalue, s), node.Or(a2t(ast), projectAST(ast.lvalue, s), projectAST(ast.rvalue, s)))
-        elif ast.op == '^=':
-            return node.Assign(a2t(ast), projectAST(ast.lvalue, s), node.Xor(a2t(ast), projectAST(ast.lvalue, s), projectAST(ast.rvalue, s)))
-        else:
-            g.r.addReport(m.Report('fatal', a2t(ast), f"unsupported assignment op '{ast.op}'"))
-            return
-
-    elif isinstance(ast, c_ast.BinaryOp): # [op, left* right*]
-        if ast.op == '+':
-            return node.Add(a2t(ast), projectAST(ast.left, s), projectAST(ast.right, s))
-        elif ast.op == '-':
-            return node.Sub(a2t(ast), projectAST(ast.left, s), projectAST(ast.right, s))
-        elif ast.op == '*':
-            return node.Mul(a2t(ast), projectAST(ast.left, s), projectAST(ast.right, s))
-        elif ast.op == '/':
-            return node.Div(a2t(ast), projectAST(ast.left, s), projectAST(ast.right, s))
-        elif ast.op == '%':
-            return node.Mod(a2t(ast), projectAST(ast.left, s), projectAST(ast.right, s))
-        elif ast.op == '<<':
-            return node.LShift(a2t(ast), projectAST(ast.left, s), projectAST(ast.right, s))
-        elif ast.op == '>>':
-            return node.RShift(a2t(ast), projectAST(ast.left, s), projectAST(ast.right, s))
-        elif ast.op == '&':
-            return node.And(a2t(ast), projectAST(ast.left, s), projectAST(ast.right, s))
-        elif ast.op == '|':
-            return node.Or(a2t(ast), projectAST(ast.left, s), projectAST(ast.right, s))
-        elif ast.op == '^':
-            return node.Xor(a2t(ast), projectAST(ast.left, s), projectAST(ast.right, s))
-        elif ast.op == '<':
-            return node.Lt(a2t(ast), projectAST(ast.left, s), projectAST(ast.right, s))
-        elif ast.op == '<=':
-            return node.Lte(a2t(ast), projectAST(ast.left, s), projectAST(ast.right, s))
-        elif ast.op == '>':
-            return node.Gt(a2t(ast), projectAST(ast.left, s), projectAST(ast.right, s))
-        elif ast.op == '>=':
-            return node.Gte(a2t(ast), projectAST(ast.left, s), projectAST(ast.right, s))
-        elif ast.op == '==':
-            return node.Eq(a2t(ast), projectAST(ast.left, s), projectAST(ast.right, s))
-        elif ast.op == '!=':
-            return node.Neq(a2t(ast), projectAST(ast.left, s), projectAST(ast.right, s))
-        elif ast.op == '&&':
-            return node.And(a2t(ast), projectAST(ast.left, s), projectAST(ast.right, s))
-        elif ast.op == '||':
-            return node.Or(a2t(ast), projectAST(ast.left, s), projectAST(ast.right, s))
-        else:
-            g.r.addReport(m.Report('fatal', a2t(ast), f"unsupported binary op '{ast.op}'"))
-            return
-
-    elif isinstance(ast, c_ast.Break): # []
-        return node.Break(a2t(ast))
-
-    elif isinstance(ast, c_ast.Case): # [expr*, stmts**]
-        return [projectAST(ast.expr, s), [projectAST(e, s+1) for e in ast.stmts]]
-
-    elif isinstance(ast, c_ast.Cast): # [to_type*, expr*]
-        return node.Cast(a2t(ast), projectAST(ast.to_type, s), projectAST(ast.expr, s))
-
-    elif isinstance(ast, c_ast.Compound): # [block_items**]
-        if ast.block_items is None:
-            return node.Block(a2t(ast), [])
-        else:
-            return node.Block(a2t(ast), [projectAST(e, s+1) for e in ast.block_items])
-
-    elif isinstance(ast, c_ast.CompoundLiteral): #TODO [type*, init*]
-        pass
-    elif isinstance(ast, c_ast.Constant): # [type, value]
-        if (ast.type == 'int'):
-            return node.NumberI(a2t(ast), ast.value)
-        elif (ast.type == 'float'):
-            return node.NumberF(a2t(ast), ast.value)
-        elif (ast.type == 'char'):
-            ast.value = escapeString(ast.value)
-            return node.NumberI(a2t(ast), int.from_bytes(ast.value[1].encode('utf-32be'), byteorder='big'))
-        elif (ast.type == 'string'):
-            ast.value = escapeString(ast.value)
-            return node.String(a2t(ast), ast.value[1:-1])
-        g.r.addReport(m.Report('fatal', a2t(ast), f"unsupported constant type '{ast.type}' for value '{ast.value}'"))
-
-    elif isinstance(ast, c_ast.Continue): # []
-        return node.Continue(a2t(ast))
-
-    elif isinstance(ast, c_ast.Decl): # [name, quals, storage, funcspec, type*, init*, bitsize*]
-
-        if type(ast.type) in (c_ast.TypeDecl, c_ast.PtrDecl, c_ast.ArrayDecl):
-            init = projectAST(ast.init, s)
-            if isinstance(init, node.String): # 初期化がstirngだった場合、リストに展開
-                string = init.eval()
-                li = list(map(lambda a : node.NumberI(a2t(ast), int.from_bytes(a.encode('utf-32be'), byteorder='big')), string))
-                li.append(node.NumberI(a2t(ast), 0))
-                init = li
-
-            if (s == 0):
-                return node.GlobalVar(a2t(ast), ast.name, projectAST(ast.type, s), init)
-            else:
-                return node.LocalVar(a2t(ast), ast.name, projectAST(ast.type, s), init)
-
-        elif isinstance(ast.type, c_ast.FuncDecl): # 関数定義
-            decl = projectAST(ast.type, s)
-            return node.Func(a2t(ast), decl['type'].name, decl['type'], decl['args'], None)
-
-        else:
-            return projectAST(ast.type, s)
-
-    elif isinstance(ast, c_ast.DeclList): #TODO [decls**]
-        pass
-    elif isinstance(ast, c_ast.Default): # [stmts**]
-        return ['default', [projectAST(e, s+1) for e in ast.stmts]]
-
-    elif isinstance(ast, c_ast.DoWhile): # [cond*, stmt*]
-        return node.DoWhile(a2t(ast), projectAST(ast.stmt, s), projectAST(ast.cond, s))
-
-    elif isinstance(ast, c_ast.EllipsisParam): #TODO []
-        pass
-    elif isinstance(ast, c_ast.EmptyStatement): #TODO []
-        pass
-    elif isinstance(ast, c_ast.Enum): # [name, values*]
-        if ast.values is None: # is type define
-            return m.Type(ast.name).setHint('enum')
-        else: # is enum define
-            return node.Enum(a2t(ast), ast.name, projectAST(ast.values, s))
-
-    elif isinstance(ast, c_ast.Enumerator): # [name, value*]
-        if ast.value is None:
-            return (ast.name, None)
-        else:
-            if isinstance(ast.value, c_ast.Constant):
-                return (ast.name, int(ast.value.value))
-            elif isinstance(ast.value, c_ast.UnaryOp):
-                return (ast.name, -int(ast.value.expr.value))
-            else:
-                g.r.addReport(m.Report('fatal', a2t(ast), f"enum must be \'int\'"))
-
-    elif isinstance(ast, c_ast.EnumeratorList): # [enumerators**]
-        itr = 0
-        typ = m.Type('enum')
-        for elem in ast.enumerators:
-            tmp  = projectAST(elem, s)
-            if tmp[1] is None:
-                typ.addMember((tmp[0], itr))
-                itr += 1
-            else:
-                typ.addMember(tmp)
-                itr = tmp[1] + 1
-
-        return typ
-
-    elif isinstance(ast, c_ast.ExprList): #[exprs**]
-        return [projectAST(e, s) for e in ast.exprs]
-
-    elif isinstance(ast, c_ast.FileAST):
-        return node.Program(a2t(ast), [projectAST(e, s) for e in ast.ext])
-
-    elif isinstance(ast, c_ast.For): # [init*, cond*, next*, stmt*]
-        return node.For(a2t(ast), projectAST(ast.init, s), projectAST(ast.cond, s), projectAST(ast.next, s), projectAST(ast.stmt, s))
-
-    elif isinstance(ast, c_ast.FuncCall): # [name*, args*]
-        return node.Funccall(a2t(ast), ast.name.name, projectAST(ast.args, s))
-
-    elif isinstance(ast, c_ast.FuncDecl): # [args*, type*]
-        return {"args": projectAST(ast.args, s) if ast.args is not None else [],
-                "type": projectAST(ast.type, s)}
-
-    elif isinstance(ast, c_ast.FuncDef): # [args*, type*]
-        return projectAST(ast.decl, s).setBody(projectAST(ast.body, s))
-
-    elif isinstance(ast, c_ast.Goto): # [name]
-        return node.Goto(a2t(ast), ast.name)
-
-    elif isinstance(ast, c_ast.ID): # [name]
-        return node.Symbol(a2t(ast), ast.name)
-
-    elif isinstance(ast, c_ast.IdentifierType):
-        if len(ast.names) == 1:
-            return  m.Type(ast.names[0])
-        g.r.addReport(m.Report('fatal', a2t(ast), f"program error while processing IdentifierType"))
-
-    elif isinstance(ast, c_ast.If): # [cond*, iftrue*, iffalse*]
-        if ast.iffalse is None:
-            return node.If(a2t(ast), projectAST(ast.cond, s), projectAST(ast.iftrue, s))
-        else:
-            return node.Ifelse(a2t(ast), projectAST(ast.cond, s), projectAST(ast.iftrue, s), projectAST(ast.iffalse, s))
-
-    elif isinstance(ast, c_ast.InitList): # [exprs**]
-        return [projectAST(e, s) for e in ast.exprs] #XXX
-
-    elif isinstance(ast, c_ast.Label): # [name, stmt*]
-        return node.Label(a2t(ast), ast.name, projectAST(ast.stmt))
-
-    elif isinstance(ast, c_ast.NamedInitializer): #TODO [name**, expr*]
-        pass
-    elif isinstance(ast, c_ast.ParamList): # [params**]
-        tmp = []
-        for elem in ast.params:
-            typ = projectAST(elem.type, s)
-            tmp.append(m.Symbol(typ.name, typ))
-        return tmp
+    handler = PROJECTORS.get(ast.__class__)
+    if handler is None:
+        g.r.addReport(m.Report('fatal', a2t(ast), f"{type(ast)} is not listed!"))
+        return
 
-    elif isinstance(ast, c_ast.PtrDecl):
-        return projectAST(ast.type, s).addQuals(ast.quals).addRefcount(1)
+    return handler(ast, s)
 
-    elif isinstance(ast, c_ast.Raw): # [type*, opc, arg, exprs**]
-        return node.Raw(a2t(ast), projectAST(ast.type, s), ast.opc[1:-1], int(ast.arg.value), [projectAST(e, s) for e in ast.exprs])
+@projector(c_ast.CompoundLiteral, #TODO [type*, init*]
+           c_ast.DeclList,        #TODO [decls**]
+           c_ast.EllipsisParam,   #TODO []
+           c_ast.EmptyStatement,  #TODO []
+           c_ast.NamedInitializer,#TODO [name**, expr*]
+           c_ast.Union,           #TODO [name, decls**]
+           c_ast.Pragma)          #TODO [string]
+def unimplemented(ast, s):
+    g.r.addReport(m.Report('fatal', a2t(ast), f"{type(ast)} is not yet implemented!"))
 
-    elif isinstance(ast, c_ast.Return): # [expr*]
-        return node.Return(a2t(ast), projectAST(ast.expr, s))
 
-    elif isinstance(ast, c_ast.Struct): # [name, decls**]
-        if ast.decls is None:
-            return m.Type(ast.name).setHint('struct')
+@projector(c_ast.ArrayDecl)
+def projectArrayDecl(ast, s):
+    return projectAST(ast.type, s).setLength(projectAST(ast.dim, s)) #MEMO dim_quals unused
+
+@projector(c_ast.ArrayRef) # [name*, subscript*]
+def projectArrayRef(ast, s):
+    tok = a2t(ast)
+    return node.Indirect(tok, node.Add(tok, projectAST(ast.name, s), projectAST(ast.subscript, s)))
+
+# compound assignment op -> node of the binary operation it applies,
+# wrapped in node.CompoundAssign
+ASSIGNMENTOPS = {
+    '+=': node.Add,
+    '-=': node.Sub,
+    '*=': node.Mul,
+    '/=': node.Div,
+    '%=': node.Mod,
+    '<<=': node.LShift,
+    '>>=': node.RShift,
+    '&=': node.And,
+    '|=': node.Or,
+    '^=': node.Xor,
+}
+
+@projector(c_ast.Assignment) # [op, lvalue*, rvalue*]
+def projectAssignment(ast, s):
+    if ast.op == '=' and not isinstance(ast.rvalue, c_ast.Assignment):
+        return node.Assign(a2t(ast), projectAST(ast.lvalue, s), projectAST(ast.rvalue, s))
+
+    # a = b = c = ... nests to the right. the chain is walked with a list
+    # instead of recursion, in the order the recursion would visit it
+    chain = []
+    while isinstance(ast, c_ast.Assignment):
+        if ast.op == '=':
+            chain.append((ast, None, projectAST(ast.lvalue, s)))
         else:
-            typ = m.Type('struct')
-            for elem in ast.decls:
-                typ.addMember((elem.name, projectAST(elem.type)))
-            return node.Struct(a2t(ast), ast.name, typ)
-
-    elif isinstance(ast, c_ast.StructRef): # [name*, type, filed*] type unused
-        if ast.type == '.':
-            return node.Indirect(a2t(ast), node.FieldAccess(a2t(ast), node.Address(a2t(ast), projectAST(ast.name, s)), ast.field.name))
-        elif ast.type == '->':
-            return node.Indirect(a2t(ast), node.FieldAccess(a2t(ast), projectAST(ast.name, s), ast.field.name))
+            op = ASSIGNMENTOPS.get(ast.op)
+            if op is None:
+                if not chain:
+                    g.r.addReport(m.Report('fatal', a2t(ast), f"unsupported assignment op '{ast.op}'"))
+                    return
+                break
+            chain.append((ast, op, projectAST(ast.lvalue, s)))
+        ast = ast.rvalue
+
+    result = projectAST(ast, s)
+    for elem, op, lvalue in reversed(chain):
+        if op is None:
+            result = node.Assign(a2t(elem), lvalue, result)
         else:
-            g.r.addReport(m.Report('fatal', a2t(ast), f"unsupported field access type '{ast.type}'"))
-
-    elif isinstance(ast, c_ast.Switch): # [cond*, stmt*]
-        return node.Switch(a2t(ast), projectAST(ast.cond, s), [projectAST(e, s+1) for e in ast.stmt.block_items])
-
-    elif isinstance(ast, c_ast.TernaryOp): # [cond*, ifture*, iffalse*]
-        return node.Ternary(a2t(ast), projectAST(ast.cond, s), projectAST(ast.iftrue, s), projectAST(ast.iffalse, s))
-
-    elif isinstance(ast, c_ast.TypeDecl):
-        typ = projectAST(ast.type, s)
-        if isinstance(typ, m.Type):
-            return typ.addQuals(ast.quals).setName(ast.declname)
-        elif type(typ) in (node.Struct, node.Enum):
-            return typ.typ
+            tok = a2t(elem)
+            result = node.CompoundAssign(tok, op(tok, lvalue, result))
+    return result
+
+BINARYOPS = {
+    '+': node.Add,
+    '-': node.Sub,
+    '*': node.Mul,
+    '/': node.Div,
+    '%': node.Mod,
+    '<<': node.LShift,
+    '>>': node.RShift,
+    '&': node.And,
+    '|': node.Or,
+    '^': node.Xor,
+    '<': node.Lt,
+    '<=': node.Lte,
+    '>': node.Gt,
+    '>=': node.Gte,
+    '==': node.Eq,
+    '!=': node.Neq,
+    '&&': node.LogicalAnd,
+    '||': node.LogicalOr,
+}
+
+@projector(c_ast.BinaryOp) # [op, left* right*]
+def projectBinaryOp(ast, s):
+    op = BINARYOPS.get(ast.op)
+    if op is None:
+        g.r.addReport(m.Report('fatal', a2t(ast), f"unsupported binary op '{ast.op}'"))
+        return
+    if not isinstance(ast.left, c_ast.BinaryOp):
+        return op(a2t(ast), projectAST(ast.left, s), projectAST(ast.right, s))
+
+    # a + b + c + ... nests to the left: walk down to the leftmost operand,
+    # then build the nodes back up while projecting the right operands
+    chain = [(ast, op)]
+    left = ast.left
+    while isinstance(left, c_ast.BinaryOp) and (op := BINARYOPS.get(left.op)) is not None:
+        chain.append((left, op))
+        left = left.left
+
+    result = projectAST(left, s)
+    for elem, op in reversed(chain):
+        result = op(a2t(elem), result, projectAST(elem.right, s))
+    return result
+
+@projector(c_ast.Break) # []
+def projectBreak(ast, s):
+    return node.Break(a2t(ast))
+
+@projector(c_ast.Case) # [expr*, stmts**]
+def projectCase(ast, s):
+    return [projectAST(ast.expr, s), [projectAST(e, s+1) for e in ast.stmts]]
+
+@projector(c_ast.Cast) # [to_type*, expr*]
+def projectCast(ast, s):
+    return node.Cast(a2t(ast), projectAST(ast.to_type, s), projectAST(ast.expr, s))
+
+@projector(c_ast.Compound) # [block_items**]
+def projectCompound(ast, s):
+    if ast.block_items is None:
+        return node.Block(a2t(ast), [])
+    else:
+        return node.Block(a2t(ast), [projectAST(e, s+1) for e in ast.block_items])
+
+@projector(c_ast.Constant) # [type, value]
+def projectConstant(ast, s):
+    if (ast.type == 'int'):
+        return node.NumberI(a2t(ast), ast.value)
+    elif (ast.type == 'float'):
+        return node.NumberF(a2t(ast), ast.value)
+    elif (ast.type == 'char'):
+        ast.value = escapeString(ast.value)
+        return node.NumberI(a2t(ast), int.from_bytes(ast.value[1].encode('utf-32be'), byteorder='big'))
+    elif (ast.type == 'string'):
+        ast.value = escapeString(ast.value)
+        return node.String(a2t(ast), ast.value[1:-1])
+    g.r.addReport(m.Report('fatal', a2t(ast), f"unsupported constant type '{ast.type}' for value '{ast.value}'"))
+    unimplemented(ast, s)
+
+@projector(c_ast.Continue) # []
+def projectContinue(ast, s):
+    return node.Continue(a2t(ast))
+
+@projector(c_ast.Decl) # [name, quals, storage, funcspec, type*, init*, bitsize*]
+def projectDecl(ast, s):
+
+    if type(ast.type) in (c_ast.TypeDecl, c_ast.PtrDecl, c_ast.ArrayDecl):
+        init = projectAST(ast.init, s)
+        if isinstance(init, node.String): # 初期化がstirngだった場合、リストに展開
+            string = init.eval()
+            tok = a2t(ast)
+            li = list(map(lambda a : node.NumberI(tok, int.from_bytes(a.encode('utf-32be'), byteorder='big')), string))
+            li.append(node.NumberI(tok, 0))
+            init = li
+
+        if (s == 0):
+            return node.GlobalVar(a2t(ast), ast.name, projectAST(ast.type, s), init)
         else:
-            return typ
+            return node.LocalVar(a2t(ast), ast.name, projectAST(ast.type, s), init)
 
-    elif isinstance(ast, c_ast.Typedef): # [name, quals, storage, type*]
-        typ = projectAST(ast.type, s)
-        if isinstance(typ, node.Struct) or isinstance(typ, node.Enum):
-            return node.Typedef(a2t(ast), ast.name, typ.typ.addQuals(ast.quals))
-        else:
-            return node.Typedef(a2t(ast), ast.name, typ.addQuals(ast.quals))
-
-    elif isinstance(ast, c_ast.Typename): # [name, quals, type*]
-        return projectAST(ast.type, s).addQuals(ast.quals)
-
-    elif isinstance(ast, c_ast.UnaryOp): # [op, expr*]
-        if ast.op == '!':
-            return node.Inv(a2t(ast), projectAST(ast.expr, s))
-        elif ast.op == '+':
-            return projectAST(ast.expr, s)
-        elif ast.op == '-':
-            return node.Minus(a2t(ast), projectAST(ast.expr, s))
-        elif ast.op == '++':
-            return node.Pre_inc(a2t(ast), projectAST(ast.expr, s))
-        elif ast.op == '--':
-            return node.Pre_dec(a2t(ast), projectAST(ast.expr, s))
-        elif ast.op == 'p++':
-            return node.Post_inc(a2t(ast), projectAST(ast.expr, s))
-        elif ast.op == 'p--':
-            return node.Post_dec(a2t(ast), projectAST(ast.expr, s))
-        elif ast.op == '*':
-            return node.Indirect(a2t(ast), projectAST(ast.expr, s))
-        elif ast.op == '&':
-            return node.Address(a2t(ast), projectAST(ast.expr, s))
-        elif ast.op == 'sizeof':
-            return node.Sizeof(a2t(ast), projectAST(ast.expr, s))
-        else:
-            g.r.addReport(m.Report('fatal', a2t(ast), f"unsupported unary op '{ast.op}'"))
-            return
+    elif isinstance(ast.type, c_ast.FuncDecl): # 関数定義
+        decl = projectAST(ast.type, s)
+        return node.Func(a2t(ast), decl['type'].name, decl['type'], decl['args'], None)
 
-    elif isinstance(ast, c_ast.Union): #TODO [name, decls**]
-        pass
-    elif isinstance(ast, c_ast.While): # [cond*, stmt*]
-        return node.While(a2t(ast), projectAST(ast.cond, s), projectAST(ast.stmt, s))
+    else:
+        return projectAST(ast.type, s)
+
+@projector(c_ast.Default) # [stmts**]
+def projectDefault(ast, s):
+    return ['default', [projectAST(e, s+1) for e in ast.stmts]]
+
+@projector(c_ast.DoWhile) # [cond*, stmt*]
+def projectDoWhile(ast, s):
+    return node.DoWhile(a2t(ast), projectAST(ast.stmt, s), projectAST(ast.cond, s))
+
+@projector(c_ast.Enum) # [name, values*]
+def projectEnum(ast, s):
+    if ast.values is None: # is type define
+        return m.Type(ast.name).setHint('enum')
+    else: # is enum define
+        return node.Enum(a2t(ast), ast.name, projectAST(ast.values, s))
+
+@projector(c_ast.Enumerator) # [name, value*]
+def projectEnumerator(ast, s):
+    if ast.value is None:
+        return (ast.name, None)
+    else:
+        # evaluated with the env in node.resolveEnum, as it may use sizeof or
+        # other enum members
+        return (ast.name, projectAST(ast.value, s))
+
+@projector(c_ast.EnumeratorList) # [enumerators**]
+def projectEnumeratorList(ast, s):
+    typ = m.Type('enum')
+    for elem in ast.enumerators:
+        typ.addMember(projectAST(elem, s))
+
+    return typ
+
+@projector(c_ast.ExprList) #[exprs**]
+def projectExprList(ast, s):
+    return [projectAST(e, s) for e in ast.exprs]
+
+@projector(c_ast.FileAST)
+def projectFileAST(ast, s):
+    return node.Program(a2t(ast), [projectAST(e, s) for e in ast.ext])
+
+@projector(c_ast.For) # [init*, cond*, next*, stmt*]
+def projectFor(ast, s):
+    return node.For(a2t(ast), projectAST(ast.init, s), projectAST(ast.cond, s), projectAST(ast.next, s), projectAST(ast.stmt, s))
+
+@projector(c_ast.FuncCall) # [name*, args*]
+def projectFuncCall(ast, s):
+    return node.Funccall(a2t(ast), ast.name.name, projectAST(ast.args, s))
+
+@projector(c_ast.FuncDecl) # [args*, type*]
+def projectFuncDecl(ast, s):
+    return {"args": projectAST(ast.args, s) if ast.args is not None else [],
+            "type": projectAST(ast.type, s)}
+
+@projector(c_ast.FuncDef) # [args*, type*]
+def projectFuncDef(ast, s):
+    return projectAST(ast.decl, s).setBody(projectAST(ast.body, s))
+
+@projector(c_ast.Goto) # [name]
+def projectGoto(ast, s):
+    return node.Goto(a2t(ast), ast.name)
+
+@projector(c_ast.ID) # [name]
+def projectID(ast, s):
+    return node.Symbol(a2t(ast), ast.name)
+
+@projector(c_ast.IdentifierType)
+def projectIdentifierType(ast, s):
+    if len(ast.names) == 1:
+        return  m.Type(ast.names[0])
+    g.r.addReport(m.Report('fatal', a2t(ast), f"program error while processing IdentifierType"))
+    unimplemented(ast, s)
+
+@projector(c_ast.If) # [cond*, iftrue*, iffalse*]
+def projectIf(ast, s):
+    if ast.iffalse is None:
+        return node.If(a2t(ast), projectAST(ast.cond, s), projectAST(ast.iftrue, s))
+
+    # else if chains nest in iffalse
+    chain = []
+    while isinstance(ast, c_ast.If) and ast.iffalse is not None:
+        chain.append((ast, projectAST(ast.cond, s), projectAST(ast.iftrue, s)))
+        ast = ast.iffalse
+
+    if isinstance(ast, c_ast.If):
+        result = node.If(a2t(ast), projectAST(ast.cond, s), projectAST(ast.iftrue, s))
+    else:
+        result = projectAST(ast, s)
+    for elem, cond, then in reversed(chain):
+        result = node.Ifelse(a2t(elem), cond, then, result)
+    return result
+
+@projector(c_ast.InitList) # [exprs**]
+def projectInitList(ast, s):
+    return [projectAST(e, s) for e in ast.exprs] #XXX
+
+@projector(c_ast.Label) # [name, stmt*]
+def projectLabel(ast, s):
+    return node.Label(a2t(ast), ast.name, projectAST(ast.stmt))
+
+@projector(c_ast.ParamList) # [params**]
+def projectParamList(ast, s):
+    tmp = []
+    for elem in ast.params:
+        typ = projectAST(elem.type, s)
+        tmp.append(m.Symbol(typ.name, typ))
+    return tmp
+
+@projector(c_ast.PtrDecl)
+def projectPtrDecl(ast, s):
+    return projectAST(ast.type, s).addQuals(ast.quals).addRefcount(1)
+
+@projector(c_ast.Raw) # [type*, opc, arg, exprs**]
+def projectRaw(ast, s):
+    return node.Raw(a2t(ast), projectAST(ast.type, s), ast.opc[1:-1], int(ast.arg.value), [projectAST(e, s) for e in ast.exprs])
+
+@projector(c_ast.Return) # [expr*]
+def projectReturn(ast, s):
+    return node.Return(a2t(ast), projectAST(ast.expr, s))
+
+@projector(c_ast.Struct) # [name, decls**]
+def projectStruct(ast, s):
+    if ast.decls is None:
+        return m.Type(ast.name).setHint('struct')
+    else:
+        typ = m.Type('struct')
+        for elem in ast.decls:
+            typ.addMember((elem.name, projectAST(elem.type)))
+        return node.Struct(a2t(ast), ast.name, typ)
+
+@projector(c_ast.StructRef) # [name*, type, filed*] type unused
+def projectStructRef(ast, s):
+    if ast.type == '.':
+        tok = a2t(ast)
+        return node.Indirect(tok, node.FieldAccess(tok, node.Address(tok, projectAST(ast.name, s)), ast.field.name))
+    elif ast.type == '->':
+        tok = a2t(ast)
+        return node.Indirect(tok, node.FieldAccess(tok, projectAST(ast.name, s), ast.field.name))
+    else:
+        g.r.addReport(m.Report('fatal', a2t(ast), f"unsupported field access type '{ast.type}'"))
+    unimplemented(ast, s)
+
+@projector(c_ast.Switch) # [cond*, stmt*]
+def projectSwitch(ast, s):
+    return node.Switch(a2t(ast), projectAST(ast.cond, s), [projectAST(e, s+1) for e in ast.stmt.block_items])
+
+@projector(c_ast.TernaryOp) # [cond*, ifture*, iffalse*]
+def projectTernaryOp(ast, s):
+    # a ? b : c ? d : ... nests in iffalse
+    chain = []
+    while isinstance(ast, c_ast.TernaryOp):
+        chain.append((ast, projectAST(ast.cond, s), projectAST(ast.iftrue, s)))
+        ast = ast.iffalse
+
+    result = projectAST(ast, s)
+    for elem, cond, then in reversed(chain):
+        result = node.Ternary(a2t(elem), cond, then, result)
+    return result
+
+@projector(c_ast.TypeDecl)
+def projectTypeDecl(ast, s):
+    typ = projectAST(ast.type, s)
+    if isinstance(typ, m.Type):
+        return typ.addQuals(ast.quals).setName(ast.declname)
+    elif type(typ) in (node.Struct, node.Enum):
+        return typ.typ
+    else:
+        return typ
 
-    elif isinstance(ast, c_ast.Pragma): #TODO [string]
-        pass
+@projector(c_ast.Typedef) # [name, quals, storage, type*]
+def projectTypedef(ast, s):
+    typ = projectAST(ast.type, s)
+    if isinstance(typ, node.Struct) or isinstance(typ, node.Enum):
+        return node.Typedef(a2t(ast), ast.name, typ.typ.addQuals(ast.quals))
     else:
-        g.r.addReport(m.Report('fatal', a2t(ast), f"{type(ast)} is not listed!"))
+        return node.Typedef(a2t(ast), ast.name, typ.addQuals(ast.quals))
+
+@projector(c_ast.Typename) # [name, quals, type*]
+def projectTypename(ast, s):
+    return projectAST(ast.type, s).addQuals(ast.quals)
+
+UNARYOPS = {
+    '!': node.Inv,
+    '-': node.Minus,
+    '++': node.Pre_inc,
+    '--': node.Pre_dec,
+    'p++': node.Post_inc,
+    'p--': node.Post_dec,
+    '*': node.Indirect,
+    '&': node.Address,
+    'sizeof': node.Sizeof,
+}
+
+@projector(c_ast.UnaryOp) # [op, expr*]
+def projectUnaryOp(ast, s):
+    if ast.op == '+':
+        return projectAST(ast.expr, s)
+
+    op = UNARYOPS.get(ast.op)
+    if op is None:
+        g.r.addReport(m.Report('fatal', a2t(ast), f"unsupported unary op '{ast.op}'"))
         return
+    return op(a2t(ast), projectAST(ast.expr, s))
+
+@projector(c_ast.While) # [cond*, stmt*]
+def projectWhile(ast, s):
+    return node.While(a2t(ast), projectAST(ast.cond, s), projectAST(ast.stmt, s))
 
-    g.r.addReport(m.Report('fatal', a2t(ast), f"{type(ast)} is not yet implemented!"))
 
 def a2t(ast):
+    """index of the position of ast in g.positions"""
     if (ast is not None and ast.coord is not None):
-        return m.TokenInfo(ast.coord.line, ast.coord.column, ast.coord.file)
+        return g.positions.add(ast.coord.line, ast.coord.column or 0, ast.coord.file)
     else:
-        return m.TokenInfo(0, 0, '<ERROR>')
+        return 0
+
 
+def makeAST(code, parser = None, scope = None):
+    if isinstance(parser, IncrementalParser):
+        return parser.makeAST(code, scope)
 
-def makeAST(code):
     try:
-        parser = CParser(lex_optimize=False, yacc_optimize=False)
-        #parser = CParser()
-        ast = parser.parse(code, filename=g.filename)
+        if parser is None:
+            parser = make_parser()
+        ast = parser.parse(code, filename=g.filename, scope=scope)
     except Exception as e:
         print(e)
         exit()
@@ -355,5 +446,473 @@ def makeAST(code):
     #g.r.addReport(m.Report('fatal', a2t(ast), f"debugmode"))
     return node
 
+def streamAST(code, parser = None, scope = None):
+    """projects the top level declarations of code one at a time, for the
+    fused front-end of compile.compileUnit. the c_ast of a declaration is let
+    go once it is projected, and the caller generates the code of each
+    declaration before it asks for the next: the nodes of the whole program
+    never exist at the same time."""
+    try:
+        if parser is None:
+            parser = make_parser()
+        ast = parser.parse(code, filename=g.filename, scope=scope)
+    except Exception as e:
+        print(e)
+        exit()
 
+    ext = ast.ext
+    for i in range(len(ext)):
+        decl = ext[i]
+        ext[i] = None
+        yield projectAST(decl)
+
+
+
+
+
+_compilerDigest = None
+
+def compilerDigest():
+    """hash of the front-end and code generator sources. anything cached across
+    processes (incremental declarations, precompiled headers) carries it, so a
+    different version of the compiler never picks it up."""
+    global _compilerDigest
+    if _compilerDigest is None:
+        import sys, mnemonic, optimizer
+        from pycparser import c_parser
+        h = hashlib.sha256()
+        for module in (node, m, mnemonic, optimizer, sys.modules[__name__], c_ast, c_parser):
+            with open(module.__file__, mode="rb") as f:
+                h.update(f.read())
+        _compilerDigest = h.hexdigest()
+    return _compilerDigest
+
+
+# -= :: incremental front-end :: =-
+
+# what the top level splitter has to look at: braces and semicolons outside of
+# string and char literals, and preprocessor lines
+TOPLEVEL = re.compile(r"""[{};]|"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*'|^[ \t]*\#.*$""", re.M)
+LINEDIRECTIVE = re.compile(r'[ \t]*\#[ \t]*(?:line)?[ \t]*(\d+)(?:[ \t]+"(.*)")?')
+NONSPACE = re.compile(r'\S')
+IDENTIFIER = re.compile(r'[A-Za-z_]\w*')
+
+class Decl:
+    """one top level declaration of the preprocessed source"""
+    def __init__(self, text, filename, lineno, colno):
+        self.text = text
+        self.filename = filename
+        self.lineno = lineno
+        self.colno = colno
+        self.body = None # offset of the '{' of a function body in text
+        # file the lexer is in when the parser looks ahead past the end.
+        # pycparser takes the filename of some coords from the lexer at
+        # reduction time, so a #line switching files right after the
+        # declaration shows up in its nodes
+        self.following = filename
+
+    def source(self, prototype = False):
+        """text to parse, with the body of a function definition turned into
+        a ';' if prototype is set"""
+        text = self.text if not prototype else self.text[:self.body].rstrip() + ';'
+        text = ' ' * self.colno + text
+        if self.following != self.filename:
+            text += f'\n#line 1 "{self.following}"\n'
+        return text
+
+def splitDecls(code, filename):
+    """splits preprocessed code into its top level declarations. returns None
+    if the source cannot be split safely (e.g. a #line directive that jumps
+    backwards inside a declaration), in which case it has to be parsed whole."""
+
+    decls = []
+    depth = 0
+    isbody = False # the current depth 0 brace opens a function body
+    start = None   # start of the current declaration
+    pos = 0        # end of the previous declaration
+    pieces = []    # text of the current declaration, with directives replaced
+    piecestart = 0
+    anchor = (0, 1, filename) # (position, its line, its file) from the last #line
+
+    def lineAt(p):
+        return anchor[1] + code.count('\n', anchor[0], p)
+
+    for match in TOPLEVEL.finditer(code):
+        tok = match.group()
+
+        if start is None and NONSPACE.search(code, pos, match.start()) is not None:
+            start = NONSPACE.search(code, pos).start()
+            piecestart = start
+            pieces = []
+            lineno = lineAt(start)
+            colno = start - (code.rfind('\n', 0, start) + 1)
+            declfile = anchor[2]
+
+        if tok.lstrip(' \t')[0] == '#': # preprocessor line
+            directive = LINEDIRECTIVE.match(tok)
+            if directive is None:
+                return None # e.g. #pragma, parsed as an external declaration of its own
+            target = int(directive.group(1))
+            newfile = directive.group(2) or anchor[2]
+            if start is not None:
+                # inside a declaration: pcpp only uses these to skip blank lines,
+                # turn it back into them so the lines stay relative
+                blanks = target - lineAt(match.start()) - 1
+                if newfile != anchor[2] or blanks < 0:
+                    return None
+                pieces.append(code[piecestart:match.start()])
+                pieces.append('\n' * blanks)
+                piecestart = match.end()
+            else:
+                pos = match.end()
+                if decls:
+                    decls[-1].following = newfile
+            anchor = (match.end() + 1, target, newfile)
+            continue
+
+        end = None
+        if tok == '{':
+            if depth == 0:
+                i = match.start() - 1
+                while i >= 0 and code[i] in ' \t\n':
+                    i -= 1
+                isbody = i >= 0 and code[i] == ')'
+                body = sum(map(len, pieces)) + match.start() - piecestart if isbody else None
+            depth += 1
+        elif tok == '}':
+            depth -= 1
+            if depth < 0:
+                return None
+            if depth == 0 and isbody:
+                end = match.end()
+        elif tok == ';' and depth == 0:
+            end = match.end()
+
+        if end is not None:
+            pieces.append(code[piecestart:end])
+            decl = Decl(''.join(pieces), declfile, lineno, colno)
+            if tok == '}':
+                decl.body = body
+            decls.append(decl)
+            start = None
+            pos = end
+
+    if start is not None or NONSPACE.search(code, pos) is not None:
+        return None # trailing incomplete declaration, let the parser report it
+
+    return decls
+
+def shiftReports(reports, delta):
+    """moves the positions reports refer to by delta lines"""
+    for report in reports:
+        if report.tok is not None and report.tok.lineno != 0:
+            report.tok.lineno += delta
+
+def renumber(objs, index):
+    """replaces node.tok of every node reachable from objs by index(node.tok)"""
+    seen = set()
+    stack = list(objs)
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+        elif isinstance(obj, (node.AST, m.Type, m.Symbol)):
+            if id(obj) not in seen:
+                seen.add(id(obj))
+                if isinstance(obj, node.AST):
+                    obj.tok = index(obj.tok)
+                stack.extend(m.fields(obj).values())
+
+class DeclEntry:
+    """projected nodes of one top level declaration"""
+    def __init__(self, items, reports, scope, lineno, span):
+        self.items = items     # node subtrees, as projectAST returns them
+        self.reports = reports # reports issued while projecting them
+        self.scope = scope     # changes to the parser file scope
+        self.lineno = lineno   # line the positions currently refer to
+        self.span = span       # (start, end) of the positions of the nodes
+
+    def move(self, positions, lineno):
+        delta = lineno - self.lineno
+        positions.shift(self.span, delta)
+        shiftReports(self.reports, delta)
+        for item in self.items:
+            if isinstance(item, LazyFunc):
+                item.move(positions, delta)
+        self.lineno = lineno
+
+class LazyFunc (node.AST):
+    """function definition from a header whose body is parsed, projected and
+    code generated only once it is called (see node.Program.gencode).
+    until then it is known by its prototype."""
+    __slots__ = ('proto', 'source', 'filename', 'scope', 'origin', 'parser', 'func', 'reports', 'span')
+
+    def __init__(self, proto, source, filename, scope, parser):
+        self.tok = proto.tok
+        self.proto = proto       # node.Func without body
+        self.source = source     # text of the whole definition, as parsed for the prototype
+        self.filename = filename
+        self.scope = scope       # parser file scope in front of the definition
+        self.origin = g.positions.lineno(proto.tok) # line of the prototype within source
+        self.parser = parser
+        self.func = None         # node.Func once loaded
+        self.reports = []        # reports issued while projecting the body
+        self.span = (0, 0)       # positions of the nodes of func
+
+    def __getstate__(self):
+        state = m.fields(self)
+        state['parser'] = None
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def gencode(self, env, opt):
+        try:
+            env.functionLookup(self.proto.symbolname)
+        except m.SymbolNotFoundException: # not declared by a prototype yet
+            self.proto.gencode(env, opt)
+        env.addLazyFunction(self.proto.symbolname, self)
+        return env
+
+    def define(self, env, opt):
+        if self.func is None:
+            self.load()
+        else:
+            for report in self.reports:
+                g.r.addReport(report)
+        return self.func.gencode(env, opt)
+
+    def load(self):
+        try:
+            if self.parser is None:
+                self.parser = make_parser()
+            ast = self.parser.parse(self.source, filename=self.filename, scope=self.scope)
+        except Exception as e:
+            print(e)
+            exit()
+
+        first = len(g.r.reports)
+        start = len(g.positions)
+        self.func = projectAST(ast.ext[0])
+        self.reports = g.r.reports[first:]
+        self.span = (start, len(g.positions))
+        # the prototype has been moved along with its declaration since
+        self.move(g.positions, g.positions.lineno(self.proto.tok) - self.origin)
+
+    def move(self, positions, delta):
+        """moves the body, if loaded, by delta lines. the prototype is moved
+        with the declaration it belongs to"""
+        if self.func is not None and delta != 0:
+            positions.shift(self.span, delta)
+            shiftReports(self.reports, delta)
+
+class IncrementalParser:
+    """front-end that caches the projected nodes of every top level declaration.
+
+    the preprocessed source is split into declarations, and a declaration
+    whose text (and the typedef names it sees) is unchanged since an earlier
+    compile is not parsed and projected again: only the declarations that
+    were edited are. declarations that merely moved are relocated.
+
+    a source that was compiled before as a whole (users submit the same
+    program again) is put together from its entries without even being
+    split: it skips the front-end entirely.
+
+    with lazy set, function definitions from headers are only parsed up to
+    their body, which is left for LazyFunc to parse when it is called.
+
+    use it in place of the CParser passed to compile()."""
+
+    def __init__(self, parser = None, filename = None, limit = 4096, lazy = False, programlimit = 256):
+        self.parser = parser if parser is not None else make_parser()
+        self.filename = filename
+        self.limit = limit
+        self.lazy = lazy
+        self.programlimit = programlimit
+        self.entries = {} # key -> DeclEntry, least recently used first
+        self.programs = {} # source digest -> [(key, lineno)] of its entries, least recently used first
+        self.positions = m.Positions() # positions of the nodes of the entries
+        self.dirty = False
+        if filename is not None:
+            self.load()
+
+    # CParser interface, for users that need a plain parse (pch)
+    def parse(self, text, filename = '', debuglevel = 0, scope = None):
+        return self.parser.parse(text, filename, debuglevel, scope)
+
+    def file_scope(self):
+        return self.parser.file_scope()
+
+    def makeAST(self, code, scope = None):
+        source = hashlib.sha256(f"{g.filename}\0{self.lazy}\0{sorted((scope or {}).items())}\0{code}".encode()).hexdigest()
+        program = self.recall(source)
+        if program is not None:
+            return program
+
+        decls = splitDecls(code, g.filename)
+        if decls is None:
+            return makeAST(code, self.parser, scope)
+
+        initial = scope
+        scope = dict(scope or ())
+        used = set()
+
+        # parse what changed first, so that a syntax error is reported by a
+        # plain parse of the whole source before anything has been projected
+        plan = []
+        for decl in decls:
+            lazy = self.lazy and decl.body is not None and decl.filename != g.filename
+            typedefs = tuple(sorted(name for name in set(IDENTIFIER.findall(decl.text)) if scope.get(name)))
+            key = hashlib.sha256(f"{decl.filename}\0{decl.following}\0{decl.colno}\0{lazy}\0{typedefs}\0{decl.text}".encode()).hexdigest()
+            entry = self.entries.pop(key, None) if key not in used else None
+            used.add(key)
+            if entry is not None:
+                self.entries[key] = entry
+                scope.update(entry.scope)
+                plan.append((decl, key, entry))
+                continue
+
+            before = dict(scope) if lazy else None
+            try:
+                ast = self.parser.parse(decl.source(lazy), filename=decl.filename, scope=scope)
+            except Exception:
+                return makeAST(code, self.parser, initial)
+            after = self.parser.file_scope()
+            changes = {name: typ for name, typ in after.items() if scope.get(name, None) is not typ}
+            scope.update(changes)
+            plan.append((decl, key, (ast, changes, before)))
+
+        g.positions = self.positions
+        body = []
+        for decl, key, entry in plan:
+            if not isinstance(entry, DeclEntry):
+                ast, changes, before = entry
+                first = len(g.r.reports)
+                start = len(self.positions)
+                items = [projectAST(e) for e in ast.ext]
+                if before is not None:
+                    items = [LazyFunc(items[0], decl.source(), decl.filename, before, self.parser)]
+                entry = DeclEntry(items, g.r.reports[first:], changes, 1, (start, len(self.positions)))
+                self.entries[key] = entry
+                self.dirty = True
+            else:
+                self.reuse(entry)
+
+            if entry.lineno != decl.lineno:
+                entry.move(self.positions, decl.lineno)
+            body.extend(entry.items)
+
+        # a declaration that shows up twice is projected for each of them,
+        # the entries do not tell both apart
+        keys = [key for _, key, _ in plan]
+        if len(set(keys)) == len(keys):
+            self.programs[source] = [(key, decl.lineno) for decl, key, _ in plan]
+            self.dirty = True
+
+        while len(self.entries) > self.limit:
+            del self.entries[next(iter(self.entries))]
+        while len(self.programs) > self.programlimit:
+            del self.programs[next(iter(self.programs))]
+
+        self.compact()
+        return node.Program(0, body)
+
+    def reuse(self, entry):
+        """replays what projecting the nodes of a cached entry issued"""
+        for report in entry.reports:
+            g.r.addReport(report)
+        for item in entry.items:
+            if isinstance(item, LazyFunc):
+                item.parser = self.parser
+
+    def recall(self, source):
+        """the program of a source compiled before, None if it was not or
+        if some of its entries have been dropped since"""
+        plan = self.programs.pop(source, None)
+        if plan is None or any(key not in self.entries for key, _ in plan):
+            return None
+        self.programs[source] = plan
+
+        g.positions = self.positions
+        body = []
+        for key, lineno in plan:
+            entry = self.entries.pop(key)
+            self.entries[key] = entry
+            self.reuse(entry)
+            if entry.lineno != lineno:
+                entry.move(self.positions, lineno)
+            body.extend(entry.items)
+        return node.Program(0, body)
+
+    def compact(self, slack = 65536):
+        """drops the positions of the nodes no entry refers to anymore, once
+        they outnumber the live ones"""
+        spans = []
+        for entry in self.entries.values():
+            spans.append(entry.span)
+            spans.extend(item.span for item in entry.items if isinstance(item, LazyFunc))
+        spans = sorted(span for span in spans if span[0] != span[1])
+        live = sum(end - start for start, end in spans)
+        if len(self.positions) <= 2 * live + slack:
+            return
 
+        positions, starts = self.positions.extract(spans)
+        firsts = [start for start, _ in spans]
+        def index(tok):
+            if tok == 0:
+                return 0
+            i = bisect_right(firsts, tok) - 1
+            return starts[i] + tok - firsts[i]
+        def relocate(span):
+            start, end = span
+            return (index(start), index(start) + end - start) if start != end else (0, 0)
+
+        for entry in self.entries.values():
+            renumber(entry.items, index)
+            entry.span = relocate(entry.span)
+            for item in entry.items:
+                if isinstance(item, LazyFunc):
+                    item.span = relocate(item.span)
+
+        self.positions = positions
+        g.positions = positions
+        self.dirty = True
+
+    def load(self):
+        import pickle
+        try:
+            with open(self.filename, mode="rb") as f:
+                digest, positions, entries, programs = pickle.load(f)
+        except (OSError, EOFError, ValueError, TypeError, AttributeError, pickle.UnpicklingError):
+            return
+        if digest == compilerDigest():
+            self.positions = positions
+            self.entries = entries
+            self.programs = programs
+
+    def save(self):
+        import os, pickle
+        if self.filename is None or not self.dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+            try:
+                data = pickle.dumps((compilerDigest(), self.positions, self.entries, self.programs), pickle.HIGHEST_PROTOCOL)
+            except RecursionError:
+                # pickle recurses into the nodes: leave out declarations
+                # nested too deep for it, they are projected again next time
+                entries = {}
+                for key, entry in self.entries.items():
+                    try:
+                        pickle.dumps(entry, pickle.HIGHEST_PROTOCOL)
+                    except RecursionError:
+                        continue
+                    entries[key] = entry
+                data = pickle.dumps((compilerDigest(), self.positions, entries, self.programs), pickle.HIGHEST_PROTOCOL)
+            with open(self.filename, mode="wb") as f:
+                f.write(data)
+        except OSError:
+            return
+        self.dirty = False
@@ -0,0 +1,70 @@
+import os
+import sys
+import tempfile
+import subprocess
+from statistics import median
+from argparse import ArgumentParser
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+from project import generate
+
+# compiles the source with the tree of the whole unit or the fused front-end,
+# prints the time compile() took, the peak resident set size of the
+# interpreter in kilobytes and a digest of the program it made
+DRIVER = '''
+import sys
+import time
+import resource
+import hashlib
+import glob as g
+import compile
+with open(sys.argv[1]) as f:
+    g.init(sys.argv[1], f.read())
+start = time.perf_counter()
+dumps = compile.compile(g.source, fused=sys.argv[2] == 'fused')
+elapsed = time.perf_counter() - start
+if dumps is None:
+    g.r.report()
+    sys.exit(1)
+h = hashlib.sha256()
+for line in dumps['code'].serialize():
+    h.update(line.encode())
+h.update(repr(dumps['data']).encode())
+print(elapsed * 1000, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, h.hexdigest())
+'''
+
+def run(source, mode):
+    """milliseconds compile() took, peak resident set size in MiB and the
+    digest of the program, in a fresh interpreter"""
+    proc = subprocess.run([sys.executable, '-c', DRIVER, source, mode], cwd=ROOT, capture_output=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.decode())
+    ms, kilobytes, digest = proc.stdout.decode().split()
+    return float(ms), int(kilobytes) / 1024, digest
+
+if __name__ == '__main__':
+    argparser = ArgumentParser(description='time and peak memory of the fused front-end against the tree of the whole unit')
+    argparser.add_argument('-f', '--functions', type=int, nargs='+', default=[200, 800, 3200], help='sizes of the generated sources, in functions')
+    argparser.add_argument('-s', '--statements', type=int, default=20, help='statements per function')
+    argparser.add_argument('-n', '--runs', type=int, default=3, help='runs per measurement')
+    args = argparser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f'{"functions":>9} {"lines":>8} {"tree":>10} {"fused":>10} {"tree":>11} {"fused":>11}')
+        for functions in args.functions:
+            text = generate(functions, args.statements, functions)
+            source = os.path.join(tmp, f'generated{functions}.c')
+            with open(source, mode='w') as f:
+                f.write(text)
+
+            results = {}
+            for mode in ('tree', 'fused'):
+                runs = [run(source, mode) for _ in range(args.runs)]
+                results[mode] = (median(ms for ms, _, _ in runs), median(mib for _, mib, _ in runs), runs[0][2])
+            if results['tree'][2] != results['fused'][2]:
+                raise RuntimeError(f'the fused front-end made different code for {functions} functions')
+
+            tree, fused = results['tree'], results['fused']
+            print(f'{functions:>9} {text.count(chr(10)):>8} {tree[0]:8.0f}ms {fused[0]:8.0f}ms '
+                  f'{tree[1]:8.1f}MiB {fused[1]:8.1f}MiB')
@@ -0,0 +1,98 @@
+import io
+import os
+import sys
+import time
+from statistics import median
+from argparse import ArgumentParser
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pcpp import Preprocessor
+from pycparser._tables import LEXERS, make_parser
+
+def preprocess(filename):
+    cpp = Preprocessor()
+    cpp.add_path(os.path.join(ROOT, 'lvmxlib'))
+    with open(filename) as f:
+        cpp.parse(f, filename)
+    out = io.StringIO()
+    cpp.write(out)
+    return out.getvalue()
+
+# sources with syntax and lexical errors, or ending in a directive without a
+# newline: both lexers have to lead to the same reports, the parser reads the
+# lexer of the offending token
+BAD = [
+    'int main() {\n int x = ;\n}\n',
+    'int main() {\n int x;\n x = 0x1G;\n return x;\n}\n',
+    'int main() {\n return 09;\n}\n',
+    "int main() {\n return 'ab\n}\n",
+    'int main() {\n int x = 1 @ 2;\n}\n',
+    'int main() {\n return 0;\n}\n# 5 "bad.c"',
+]
+
+def tokenize(lexer, text, errors = None):
+    report = (lambda msg, line, column: errors.append((msg, line, column))) if errors is not None else (lambda msg, line, column: None)
+    clex = LEXERS[lexer](report, lambda: None, lambda: None, lambda name: False)
+    clex.build(optimize=True, lextab='pycparser.lextab')
+    clex.input(text)
+    tokens = []
+    while True:
+        tok = clex.token()
+        if tok is None:
+            return tokens
+        tokens.append((tok.type, tok.value, tok.lineno, tok.lexpos))
+
+def outcome(lexer, parser, text):
+    """tokens and lexer errors of text, and the error parsing it reports"""
+    errors = []
+    tokens = tokenize(lexer, text, errors)
+    try:
+        parser.parse(text, filename='bad.c')
+        message = None
+    except Exception as e:
+        message = f'{e.__class__.__name__}: {e}'
+    return tokens, errors, message
+
+def measure(func, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return median(times)
+
+if __name__ == '__main__':
+    argparser = ArgumentParser(description='compare the fast and the ply lexer on preprocessed sources')
+    argparser.add_argument('sources', type=str, nargs='*', default=[os.path.join(ROOT, 'test.c')], help='C sources to tokenize')
+    argparser.add_argument('-n', '--runs', type=int, default=20, help='runs per measurement')
+    args = argparser.parse_args()
+
+    parsers = {lexer: make_parser(lexer) for lexer in LEXERS}
+
+    mismatch = False
+    print(f'{"source":<24} {"tokens":>7} ' + ' '.join(f'{"lex " + l:>10} {"parse " + l:>11}' for l in LEXERS))
+    for filename in args.sources:
+        text = preprocess(filename)
+
+        streams = {lexer: tokenize(lexer, text) for lexer in LEXERS}
+        if streams['fast'] != streams['ply']:
+            mismatch = True
+            print(f'{filename}: token streams differ')
+
+        row = f'{os.path.basename(filename):<24} {len(streams["ply"]):>7} '
+        for lexer, parser in parsers.items():
+            lex = measure(lambda: tokenize(lexer, text), args.runs)
+            parse = measure(lambda: parser.parse(text, filename=filename), args.runs)
+            row += f'{lex:8.2f}ms {parse:9.2f}ms '
+        print(row)
+
+    for i, text in enumerate(BAD):
+        outcomes = {lexer: outcome(lexer, parser, text) for lexer, parser in parsers.items()}
+        if outcomes['fast'] != outcomes['ply']:
+            mismatch = True
+            print(f'bad input {i}: {outcomes["fast"][2]!r} with the fast lexer, {outcomes["ply"][2]!r} with ply')
+
+    if mismatch:
+        sys.exit(1)
@@ -0,0 +1,68 @@
+import io
+import os
+import sys
+import tarfile
+import tempfile
+import subprocess
+from argparse import ArgumentParser
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+from project import generate
+
+def export(rev, directory):
+    """the tree of the given git revision, extracted into directory"""
+    archive = subprocess.run(['git', 'archive', rev], cwd=ROOT, capture_output=True, check=True).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(directory)
+    return directory
+
+# the generated sources need no preprocessing: feed them to compile() as the
+# lambda does, so that the peak is the one of parsing and code generation.
+# prints the peak resident set size of the interpreter in kilobytes
+DRIVER = '''
+import sys
+import resource
+import glob as g
+import compile
+with open(sys.argv[1]) as f:
+    g.init(sys.argv[1], f.read())
+if compile.compile(g.source) is None:
+    g.r.report()
+    sys.exit(1)
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+'''
+
+def peakrss(tree, source):
+    """peak resident set size of a fresh interpreter compiling source with
+    the compiler in tree, in MiB"""
+    proc = subprocess.run([sys.executable, '-c', DRIVER, source], cwd=tree, capture_output=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.decode())
+    return int(proc.stdout) / 1024 # kilobytes on linux
+
+if __name__ == '__main__':
+    argparser = ArgumentParser(description='peak memory of compiling large generated sources')
+    argparser.add_argument('-f', '--functions', type=int, nargs='+', default=[200, 800, 3200], help='sizes of the generated sources, in functions')
+    argparser.add_argument('-s', '--statements', type=int, default=20, help='statements per function')
+    argparser.add_argument('-b', '--baseline', type=str, default=None, help='git revision to compare against (e.g. HEAD~1)')
+    args = argparser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        trees = {'current': ROOT}
+        if args.baseline is not None:
+            trees[args.baseline] = export(args.baseline, os.path.join(tmp, 'baseline'))
+
+        print(f'{"functions":>9} {"lines":>8} ' + ' '.join(f'{name:>12}' for name in trees))
+        for functions in args.functions:
+            text = generate(functions, args.statements, functions)
+            source = os.path.join(tmp, f'generated{functions}.c')
+            with open(source, mode='w') as f:
+                f.write(text)
+
+            row = f'{functions:>9} {text.count(chr(10)):>8} '
+            results = [peakrss(tree, source) for tree in trees.values()]
+            row += ' '.join(f'{mib:9.1f}MiB' for mib in results)
+            if len(results) == 2:
+                row += f' {results[0] / results[1]:5.2f}x'
+            print(row)
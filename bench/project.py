@@ -0,0 +1,122 @@
+import gc
+import os
+import sys
+import time
+import types
+import random
+import subprocess
+from statistics import median
+from argparse import ArgumentParser
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import glob as g
+import astConstructor
+from pycparser._tables import make_parser
+
+EXPRS = [
+    '{a} + {b} * {c}',
+    '({a} - {b}) / ({c} + 1)',
+    '{a} << 2 | {b} >> 1 & {c} ^ 7',
+    '{a} < {b} && {b} <= {c} || {a} == {c}',
+    '!{a} + -{b}',
+    'v.x + p->y',
+    'arr[{a} % 8]',
+    '{a} ? {b} : {c}',
+    'helper({a}, {b})',
+    'sizeof({a})',
+]
+
+STMTS = [
+    '{a} = {expr};',
+    '{a} += {expr};',
+    '{a} ^= {b};',
+    '{a}++;',
+    '--{b};',
+    'if ({expr}) {{ {a} = {b}; }} else {{ {b} = {c}; }}',
+    'while ({a} < {b}) {{ {a}++; }}',
+    'for ({a} = 0; {a} < 10; {a}++) {{ {b} = {b} + {a}; }}',
+    'do {{ {c}--; }} while ({c} > 0);',
+    'switch ({a}) {{ case 1: {b} = 2; break; default: {b} = 3; }}',
+]
+
+def generate(functions, statements, seed):
+    """C source of the given number of functions made of random statements"""
+    rnd = random.Random(seed)
+    lines = [
+        'struct vec { int x; int y; };',
+        'struct vec v;',
+        'struct vec* p;',
+        'int arr[8];',
+        'int helper(int a, int b) { return a + b; }',
+    ]
+    for i in range(functions):
+        lines.append(f'int func{i}(int a, int b) {{')
+        lines.append('\tint c = a;')
+        for _ in range(statements):
+            names = dict(zip('abc', rnd.sample('abc', 3)))
+            expr = rnd.choice(EXPRS).format(**names)
+            lines.append('\t' + rnd.choice(STMTS).format(expr=expr, **names))
+        lines.append('\treturn c;')
+        lines.append('}')
+    lines.append('int main() { return func0(1, 2); }')
+    return '\n'.join(lines) + '\n'
+
+def baseline(rev):
+    """astConstructor as of the given git revision, loaded next to the current one"""
+    source = subprocess.run(['git', 'show', f'{rev}:astConstructor.py'], cwd=ROOT,
+                            capture_output=True, text=True, check=True).stdout
+    module = types.ModuleType(f'astConstructor@{rev}')
+    module.__file__ = os.path.join(ROOT, 'astConstructor.py')
+    exec(compile(source, f'astConstructor.py@{rev}', 'exec'), module.__dict__)
+    return module
+
+def count(ast):
+    return 1 + sum(count(child) for _, child in ast.children())
+
+def measure(func, runs):
+    # the cyclic collector runs are dominated by the trees that earlier runs
+    # left behind, not by the projection. keep it out, as timeit does
+    times = []
+    for _ in range(runs):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func()
+            times.append((time.perf_counter() - start) * 1000)
+        finally:
+            gc.enable()
+    return median(times)
+
+if __name__ == '__main__':
+    argparser = ArgumentParser(description='time astConstructor.projectAST on large generated sources')
+    argparser.add_argument('-f', '--functions', type=int, nargs='+', default=[50, 200, 800], help='sizes of the generated sources, in functions')
+    argparser.add_argument('-s', '--statements', type=int, default=20, help='statements per function')
+    argparser.add_argument('-n', '--runs', type=int, default=5, help='runs per measurement')
+    argparser.add_argument('-b', '--baseline', type=str, default=None, help='git revision to compare against (e.g. HEAD~1)')
+    args = argparser.parse_args()
+
+    modules = {'current': astConstructor}
+    if args.baseline is not None:
+        modules[args.baseline] = baseline(args.baseline)
+
+    parser = make_parser()
+    print(f'{"functions":>9} {"nodes":>8} ' + ' '.join(f'{name:>12} {"ns/node":>8}' for name in modules))
+    for functions in args.functions:
+        text = generate(functions, args.statements, functions)
+        g.init('<generated>', text)
+        ast = parser.parse(text, filename='<generated>')
+        nodes = count(ast)
+
+        row = f'{functions:>9} {nodes:>8} '
+        results = []
+        for name, module in modules.items():
+            g.init('<generated>', text)
+            ms = measure(lambda: module.projectAST(ast), args.runs)
+            results.append(ms)
+            row += f'{ms:10.2f}ms {ms * 1e6 / nodes:8.0f} '
+        if len(results) == 2:
+            row += f'{results[1] / results[0]:5.2f}x'
+        print(row)
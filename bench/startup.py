@@ -0,0 +1,95 @@
+import os
+import sys
+import time
+import subprocess
+from statistics import median
+from argparse import ArgumentParser
+
+# cold start budget of each entry point, in milliseconds of import time
+# (with cached bytecode, as shipped by the deploy workflow)
+BUDGET = {
+    'compile': 80,
+    'lambda_function': 100,
+}
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def environ(pyc):
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    if not pyc:
+        env['PYTHONDONTWRITEBYTECODE'] = '1'
+    return env
+
+def importtime(entry, env):
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {entry}'],
+                          cwd=ROOT, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr)
+
+    result = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        selft, cumulative, name = line[len('import time:'):].split('|')
+        result[name.strip()] = (int(selft) / 1000, int(cumulative) / 1000)
+    return result
+
+def firstcompile(entry, source, env):
+    code = f'''
+import time
+start = time.perf_counter()
+import {entry}
+if "{entry}" == "lambda_function":
+    {entry}.lambda_handler({{"body": open({source!r}).read()}}, None)
+else:
+    import io, glob as g
+    from pcpp import Preprocessor
+    cpp = Preprocessor()
+    cpp.add_path("lvmxlib")
+    cpp.parse(open({source!r}), {source!r})
+    out = io.StringIO()
+    cpp.write(out)
+    g.init({source!r}, out.getvalue())
+    {entry}.compile(g.source)
+print(time.perf_counter() - start)
+'''
+    proc = subprocess.run([sys.executable, '-c', code], cwd=ROOT, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr)
+    return float(proc.stdout.splitlines()[-1]) * 1000
+
+if __name__ == '__main__':
+    argparser = ArgumentParser(description='report import time breakdown of the compiler entry points')
+    argparser.add_argument('-n', '--runs', type=int, default=5, help='number of fresh interpreters per entry point')
+    argparser.add_argument('-t', '--top', type=int, default=15, help='number of modules shown in the breakdown')
+    argparser.add_argument('-s', '--source', type=str, default='test.c', help='source used for the first compile')
+    argparser.add_argument('--no-pyc', action='store_true', help='measure without cached bytecode (every module is compiled from source)')
+    args = argparser.parse_args()
+
+    env = environ(not args.no_pyc)
+    if not args.no_pyc: # populate __pycache__ like the deploy workflow does
+        subprocess.run([sys.executable, '-m', 'compileall', '-q', '.'], cwd=ROOT, env=env, check=True)
+
+    over = []
+    for entry, budget in BUDGET.items():
+        runs = [importtime(entry, env) for _ in range(args.runs)]
+        names = runs[0].keys()
+        stats = {name: (median(r[name][0] for r in runs if name in r),
+                        median(r[name][1] for r in runs if name in r)) for name in names}
+
+        total = stats[entry][1]
+        first = median(firstcompile(entry, args.source, env) for _ in range(args.runs))
+
+        print(f'== {entry}: import {total:.1f}ms (budget {budget}ms), import + first compile {first:.1f}ms')
+        print(f'{"self":>9} {"cumulative":>11}  module')
+        for name, (selft, cumulative) in sorted(stats.items(), key=lambda e: -e[1][1])[:args.top]:
+            print(f'{selft:8.1f}ms {cumulative:10.1f}ms  {name}')
+        print()
+
+        if total > budget:
+            over.append(entry)
+
+    if over:
+        print(f'over budget: {", ".join(over)}')
+        sys.exit(1)
@@ -1,16 +1,12 @@
 import io
 import os
 import sys
-import json
-import time
 import struct
 import glob as g
 import MODEL as m
-from node import OPT
-from pcpp import Preprocessor
-from argparse import ArgumentParser
-from mnemonic import mnemonic as opc
-from astConstructor import makeAST
+from node import OPT, Program
+from astConstructor import makeAST, streamAST
+from linker import ObjectFile, link
 
 def value2hex(val):
     if isinstance(val, int):
@@ -28,105 +24,180 @@ def value2hex(val):
 
     return f'{arg}'
 
-def compile(code):
+def generateFused(code, parser = None, pch = None):
+    """node.Program.gencode over the declarations streamAST projects, without
+    the tree of the whole unit. returns the Env, None on error.
 
-    body = {}
+    the reports of code generation are held back until every declaration
+    has been projected, so that they come out as they would from the tree:
+    after the ones of projection, and not at all if projection failed."""
 
-    start = time.time()
+    if pch is None:
+        env, scope = m.Env(), None
+    else:
+        env, code, scope = pch.apply(code, parser)
+
+    r = g.r
+    generated = m.ErrorModule()
+    for elem in streamAST(code, parser, scope):
+        if r.hasError():
+            continue # projected for its reports only
+        g.r = generated
+        try:
+            elem.gencode(env, OPT())
+        finally:
+            g.r = r
+    if g.r.hasError():
+        return
 
-    ast = makeAST(code)
+    for report in generated.reports:
+        g.r.addReport(report)
+    Program.finish(env, OPT())
+    if g.r.hasError():
+        return
+
+    return env
+
+def compileUnit(code, parser = None, pch = None, fused = False):
+    """compiles one preprocessed translation unit into a linker.ObjectFile.
+    returns None on error.
+
+    with fused set, the code of every top level declaration is generated as
+    soon as it is projected (see generateFused). the declarations cached by
+    an IncrementalParser are not used then."""
+
+    if fused:
+        env = generateFused(code, parser, pch)
+        if env is None:
+            return
+        return ObjectFile.fromEnv(g.filename, env)
+
+    if pch is None:
+        env = m.Env()
+        ast = makeAST(code, parser)
+    else: # header prefix loaded from a pch.PCHStore
+        env, ast = pch.prepare(code, parser)
     if g.r.hasError():
         return
 
-    env = m.Env()
     ast.gencode(env, OPT())
     if g.r.hasError():
         return
 
-    funcLocator = {}
-    labelLocator = {}
-
-    middlecode = []
-    bytecode = []
-
-# search for main
-    for elem in env.functions:
-        if (elem.symbolname == 'main'):
-            middlecode.extend(elem.insts)
-
-# add others
-    for elem in env.functions:
-        if (elem.symbolname != 'main') and (elem.symbolname in env.calledFunc):
-            if elem.insts is None:
-                g.r.addReport(m.Report('error', None, f"function '{elem.symbolname}' is not implemented"))
-                return
-            middlecode.extend(elem.insts)
-
-# locate func & labels
-    for elem in middlecode:
-        if (elem.opc == opc.ENTRY):
-            funcLocator[elem.arg] = len(bytecode)
-        elif (elem.opc == opc.LABEL):
-            labelLocator[elem.arg] = len(bytecode)
-        else:
-            bytecode.append(elem)
-
-# update funcall & jump & JIF0
-    for elem in bytecode:
-        if (elem.opc == opc.CALL):
-            elem.arg = funcLocator[elem.arg]
-        elif (elem.opc == opc.JUMP or elem.opc == opc.JIF0):
-            elem.arg = labelLocator[elem.arg]
-
-    data = []
-    for elem in env.statics:
-        if isinstance(elem, m.Symbol):
-            if isinstance(elem.initvalue, list):
-                for value in elem.initvalue:
-                    data.append(value)
-            else:
-                data.append(elem.initvalue)
-        elif isinstance(elem, str):
-            for c in elem:
-                data.append(int.from_bytes(c.encode('utf-32be'), byteorder='big'))
-            data.append(0)
-        else:
-            console.log("program error")
+    return ObjectFile.fromEnv(g.filename, env)
 
-    body['code'] = bytecode
-    body['data'] = data
+def compile(code, parser = None, pch = None, fused = False):
 
-    return body
+    obj = compileUnit(code, parser, pch, fused)
+    if obj is None:
+        return
 
+    return link([obj])
 
 if __name__ == '__main__':
+    # CLI only dependencies, kept out of the import path of lambda_function
+    from argparse import ArgumentParser
+    from collections import Counter
+    from cppcache import HeaderCache
+    from pch import PCHStore
+    from astConstructor import IncrementalParser
+    from pycparser._tables import make_parser
+
     argparser = ArgumentParser()
 
-    argparser.add_argument('filename',type=str,
-                           help='target source file')
+    argparser.add_argument('filenames', type=str, nargs='+', metavar='filename',
+                           help='target source files, or object files (.o) to link with them')
+
+    argparser.add_argument('-c', '--compile-only', action='store_true',
+                           help='write an object file (.o) for each source instead of linking')
 
     argparser.add_argument('-j', '--json',
                            action='store_true',
                            help='output as json')
 
+    argparser.add_argument('--lexer', type=str, default='fast',
+                           choices=['fast', 'ply'],
+                           help='tokenizer feeding the parser')
+
+    argparser.add_argument('--no-pch', action='store_true',
+                           help='compile lvmxlib headers from source instead of using precompiled headers')
+
+    argparser.add_argument('--no-incremental', action='store_true',
+                           help='parse every declaration again instead of reusing the ones unchanged since the last compile')
+
+    argparser.add_argument('--lazy', action='store_true',
+                           help='parse and compile function bodies from headers only if they are called')
+
+    argparser.add_argument('--fused', action='store_true',
+                           help='generate the code of every declaration right after it is parsed, without keeping the tree of the whole source')
+
+    argparser.add_argument('--stats', action='store_true',
+                           help='print how often each optimizer rule applied to stderr')
+
     args = argparser.parse_args()
+    if args.lazy and args.fused:
+        argparser.error('--lazy cannot be combined with --fused')
+
+    libpath = os.getcwd() + "/lvmxlib"
+    headers = HeaderCache(libpath, libpath + "/__pycache__/headers.pickle")
+    pch = None if args.no_pch else PCHStore(libpath, libpath + "/__pycache__")
+    cparser = make_parser(args.lexer)
+
+    objects = []
+    stats = Counter()
+    for i, filename in enumerate(args.filenames):
+        last = i == len(args.filenames) - 1
+
+        if filename.endswith('.o'):
+            g.init(filename, "")
+            objects.append(ObjectFile.load(filename))
+            continue
+
+        cpp = headers.preprocessor()
+        tmpf = io.StringIO("")
+
+        with open(filename, mode="r") as f:
+            cpp.parse(f)
+
+        cpp.write(tmpf)
+        headers.save()
+
+        g.init(filename, tmpf.getvalue())
+
+        try:
+            parser = cparser
+            incremental = not args.no_incremental and not args.fused
+            if incremental:
+                srcdir, srcname = os.path.split(os.path.abspath(filename))
+                parser = IncrementalParser(parser, f"{srcdir}/__pycache__/{srcname}.decls.pickle", lazy=args.lazy)
+            elif args.lazy:
+                parser = IncrementalParser(parser, lazy=True)
+            obj = compileUnit(g.source, parser, pch, args.fused)
+            if incremental:
+                parser.save()
+        except Exception as e:
+            g.r.report()
+            raise
 
-    cpp = Preprocessor()
-    cpp.add_path(os.getcwd() + "/lvmxlib")
-    tmpf = io.StringIO("")
+        if obj is None:
+            g.r.report()
+            exit(-1)
 
-    with open(args.filename, mode="r") as f:
-        cpp.parse(f)
+        if args.compile_only:
+            obj.dump(os.path.splitext(filename)[0] + ".o")
+        if (args.compile_only or not last) and g.r.hasNotice():
+            g.r.report() # warnings of this unit, the last one reports with the link
+        objects.append(obj)
+        stats.update(g.stats)
 
-    cpp.write(tmpf)
+    if args.stats:
+        for name, count in stats.most_common():
+            print(f'{count:8} {name}', file=sys.stderr)
 
-    g.init(args.filename, tmpf.getvalue())
+    if args.compile_only:
+        exit()
 
-    try:
-        dumps = compile(g.source)
-    except Exception as e:
-        g.r.report()
-        raise
+    dumps = link(objects)
 
     if dumps is None:
         g.r.report()
@@ -135,16 +206,18 @@ if __name__ == '__main__':
     delim = "\n"
 
     if args.json:
+        import json
+        dumps['code'] = list(dumps['code'])
         for elem in dumps['code']:
             elem.opc = elem.opc.name
-        bytecode = json.dumps(dumps, default=lambda x: x.__dict__)
+        bytecode = json.dumps(dumps, default=m.fields)
     else:
         bytecode = f".data {len(dumps['data'])}" + delim
         for elem in dumps['data']:
             bytecode += value2hex(elem) + delim
         bytecode += f".code {len(dumps['code'])}" + delim
-        for elem in dumps['code']:
-            bytecode += elem.serialize() + delim
+        for line in dumps['code'].serialize():
+            bytecode += line + delim
 
     if g.r.hasError():
         g.r.report()
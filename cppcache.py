@@ -0,0 +1,231 @@
+import io
+import os
+import pickle
+import hashlib
+import pcpp
+from pcpp import Preprocessor
+
+# macros whose value changes from run to run. they are left out of the cache
+# key, so a header expanding them would be replayed with a stale value
+# (none of lvmxlib does)
+VOLATILE = ('__FILE__', '__DATE__', '__TIME__', '__COUNTER__')
+
+FORMAT = 1
+
+def digest(text):
+    return hashlib.sha256(text.encode()).hexdigest()
+
+def macroText(macro):
+    """source text of a macro definition, as accepted by Preprocessor.define"""
+    body = ''.join(tok.value for tok in macro.value)
+    if macro.arglist is None:
+        return f"{macro.name} {body}"
+    args = list(macro.arglist)
+    if macro.variadic:
+        args[-1] = '...' if args[-1] == '__VA_ARGS__' else args[-1] + '...'
+    return f"{macro.name}({','.join(args)}) {body}"
+
+
+class CachedToken:
+    __slots__ = ('type', 'value', 'lineno', 'source')
+
+    def __init__(self, type, value, lineno, source):
+        self.type = type
+        self.value = value
+        self.lineno = lineno
+        self.source = source
+
+
+class HeaderEntry:
+    """result of preprocessing one header under one macro state:
+    the emitted tokens and the side effects on the preprocessor."""
+
+    def __init__(self, tokens, macros, once, deps):
+        self.tokens = tokens # [(type, value, lineno, source)]
+        self.macros = macros # name -> definition text, None if undefined
+        self.once = once     # abspath -> guard macro, new include_once entries
+        self.deps = deps     # [(abspath, digest)] of every file read
+        self.objects = {}    # name -> pcpp Macro, shared between preprocessors
+
+    def __getstate__(self):
+        return (self.tokens, self.macros, self.once, self.deps)
+
+    def __setstate__(self, state):
+        self.tokens, self.macros, self.once, self.deps = state
+        self.objects = {}
+
+
+class HeaderCache:
+    """preprocessed lvmxlib headers.
+
+    entries are keyed by the header path, its content hash and every macro
+    defined before the #include, so '#define USE_PRINT1' before
+    '#include <debugutil.h>' gets its own entry. headers wrapped in an
+    include guard are remembered by their guard macro and are not even
+    opened again while it is defined.
+    with a filename the cache is also kept on disk between processes."""
+
+    def __init__(self, libpath, filename = None):
+        self.libpath = libpath
+        self.filename = filename
+        self.texts = {}   # abspath -> (text, digest) of already read headers
+        self.entries = {} # key -> HeaderEntry
+        self.guards = {}  # abspath -> include guard macro
+        self.dirty = False
+        if filename is not None:
+            self.load()
+
+    def read(self, path):
+        if path not in self.texts:
+            with open(path, mode="r") as f:
+                text = f.read()
+            self.texts[path] = (text, digest(text))
+        return self.texts[path]
+
+    def current(self, deps):
+        for path, hashed in deps:
+            try:
+                if self.read(path)[1] != hashed:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def key(self, abspath, hashed, macros, once):
+        h = hashlib.sha256()
+        h.update(abspath.encode())
+        h.update(hashed.encode())
+        for name in sorted(macros):
+            if name not in VOLATILE:
+                h.update(macroText(macros[name]).encode())
+                h.update(b'\n')
+        for path in sorted(once):
+            h.update(path.encode())
+            h.update(b'\n')
+        return h.hexdigest()
+
+    def lookup(self, key):
+        entry = self.entries.get(key)
+        if entry is not None and not self.current(entry.deps):
+            del self.entries[key]
+            self.dirty = True
+            return None
+        return entry
+
+    def store(self, key, entry):
+        self.entries[key] = entry
+        for path, guard in entry.once.items():
+            if guard is not None:
+                self.guards[path] = guard
+        self.dirty = True
+
+    def preprocessor(self, lexer = None):
+        cpp = CachedPreprocessor(self, lexer)
+        cpp.add_path(self.libpath)
+        return cpp
+
+    def load(self):
+        try:
+            with open(self.filename, mode="rb") as f:
+                version, entries, guards = pickle.load(f)
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+            return
+        if version != (FORMAT, pcpp.__version__):
+            return
+        self.entries = entries
+        self.guards = guards
+
+    def save(self):
+        if self.filename is None or not self.dirty:
+            return
+        # drop what was built from headers that changed since
+        entries = {key: entry for key, entry in self.entries.items() if self.current(entry.deps)}
+        try:
+            os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+            with open(self.filename, mode="wb") as f:
+                pickle.dump(((FORMAT, pcpp.__version__), entries, self.guards), f)
+        except OSError:
+            return # read-only deployment, keep the in memory cache only
+        self.dirty = False
+
+
+class CachedPreprocessor (Preprocessor):
+    """Preprocessor that replays the cached output of lvmxlib headers instead
+    of preprocessing them again."""
+
+    def __init__(self, cache, lexer = None):
+        super().__init__(lexer)
+        self.cache = cache
+        self.deps = [] # stack of dependency lists of the files being parsed
+
+    def on_file_open(self, is_system_include, includepath):
+        if not includepath.startswith(self.cache.libpath):
+            return super().on_file_open(is_system_include, includepath)
+        guard = self.cache.guards.get(includepath)
+        if guard is not None and guard in self.macros:
+            # would be skipped entirely by its include guard
+            self.include_once[includepath] = guard
+            return io.StringIO("")
+        return io.StringIO(self.cache.read(includepath)[0])
+
+    def parsegen(self, input, source = None, abssource = None):
+        if abssource is None or not abssource.startswith(self.cache.libpath) or input == "":
+            yield from self.record(input, source, abssource)
+            return
+
+        hashed = digest(input)
+        key = self.cache.key(abssource, hashed, self.macros, self.include_once)
+        entry = self.cache.lookup(key)
+        if entry is None:
+            yield from self.record(input, source, abssource, key)
+            return
+
+        if self.deps:
+            self.deps[-1].extend(entry.deps)
+        for name, text in entry.macros.items():
+            if text is None:
+                self.macros.pop(name, None)
+            elif name in entry.objects:
+                self.macros[name] = entry.objects[name]
+            else:
+                self.define(text)
+                entry.objects[name] = self.macros[name]
+        self.include_once.update(entry.once)
+        for tok in entry.tokens:
+            yield CachedToken(*tok)
+
+    def record(self, input, source, abssource, key = None):
+        """preprocesses input, storing the result in the cache if key is given"""
+        macros = dict(self.macros)
+        once = dict(self.include_once)
+        errors = self.return_code
+        deps = [] if abssource is None else [(abssource, digest(input))]
+        self.deps.append(deps)
+
+        tokens = []
+        try:
+            for tok in super().parsegen(input, source, abssource):
+                if key is not None:
+                    tokens.append((tok.type, tok.value, tok.lineno, tok.source))
+                yield tok
+        finally:
+            self.deps.pop()
+        if self.deps:
+            self.deps[-1].extend(deps)
+
+        if key is None or self.return_code != errors:
+            return
+
+        changed = {}
+        for name, macro in self.macros.items():
+            if name not in VOLATILE and macros.get(name) is not macro:
+                changed[name] = macro
+        removed = [name for name in macros if name not in self.macros and name not in VOLATILE]
+
+        entry = HeaderEntry(
+            tokens,
+            {**{name: macroText(macro) for name, macro in changed.items()}, **{name: None for name in removed}},
+            {path: guard for path, guard in self.include_once.items() if path not in once},
+            deps)
+        entry.objects = changed
+        self.cache.store(key, entry)
@@ -1,10 +1,15 @@
-from MODEL import ErrorModule
+from collections import Counter
+from MODEL import ErrorModule, Positions
 
 def init(f, s):
     global r
     global source
     global filename
+    global positions
+    global stats
     r = ErrorModule()
+    positions = Positions()
+    stats = Counter() # optimizer rule name -> times it applied
     filename = f
     source = s
 
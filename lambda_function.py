@@ -1,37 +1,52 @@
 import io
 import os
-import sys
-import json
-import time
-import struct
 import glob as g
-import MODEL as m
-from node import OPT
-from pcpp import Preprocessor
-from argparse import ArgumentParser
-from mnemonic import mnemonic as opc
-from astConstructor import makeAST
+from pcpp.preprocessor import default_lexer
 from compile import value2hex, compile 
+from cppcache import HeaderCache
+from pch import PCHStore
+from astConstructor import IncrementalParser
+from pycparser._tables import make_parser
 
-def lambda_handler(event, context):
+class WarmState:
+    """state kept by the container between warm invocations.
+    only request independent things live here: per request state (glob.r,
+    glob.source, macros) is still created fresh in every lambda_handler call."""
 
+    def __init__(self):
+        # declarations shared between requests (e.g. an unchanged helper
+        # function the user submits again) are parsed only once
+        self.parser = IncrementalParser(make_parser())
+        self.cpplexer = default_lexer()
+        # preprocessed lvmxlib headers, in memory only (the deployment is read-only)
+        self.headers = HeaderCache(os.getcwd() + "/lvmxlib")
+        self.pch = PCHStore(os.getcwd() + "/lvmxlib")
 
-    cpp = Preprocessor()
-    cpp.add_path(os.getcwd() + "/lvmxlib")
-    tmpf = io.StringIO("")
+    def preprocessor(self):
+        return self.headers.preprocessor(self.cpplexer)
 
-    with open("/tmp/main.c", mode='w') as f:
-        f.write(event['body'])
+# name the request body is compiled and reported under
+SOURCENAME = "/tmp/main.c"
 
-    with open("/tmp/main.c", mode="r") as f:
-        cpp.parse(f)
+warm = None
+
+def lambda_handler(event, context):
+
+    global warm
+    if warm is None:
+        warm = WarmState()
+
+    cpp = warm.preprocessor()
+    tmpf = io.StringIO("")
 
+    cpp.parse(event['body'], SOURCENAME)
     cpp.write(tmpf)
 
-    g.init("/tmp/main.c", tmpf.getvalue())
+    g.init(SOURCENAME, tmpf.getvalue())
+    g.r.addSource(SOURCENAME, event['body'])
 
     try:
-        dumps = compile(g.source)
+        dumps = compile(g.source, warm.parser, warm.pch)
     except Exception as e:
         return {
             'statusCode': 400,
@@ -48,8 +63,8 @@ def lambda_handler(event, context):
     for elem in dumps['data']:
         bytecode += value2hex(elem) + '\n'
     bytecode += f".code {len(dumps['code'])}" + '\n'
-    for elem in dumps['code']:
-        bytecode += elem.serialize() + '\n'
+    for line in dumps['code'].serialize():
+        bytecode += line + '\n'
 
     if g.r.hasError():
         return {
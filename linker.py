@@ -0,0 +1,268 @@
+import pickle
+from bisect import bisect_right
+import glob as g
+import MODEL as m
+from mnemonic import mnemonic as opc
+
+# bump when the layout of ObjectFile changes
+FORMAT = 3
+
+# statics every translation unit ends with. they are shared by the whole
+# program and have to stay at the very end of the data segment
+TRAILER = ('__MAGIC_RETADDR__', '__MAGIC_RETFP__')
+
+
+class Fragment:
+    """one static of a translation unit: a global variable, or a string
+    literal if name is None"""
+
+    def __init__(self, name, address, values):
+        self.name = name       # symbol name, None for string literals
+        self.address = address # address within the data of its object file
+        self.values = values   # initial contents, one value per word
+
+
+class ObjectFile:
+    """relocatable result of compiling one translation unit.
+
+    functions keep their code, an m.InstArray, with ENTRY/LABEL pseudo
+    operations and symbolic CALL targets. every Inst argument that depends on where things
+    end up in the linked program is listed in the relocations of its function:
+        'call'  CALL by function name
+        'label' JUMP/JIF0/LABEL of this object's label numbering
+        'data'  m.Address into this object's data fragments"""
+
+    def __init__(self, filename, functions, data, imports, called, labels):
+        self.filename = filename
+        self.functions = functions # [(name, insts, relocations)] of the defined functions
+        self.data = data           # [Fragment] in address order
+        self.imports = imports     # functions declared but not defined here
+        self.called = called       # every function called from this object
+        self.labels = labels       # number of labels issued
+
+    @property
+    def exports(self):
+        """symbols this object defines: function names and named statics"""
+        return [name for name, _, _ in self.functions] + [f.name for f in self.data if f.name is not None]
+
+    @staticmethod
+    def fromEnv(filename, env):
+        functions = []
+        imports = []
+        for elem in env.functions:
+            if elem.insts is None:
+                imports.append(elem.symbolname)
+            else:
+                functions.append((elem.symbolname, elem.insts, relocations(elem.insts)))
+
+        data = []
+        for elem in env.statics:
+            if isinstance(elem, m.Symbol):
+                values = elem.initvalue if isinstance(elem.initvalue, list) else [elem.initvalue]
+                data.append(Fragment(elem.name, elem.id, values))
+            elif isinstance(elem, str):
+                values = [int.from_bytes(c.encode('utf-32be'), byteorder='big') for c in elem]
+                values.append(0)
+                data.append(Fragment(None, env.strings[elem], values))
+
+        return ObjectFile(filename, functions, data, imports, list(env.calledFunc), env.labelitr)
+
+    def dump(self, filename):
+        with open(filename, mode="wb") as f:
+            pickle.dump((FORMAT, self), f)
+
+    @staticmethod
+    def load(filename):
+        with open(filename, mode="rb") as f:
+            version, obj = pickle.load(f)
+        if version != FORMAT:
+            raise ValueError(f"{filename}: object file format {version}, expected {FORMAT}")
+        return obj
+
+
+def relocations(insts):
+    relocs = []
+    for i, (op, kind) in enumerate(zip(insts.opcodes, insts.kinds)):
+        if op == opc.CALL:
+            relocs.append((i, 'call'))
+        elif op == opc.JUMP or op == opc.JIF0 or op == opc.LABEL:
+            relocs.append((i, 'label'))
+        elif kind == m.InstArray.ADDRESS:
+            relocs.append((i, 'data'))
+    return relocs
+
+
+class DataLayout:
+    """data segment of the linked program.
+
+    statics with the same name in several objects are one variable, as a C
+    tentative definition would be: they have to agree in size and in their
+    initializer, unless all but one of them are zero initialized.
+    equal string literals are stored once."""
+
+    def __init__(self):
+        self.values = []
+        self.symbols = {} # name -> (address, size)
+        self.strings = {} # contents -> address
+        self.placed = []  # [(object, [(local address, linked address)])]
+
+    def place(self, obj):
+        table = []
+        for frag in obj.data:
+            if frag.name in TRAILER:
+                continue
+            if frag.name is not None and frag.name in self.symbols:
+                address, size = self.symbols[frag.name]
+                if size != len(frag.values):
+                    g.r.addReport(m.Report('error', None, f"conflicting sizes for '{frag.name}' in {obj.filename}"))
+                elif any(frag.values):
+                    current = self.values[address:address + size]
+                    if any(current) and current != frag.values:
+                        g.r.addReport(m.Report('error', None, f"multiple definition of '{frag.name}' in {obj.filename}"))
+                    self.values[address:address + size] = frag.values
+            elif frag.name is None and tuple(frag.values) in self.strings:
+                address = self.strings[tuple(frag.values)]
+            else:
+                address = len(self.values)
+                self.values.extend(frag.values)
+                if frag.name is not None:
+                    self.symbols[frag.name] = (address, len(frag.values))
+                else:
+                    self.strings[tuple(frag.values)] = address
+            table.append((frag.address, address))
+        self.placed.append((obj, table))
+
+    def finish(self):
+        """appends the trailer, returns the relocation table of every placed object"""
+        for name in TRAILER:
+            self.symbols[name] = (len(self.values), 1)
+            self.values.append(0)
+
+        tables = []
+        for obj, table in self.placed:
+            table.extend((frag.address, self.symbols[frag.name][0]) for frag in obj.data if frag.name in TRAILER)
+            table.sort()
+            tables.append(table)
+        return tables
+
+
+def relocate(table, address):
+    i = bisect_right(table, (address, float('inf'))) - 1
+    if i < 0:
+        return address
+    local, linked = table[i]
+    return m.Address(linked + address - local)
+
+
+def signature(insts, relocs, table):
+    """code of a function with its labels numbered by first use and its data
+    references made position independent, to tell whether two objects define
+    a function the same way (as every includer of a header does)"""
+    kinds = dict(relocs)
+    labels = {}
+    sig = []
+    for i, op in enumerate(insts.opcodes):
+        kind = kinds.get(i)
+        if kind == 'label':
+            sig.append((op, 'label', labels.setdefault(insts.arg(i), len(labels))))
+        elif kind == 'data':
+            sig.append((op, 'data', int(relocate(table, insts.args[i]))))
+        else:
+            sig.append((op, insts.arg(i)))
+    return tuple(sig)
+
+
+def link(objects):
+    """combines object files into a program of the form compile() returns:
+    {'code': m.InstArray, 'data': [value]}. main comes first, followed by every
+    function that is called anywhere. returns None on error."""
+
+    layout = DataLayout()
+    for obj in objects:
+        layout.place(obj)
+    tables = zip(objects, layout.finish())
+
+    # function name -> (object, insts, relocs, data table, label base)
+    definitions = {}
+    order = []
+    called = []
+    base = 0
+    for obj, table in tables:
+        for name, insts, relocs in obj.functions:
+            if name in definitions:
+                other = definitions[name]
+                if signature(insts, relocs, table) != signature(other[1], other[2], other[3]):
+                    g.r.addReport(m.Report('error', None, f"multiple definition of function '{name}' in {obj.filename}"))
+                continue
+            definitions[name] = (obj, insts, relocs, table, base)
+            order.append(name)
+        for name in obj.called:
+            if name not in called:
+                called.append(name)
+        base += obj.labels
+
+    if g.r.hasError():
+        return
+
+    for obj in objects:
+        for name in obj.imports:
+            if name != 'main' and name in called and name not in definitions:
+                g.r.addReport(m.Report('error', None, f"function '{name}' is not implemented"))
+                return
+
+    selected = [name for name in order if name == 'main']
+    selected.extend(name for name in order if name != 'main' and name in called)
+
+# relocate: the code of every function is copied as a whole, then only the
+# arguments its relocations list are rewritten. the relocations also tell
+# where the pseudo operations and the CALL/JUMP/JIF0 to resolve are
+    code = m.InstArray()
+    pseudo = []  # indices of ENTRY and LABEL, ascending
+    targets = [] # indices of CALL, JUMP and JIF0
+    for name in selected:
+        obj, insts, relocs, table, labelbase = definitions[name]
+        start = len(code)
+        code.extend(insts)
+        pseudo.append(start) # ENTRY
+        defined = set()
+        used = {}
+        for i, kind in relocs:
+            i += start
+            if kind == 'label':
+                if code.kinds[i] == m.InstArray.INT: # goto labels are named after their function
+                    code.args[i] += labelbase
+                if code.opcodes[i] == opc.LABEL:
+                    pseudo.append(i)
+                    defined.add(code.arg(i))
+                else:
+                    targets.append(i)
+                    used.setdefault(code.arg(i), None)
+            elif kind == 'data':
+                code.args[i] = relocate(table, code.args[i])
+            else:
+                targets.append(i)
+        for label in used:
+            if label not in defined:
+                if isinstance(label, str):
+                    label = label[len(name):]
+                g.r.addReport(m.Report('error', None, f"label '{label}' used but not defined in function '{name}'"))
+
+    if g.r.hasError():
+        return
+
+# locate func & labels, drop their pseudo operations
+    funcLocator = {}
+    labelLocator = {}
+    for n, i in enumerate(pseudo):
+        if (code.opcodes[i] == opc.ENTRY):
+            funcLocator[code.arg(i)] = i - n
+        else:
+            labelLocator[code.arg(i)] = i - n
+    program = code.drop(pseudo)
+
+# update funcall & jump & JIF0
+    for i in targets:
+        locator = funcLocator if code.opcodes[i] == opc.CALL else labelLocator
+        program.setArg(i - bisect_right(pseudo, i), locator[code.arg(i)])
+
+    return {'code': program, 'data': layout.values}
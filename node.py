@@ -1,11 +1,15 @@
+import math
 from copy import copy
 import glob as g
 import MODEL as m
+import optimizer
 from mnemonic import mnemonic as opc
 
 # -= :: TOP MODELS :: =-
 
 class OPT:
+    __slots__ = ('popc', 'lr', 'bp', 'cp')
+
     def __init__(self, popc = 0, lr = 'r', bp = None, cp = None):
         self.popc = popc
         self.lr = lr
@@ -15,11 +19,81 @@ class OPT:
 def newopt(opt, popc = 0, lr = 'r', bp = None, cp = None):
     newpopc = popc
     newlr = lr
-    newbp = bp or opt.bp
-    newcp = cp or opt.cp
+    newbp = bp if bp is not None else opt.bp # label 0 is a valid target
+    newcp = cp if cp is not None else opt.cp
     return OPT(newpopc, newlr, newbp, newcp)
 
+# -= :: CONSTANT FOLDING :: =-
+
+def constant(insts):
+    """the value insts pushes if its code is a single PUSH of an int or float
+    constant (not of an m.Address), None otherwise"""
+    code = insts.bytecodes
+    if len(code) != 1 or code[0].__class__ is not m.Inst or code[0].opc != opc.PUSH:
+        return None
+    arg = code[0].arg
+    typ = insts.typ
+    if typ.refcount != 0 or typ.length != 1:
+        return None
+    if arg.__class__ is int and typ.basetype in ('int', 'enum'):
+        return arg
+    if arg.__class__ is float and typ.basetype == 'float':
+        return arg
+    return None
+
+def pushConstant(value):
+    """Insts of a folded value"""
+    return m.Insts(m.Type('float' if value.__class__ is float else 'int'), [m.Inst(opc.PUSH, value)])
+
+def resolveEnum(env, typ):
+    """the enum type typ with the value of each member evaluated in env. a
+    member without a value follows the one before it, and a value may use
+    the members before it. a value that is not an int constant is reported
+    and taken as 0"""
+
+    resolved = copy(typ)
+    resolved.members = []
+    value = 0
+    for name, expr in typ.members:
+        if expr is not None:
+            value = expr.eval(env)
+            if value.__class__ is not int:
+                g.r.addReport(m.Report('fatal', expr.tok, f"enum must be \'int\'"))
+                value = 0
+        env.addEnumMember(name, value)
+        resolved.members.append((name, value))
+        value += 1
+
+    return resolved
+
+def accessLvalue(env, opt, target):
+    """code to read the lvalue target and to write it back, for operations that
+    do both (compound assignment, ++, --). returns the Insts pushing its value
+    and the bytecodes storing the value on top of the stack into it.
+
+    the address of an Indirect target is computed only once: unless it is a
+    single push or load, it is kept in the scratch local of the frame between
+    the read and the write."""
+
+    if isinstance(target, Indirect):
+        addr = target.body.gencode(env, newopt(opt, 1))
+        codes = m.flatten(addr.bytecodes)
+        if len(codes) == 1:
+            store = [m.Inst(codes[0].opc, codes[0].arg), m.Inst(opc.STOREP, AST.nullarg)]
+        else:
+            scratch = env.issueScratch()
+            codes.append(m.Inst(opc.DUP, AST.nullarg))
+            codes.append(m.Inst(opc.STOREL, scratch))
+            store = [m.Inst(opc.LOADL, scratch), m.Inst(opc.STOREP, AST.nullarg)]
+        codes.append(m.Inst(opc.LOADP, AST.nullarg))
+        return m.Insts(copy(addr.typ).addRefcount(-1), codes), store
+
+    value = target.gencode(env, newopt(opt, 1, 'r'))
+    store = target.gencode(env, newopt(opt, 1, 'l')).bytecodes
+    return value, store
+
 class AST (object):
+    __slots__ = ('tok',)
 
     nullarg = 0
 
@@ -39,16 +113,31 @@ class AST (object):
             g.r.addReport(m.Report('warning', self.tok, 'expression result unused'))
             return m.Insts()
 
-    def eval(self):
+    def eval(self, env = None):
+        """value of the expression if it is a compile time constant, None
+        otherwise. enum members and sizeof need env to be resolved"""
         return None
 
-# -= :: Inherited MODEL :: =-
+    def gencodeBranch(self, env, opt, label, when):
+        """bytecodes that evaluate the expression as a condition and jump to
+        label if its truth is when, falling through otherwise"""
+        value = self.gencode(env, newopt(opt, 1))
+        if (result := constant(value)).__class__ is int:
+            return [m.Inst(opc.JUMP, label)] if bool(result) == when else []
+        codes = value.bytecodes
+        if when:
+            codes.append(m.Inst(opc.INV, self.nullarg))
+        codes.append(m.Inst(opc.JIF0, label))
+        return codes
 
-class BIOP (AST):
+# -= :: Inherited MODEL :: =-
 
+class Binary (AST):
+    """binary operation. subclasses implement combine(), which makes the
+    code of the operation out of the code of its operands"""
+    __slots__ = ('left', 'right')
     opI = None
     opF = None
-    isCompOP = False
 
     def __init__(self, tok, left, right):
         self.tok = tok
@@ -62,11 +151,64 @@ class BIOP (AST):
         if (result := self.assertOnlyPop1(env, opt)) is not None:
             return result
 
-        left = self.left.gencode(env, newopt(opt, 1))
-        right = self.right.gencode(env, newopt(opt, 1))
+        # a + b + c + ... nests to the left. walk down to the leftmost
+        # operand, then combine upwards: the operands are generated in the
+        # same order as by recursion, without a python frame per level
+        chain = [self]
+        left = self.left
+        while isinstance(left, Binary):
+            chain.append(left)
+            left = left.left
+
+        result = left.gencode(env, newopt(opt, 1))
+        for elem in reversed(chain):
+            right = elem.right.gencode(env, newopt(opt, 1))
+            value = elem.fold(constant(result), constant(right))
+            if value is not None:
+                result = pushConstant(value)
+            else:
+                result = elem.combine(env, result, right)
+        return result
+
+    def eval(self, env = None):
+        chain = [self]
+        left = self.left
+        while isinstance(left, Binary):
+            chain.append(left)
+            left = left.left
+
+        value = left.eval(env)
+        for elem in reversed(chain):
+            if value is None:
+                return None
+            value = elem.fold(value, elem.right.eval(env))
+        return value
+
+    def fold(self, left, right):
+        """the operation on the constants left and right, None if either is
+        not a constant or the result is not known at compile time"""
+        if left.__class__ is int and right.__class__ is int:
+            fold = optimizer.FOLDI.get(self.opI)
+            return fold(optimizer.wrap(left), optimizer.wrap(right)) if fold is not None else None
+        if left.__class__ is float and right.__class__ is float:
+            fold = optimizer.FOLDF.get(self.opF)
+            left, right = optimizer.single(left), optimizer.single(right)
+            if fold is None or left is None or right is None:
+                return None
+            return fold(left, right)
+        return None
+
+    def combine(self, env, left, right):
+        pass
+
+class BIOP (Binary):
+    __slots__ = ()
+    isCompOP = False
+
+    def combine(self, env, left, right):
 
         code = right.bytecodes
-        code.extend(left.bytecodes)
+        code.append(left.bytecodes)
 
         if self.isCompOP: # 比較演算子ならポインタ同士の演算が可能
             if left.typ.isPointer() or right.typ.isPointer():
@@ -101,6 +243,8 @@ class BIOP (AST):
 # -- Lv0 modules --
 
 class Program (AST):
+    __slots__ = ('body',)
+
     def __init__(self, tok, body):
         self.tok = tok
         self.body = body
@@ -109,11 +253,29 @@ class Program (AST):
     def gencode(self, env, opt):
         for elem in self.body:
             dumps = elem.gencode(env, newopt(opt, 0))
+        return Program.finish(env, opt)
+
+    @staticmethod
+    def finish(env, opt):
+        """what follows the code of the last top level declaration"""
+        # lazily parsed header functions that turned out to be called,
+        # including the ones only they call. their bodies are generated
+        # after all of the unit, so unlike the eager ones they also see the
+        # globals it declares after the header
+        while True:
+            called = [name for name in env.calledFunc if name in env.lazyFunctions]
+            if not called:
+                break
+            for name in called:
+                env.lazyFunctions.pop(name).define(env, newopt(opt, 0))
+
         env.addStatic(m.Symbol("__MAGIC_RETADDR__", m.Type(), 0))
         env.addStatic(m.Symbol("__MAGIC_RETFP__", m.Type(), 0))
         return env
 
 class GlobalVar (AST):
+    __slots__ = ('typ', 'symbolname', 'init')
+
     def __init__(self, tok, symbolname, typ, init = None):
         self.tok = tok
         self.typ = typ
@@ -127,16 +289,25 @@ class GlobalVar (AST):
         init = [0] * size
 
         if isinstance(self.init, AST):
-            init[0] = self.init.eval()
+            init[0] = self.evalInit(env, self.init)
 
         elif isinstance(self.init, list):
             for i, elem in enumerate(self.init):
-                init[i] = self.init[i].eval()
+                init[i] = self.evalInit(env, elem)
 
         env.addStatic(m.Symbol(self.symbolname, self.typ, init))
         return env
 
+    def evalInit(self, env, init):
+        value = init.eval(env)
+        if value is None:
+            g.r.addReport(m.Report('error', init.tok, f"initializer element of '{self.symbolname}' is not a compile-time constant"))
+            return 0
+        return value
+
 class Struct (AST):
+    __slots__ = ('symbolname', 'typ')
+
     def __init__(self, tok, symbolname, typ):
         self.tok = tok
         self.symbolname = symbolname
@@ -149,6 +320,8 @@ class Struct (AST):
         return m.Insts(m.Type(), [])
 
 class Enum (AST):
+    __slots__ = ('symbolname', 'typ')
+
     def __init__(self, tok, symbolname, typ):
         self.tok = tok
         self.symbolname = symbolname
@@ -156,11 +329,13 @@ class Enum (AST):
 
     def gencode(self, env, opt):
 
-        env.addEnum(self.symbolname, self.typ)
+        env.addEnum(self.symbolname, resolveEnum(env, self.typ))
 
         return m.Insts(m.Type(), [])
 
 class Func (AST):
+    __slots__ = ('symbolname', 'typ', 'args', 'body')
+
     def __init__(self, tok, symbolname, typ, args, body):
         self.tok = tok
         self.symbolname = symbolname
@@ -184,13 +359,14 @@ class Func (AST):
 
             codes = self.body.gencode(env, newopt(opt, 0)).bytecodes
 
-            insts = []
-            insts.append(m.Inst(opc.ENTRY, self.symbolname))
-            insts.append(m.Inst(opc.FRAME, env.getFrameSize()))
-            insts.extend(codes)
-            if (insts[-1].opc is not opc.RET):
-                insts.append(m.Inst(opc.PUSH, 0))
-                insts.append(m.Inst(opc.RET, self.nullarg))
+            insts = m.InstArray()
+            insts.append(opc.ENTRY, self.symbolname)
+            insts.append(opc.FRAME, env.getFrameSize())
+            insts.extend(m.flatten(codes))
+            if (insts.opcodes[-1] != opc.RET):
+                insts.append(opc.PUSH, 0)
+                insts.append(opc.RET, self.nullarg)
+            insts = optimizer.optimize(insts)
 
             try:
                 env.addFunction(m.Function(self.symbolname, self.typ, self.args, insts))
@@ -207,6 +383,8 @@ class Func (AST):
 
 
 class Typedef (AST):
+    __slots__ = ('name', 'typ')
+
     def __init__(self, tok, name, typ):
         self.tok = tok
         self.name = name
@@ -217,10 +395,12 @@ class Typedef (AST):
         if self.typ.isStruct():
             env.addStruct(self.name, self.typ)
 
-        if self.typ.isEnum():
-            env.addEnum(self.name, self.typ)
+        typ = self.typ
+        if typ.isEnum():
+            typ = resolveEnum(env, typ)
+            env.addEnum(self.name, typ)
 
-        env.addType(self.name, self.typ)
+        env.addType(self.name, typ)
 
         return env
 
@@ -228,6 +408,8 @@ class Typedef (AST):
 # -- Lv1 modules --
 
 class Block (AST):
+    __slots__ = ('body',)
+
     def __init__(self, tok, body):
         self.tok = tok
         self.body = body
@@ -237,12 +419,14 @@ class Block (AST):
 
         insts = []
         for elem in self.body:
-            insts.extend(elem.gencode(env, newopt(opt, 0)).bytecodes)
+            insts.append(elem.gencode(env, newopt(opt, 0)).bytecodes)
 
         env.popScope()
         return m.Insts(m.Type(), insts)
 
 class LocalVar (AST):
+    __slots__ = ('symbolname', 'typ', 'init')
+
     def __init__(self, tok, symbolname, typ, init = None):
         self.tok = tok
         self.symbolname = symbolname
@@ -259,7 +443,7 @@ class LocalVar (AST):
         elif isinstance(self.init, list):
             codes = []
             for i, elem in enumerate(self.init):
-                codes.extend(elem.gencode(env, newopt(opt, 1)).bytecodes)
+                codes.append(elem.gencode(env, newopt(opt, 1)).bytecodes)
                 codes.append(var.genAddrCode())
                 codes.append(m.Inst(opc.PUSH, i))
                 codes.append(m.Inst(opc.ADDI, self.nullarg))
@@ -272,6 +456,8 @@ class LocalVar (AST):
         return m.Insts(m.Type(), codes)
 
 class Indirect (AST):
+    __slots__ = ('body',)
+
     def __init__(self, tok, body):
         self.tok = tok
         self.body = body
@@ -290,6 +476,8 @@ class Indirect (AST):
             return m.Insts(copy(body.typ).addRefcount(-1), codes)
 
 class Address (AST):
+    __slots__ = ('body',)
+
     def __init__(self, tok, body):
         self.tok = tok
         self.body = body
@@ -316,6 +504,8 @@ class Address (AST):
 
 
 class FieldAccess (AST):
+    __slots__ = ('left', 'fieldname')
+
     def __init__(self, tok, left, fieldname):
         self.tok = tok
         self.left = left
@@ -335,6 +525,8 @@ class FieldAccess (AST):
 
 
 class Return (AST): #TODO 自分の型とのチェック
+    __slots__ = ('body',)
+
     def __init__(self, tok, body):
         self.tok = tok
         self.body = body
@@ -345,6 +537,8 @@ class Return (AST): #TODO 自分の型とのチェック
         return m.Insts(m.Type(), codes)
 
 class Funccall (AST):
+    __slots__ = ('name', 'args')
+
     def __init__(self, tok, name, args):
         self.tok = tok
         self.name = name
@@ -375,7 +569,7 @@ class Funccall (AST):
         argtypes = []
         for elem in reversed(self.args):
             arg = elem.gencode(env, newopt(opt, 1))
-            codes.extend(arg.bytecodes)
+            codes.append(arg.bytecodes)
             argtypes.append(arg.typ)
 
         argtypes = list(reversed(argtypes))
@@ -396,23 +590,23 @@ class Funccall (AST):
         return m.Insts(mytype, codes)
 
 class If (AST):
+    __slots__ = ('cond', 'then')
+
     def __init__(self, tok, cond, then):
         self.tok = tok
         self.cond = cond
         self.then = then
 
     def gencode(self, env, opt):
-        cond = self.cond.gencode(env, newopt(opt, 1)).bytecodes
-        then = self.then.gencode(env, newopt(opt, 0)).bytecodes
-
         l0 = env.issueLabel()
-        codes = cond
-        codes.append(m.Inst(opc.JIF0, l0))
-        codes.extend(then)
+        codes = self.cond.gencodeBranch(env, opt, l0, False)
+        codes.append(self.then.gencode(env, newopt(opt, 0)).bytecodes)
         codes.append(m.Inst(opc.LABEL, l0))
         return m.Insts(m.Type(), codes)
 
 class Ifelse (AST):
+    __slots__ = ('cond', 'then', 'elst')
+
     def __init__(self, tok, cond, then, elst):
         self.tok = tok
         self.cond = cond
@@ -420,23 +614,28 @@ class Ifelse (AST):
         self.elst = elst
 
     def gencode(self, env, opt):
-        cond = self.cond.gencode(env, newopt(opt, 1)).bytecodes
-        then = self.then.gencode(env, newopt(opt, 0)).bytecodes
-        elst = self.elst.gencode(env, newopt(opt, 0)).bytecodes
-
-        l0 = env.issueLabel()
-        l1 = env.issueLabel()
-
-        codes = cond
-        codes.append(m.Inst(opc.JIF0, l0))
-        codes.extend(then)
-        codes.append(m.Inst(opc.JUMP, l1))
-        codes.append(m.Inst(opc.LABEL, l0))
-        codes.extend(elst)
-        codes.append(m.Inst(opc.LABEL, l1))
+        # else if chains nest in elst: generate them in a loop, closing
+        # every branch at the end
+        codes = []
+        ends = []
+        elem = self
+        while isinstance(elem, Ifelse):
+            l0 = env.issueLabel()
+            l1 = env.issueLabel()
+            codes.append(elem.cond.gencodeBranch(env, opt, l0, False))
+            codes.append(elem.then.gencode(env, newopt(opt, 0)).bytecodes)
+            codes.append(m.Inst(opc.JUMP, l1))
+            codes.append(m.Inst(opc.LABEL, l0))
+            ends.append(l1)
+            elem = elem.elst
+        codes.append(elem.gencode(env, newopt(opt, 0)).bytecodes)
+        for l1 in reversed(ends):
+            codes.append(m.Inst(opc.LABEL, l1))
         return m.Insts(m.Type(), codes)
 
 class DoWhile (AST):
+    __slots__ = ('body', 'cond')
+
     def __init__(self, tok, body, cond):
         self.tok = tok
         self.body = body
@@ -447,18 +646,17 @@ class DoWhile (AST):
         l0 = env.issueLabel()
 
         body = self.body.gencode(env, newopt(opt, cp=l0, bp=None)).bytecodes
-        cond = self.cond.gencode(env, newopt(opt, 1)).bytecodes
 
         codes = [m.Inst(opc.LABEL, l0)]
-        codes.extend(body)
-        codes.extend(cond)
-        codes.append(m.Inst(opc.INV, self.nullarg))
-        codes.append(m.Inst(opc.JIF0, l0))
+        codes.append(body)
+        codes.append(self.cond.gencodeBranch(env, opt, l0, True))
 
         return m.Insts(m.Type(), codes)
 
 
 class While (AST):
+    __slots__ = ('cond', 'body')
+
     def __init__(self, tok, cond, body):
         self.tok = tok
         self.cond = cond
@@ -469,13 +667,12 @@ class While (AST):
         l0 = env.issueLabel()
         l1 = env.issueLabel()
 
-        cond = self.cond.gencode(env, newopt(opt, 1)).bytecodes
+        cond = self.cond.gencodeBranch(env, opt, l1, False)
         body = self.body.gencode(env, newopt(opt, 0, cp=l0, bp=l1)).bytecodes
 
         codes = [m.Inst(opc.LABEL, l0)]
-        codes.extend(cond)
-        codes.append(m.Inst(opc.JIF0, l1))
-        codes.extend(body)
+        codes.append(cond)
+        codes.append(body)
         codes.append(m.Inst(opc.JUMP, l0))
         codes.append(m.Inst(opc.LABEL, l1))
         return m.Insts(m.Type(), codes)
@@ -483,6 +680,8 @@ class While (AST):
 
 
 class For (AST):
+    __slots__ = ('init', 'cond', 'loop', 'body')
+
     def __init__(self, tok, init, cond, loop, body):
         self.tok = tok
         self.init = init
@@ -499,22 +698,28 @@ class For (AST):
             init = []
         else:
             init = self.init.gencode(env, newopt(opt, 0)).bytecodes
-        cond = self.cond.gencode(env, newopt(opt, 1)).bytecodes
+        cond = self.cond.gencodeBranch(env, opt, l1, False)
         loop = self.loop.gencode(env, newopt(opt, 0)).bytecodes
         body = self.body.gencode(env, newopt(opt, 0, cp=l0, bp=l1)).bytecodes
 
         codes = init
         codes.append(m.Inst(opc.LABEL, l0))
-        codes.extend(cond)
-        codes.append(m.Inst(opc.JIF0, l1))
-        codes.extend(body)
-        codes.extend(loop)
+        codes.append(cond)
+        codes.append(body)
+        codes.append(loop)
         codes.append(m.Inst(opc.JUMP, l0))
         codes.append(m.Inst(opc.LABEL, l1))
         return m.Insts(m.Type(), codes)
 
 
 class Switch (AST):
+    __slots__ = ('cond', 'cases')
+
+    # a search node or an equality test costs this many instructions
+    TEST = 4
+    # cases a search leaf tests one by one
+    LEAF = 3
+
     def __init__(self, tok, cond, cases):
         self.tok = tok
         self.cond = cond
@@ -526,38 +731,110 @@ class Switch (AST):
         bodyCodes = []
         end = env.issueLabel()
         default = None
+        cases = [] # [(value or None, code, label)] in source order
 
         for elem in self.cases:
             label = env.issueLabel()
             if elem[0] == 'default':
                 default = label
-                bodyCodes.append(m.Inst(opc.LABEL, label))
-                for e in elem[1]:
-                    bodyCodes.extend(e.gencode(env, newopt(opt, 1, bp = end)).bytecodes)
             else:
-                tableCodes.append(m.Inst(opc.DUP, 1))
-                tableCodes.extend(elem[0].gencode(env, newopt(opt, 1)).bytecodes)
-                tableCodes.append(m.Inst(opc.NEQI, self.nullarg)) #TODO Int以外にも対応させる
-                tableCodes.append(m.Inst(opc.JIF0, label))
+                cases.append((elem[0].eval(env), elem[0].gencode(env, newopt(opt, 1)).bytecodes, label))
 
-                bodyCodes.append(m.Inst(opc.LABEL, label))
-                for e in elem[1]:
-                    bodyCodes.extend(e.gencode(env, newopt(opt, 1, bp = end)).bytecodes)
+            bodyCodes.append(m.Inst(opc.LABEL, label))
+            for e in elem[1]:
+                bodyCodes.append(e.gencode(env, newopt(opt, 1, bp = end)).bytecodes)
 
-        if default is not None:
-            tableCodes.append(m.Inst(opc.JUMP, default))
-        else:
-            tableCodes.append(m.Inst(opc.JUMP, end))
+        tableCodes.append(self.dispatch(env, cases, default if default is not None else end))
 
         bodyCodes.append(m.Inst(opc.LABEL, end))
         bodyCodes.append(m.Inst(opc.POP, self.nullarg))
 
         codes = tableCodes
-        codes.extend(bodyCodes)
+        codes.append(bodyCodes)
 
         return m.Insts(m.Type(), codes)
 
+    def dispatch(self, env, cases, default):
+        """code that jumps from the value on the stack to the label of its case,
+        or to default: a chain of compares in source order or, when every
+        case is an int constant, a binary search over the values, with a
+        range check first for a dense range. the one taking the fewest
+        instructions over all the cases and the longest way to default wins"""
+        chain = []
+        for _, code, label in cases:
+            chain.append(m.Inst(opc.DUP, 1))
+            chain.append(code)
+            chain.append(m.Inst(opc.NEQI, self.nullarg)) #TODO Int以外にも対応させる
+            chain.append(m.Inst(opc.JIF0, label))
+        chain.append(m.Inst(opc.JUMP, default))
+
+        table = {} # value -> label, the first case of a value wins as in the chain
+        for value, _, label in cases:
+            if value.__class__ is not int or optimizer.wrap(value) != value:
+                return chain
+            table.setdefault(value, label)
+        if not table:
+            return chain
+        cost = sum(Switch.TEST * (i + 1) for i, (value, _, label) in enumerate(cases) if table[value] == label)
+        strategies = [(cost + Switch.TEST * len(cases) + 1, chain)]
+
+        values = sorted(table.items())
+        search, cost, toDefault = self.search(env, values, default, None, None)
+        strategies.append((cost + toDefault, search))
+
+        # a dense range is checked first, then the search knows the bounds
+        # and jumps to most cases without testing for their value
+        low, high = values[0][0], values[-1][0]
+        if high - low < 2 * len(values):
+            ranged, cost, toDefault = self.search(env, values, default, low, high + 1)
+            check = [m.Inst(opc.DUP, 1), m.Inst(opc.PUSH, low), m.Inst(opc.LTEI, self.nullarg), m.Inst(opc.JIF0, default),
+                     m.Inst(opc.DUP, 1), m.Inst(opc.PUSH, high), m.Inst(opc.GTEI, self.nullarg), m.Inst(opc.JIF0, default)]
+            cost += 2 * Switch.TEST * len(values)
+            strategies.append((cost + 2 * Switch.TEST + toDefault, check + ranged))
+
+        return min(strategies, key=lambda strategy: strategy[0])[1]
+
+    def search(self, env, cases, default, low, high):
+        """binary search over cases, sorted (value, label) pairs, for a value
+        known to be in [low, high), None where unbounded. gives the code, the
+        instructions it takes to reach each case summed up, and the most it
+        takes to reach default. where the bounds leave a single value the
+        test for it is skipped, so dense ranges mostly go without one"""
+        if len(cases) <= Switch.LEAF:
+            codes = []
+            steps = 0
+            cost = 0
+            for value, label in cases:
+                if low == value and high == value + 1:
+                    codes.append(m.Inst(opc.JUMP, label))
+                    return codes, cost + steps + 1, 0
+                codes.append(m.Inst(opc.DUP, 1))
+                codes.append(m.Inst(opc.PUSH, value))
+                codes.append(m.Inst(opc.NEQI, self.nullarg))
+                codes.append(m.Inst(opc.JIF0, label))
+                steps += Switch.TEST
+                cost += steps
+                if low == value: # ascending, so the bounds only narrow from below
+                    low = value + 1
+            codes.append(m.Inst(opc.JUMP, default))
+            return codes, cost, steps + 1
+
+        middle = len(cases) // 2
+        pivot = cases[middle][0]
+        lower, lowerCost, lowerDefault = self.search(env, cases[:middle], default, low, pivot)
+        upper, upperCost, upperDefault = self.search(env, cases[middle:], default, pivot, high)
+        above = env.issueLabel()
+
+        # pivot > value, so values from pivot on jump to the upper half
+        codes = [m.Inst(opc.DUP, 1), m.Inst(opc.PUSH, pivot), m.Inst(opc.GTI, self.nullarg), m.Inst(opc.JIF0, above)]
+        codes.extend(lower)
+        codes.append(m.Inst(opc.LABEL, above))
+        codes.extend(upper)
+        return codes, lowerCost + upperCost + Switch.TEST * len(cases), Switch.TEST + max(lowerDefault, upperDefault)
+
 class Break (AST):
+    __slots__ = ()
+
     def __init__(self, tok):
         self.tok = tok
 
@@ -569,6 +846,8 @@ class Break (AST):
             return m.Insts(m.Type(), [m.Inst(opc.JUMP, opt.bp)])
 
 class Continue (AST):
+    __slots__ = ()
+
     def __init__(self, tok):
         self.tok = tok
 
@@ -580,6 +859,8 @@ class Continue (AST):
             return m.Insts(m.Type(), [m.Inst(opc.JUMP, opt.cp)])
 
 class Label (AST):
+    __slots__ = ('name', 'expr')
+
     def __init__(self, tok, name, expr):
         self.tok = tok
         self.name = name
@@ -590,11 +871,13 @@ class Label (AST):
         expr = self.expr.gencode(env, newopt(opt, 0))
 
         codes = [m.Inst(opc.LABEL, label)]
-        codes.extend(expr.bytecodes)
+        codes.append(expr.bytecodes)
 
         return m.Insts(expr.typ, codes)
 
 class Goto (AST):
+    __slots__ = ('name',)
+
     def __init__(self, tok, name):
         self.tok = tok
         self.name = name
@@ -607,6 +890,8 @@ class Goto (AST):
 # -- Lv.2 modules --
 
 class Ternary (AST):
+    __slots__ = ('cond', 'then', 'elst')
+
     def __init__(self, tok, cond, then, elst):
         self.tok = tok
         self.cond = cond
@@ -614,28 +899,38 @@ class Ternary (AST):
         self.elst = elst
 
     def gencode(self, env, opt):
-        cond = self.cond.gencode(env, newopt(opt, 1))
-        then = self.then.gencode(env, newopt(opt, 1))
-        elst = self.elst.gencode(env, newopt(opt, 1))
+        # a ? b : c ? d : ... nests in elst, generated like Ifelse chains
+        codes = []
+        ends = []
+        typ = None
+        elem = self
+        while isinstance(elem, Ternary):
+            l0 = env.issueLabel()
+            l1 = env.issueLabel()
+            codes.append(elem.cond.gencodeBranch(env, opt, l0, False))
+            then = elem.then.gencode(env, newopt(opt, 1))
+            if typ is None:
+                typ = then.typ
+            codes.append(then.bytecodes)
+            codes.append(m.Inst(opc.JUMP, l1))
+            codes.append(m.Inst(opc.LABEL, l0))
+            ends.append(l1)
+            elem = elem.elst
+        elst = elem.gencode(env, newopt(opt, 1))
 
         # TODO check if then.typ != elst.typ
 
-        l0 = env.issueLabel()
-        l1 = env.issueLabel()
-
-        codes = cond.bytecodes
-        codes.append(m.Inst(opc.JIF0, l0))
-        codes.extend(then.bytecodes)
-        codes.append(m.Inst(opc.JUMP, l1))
-        codes.append(m.Inst(opc.LABEL, l0))
-        codes.extend(elst.bytecodes)
-        codes.append(m.Inst(opc.LABEL, l1))
+        codes.append(elst.bytecodes)
+        for l1 in reversed(ends):
+            codes.append(m.Inst(opc.LABEL, l1))
 
-        return m.Insts(then.typ, codes)
+        return m.Insts(typ, codes)
 
 
 
 class Cast (AST):
+    __slots__ = ('targetType', 'body')
+
     def __init__(self, tok, targetType, body):
         self.tok = tok
         self.targetType = targetType
@@ -647,6 +942,8 @@ class Cast (AST):
             return result
 
         body = self.body.gencode(env, newopt(opt, 1))
+        if (value := self.fold(constant(body))) is not None:
+            return pushConstant(value)
         codes = body.bytecodes
 
         if body.typ.isInt():
@@ -669,27 +966,55 @@ class Cast (AST):
             g.r.addReport(m.Report('fatal', self.tok, 'Program error occurred while evaluating \'Cast\''))
             return m.Insts()
 
+    def eval(self, env = None):
+        return self.fold(self.body.eval(env))
+
+    def fold(self, value):
+        typ = self.targetType
+        if not isinstance(typ, m.Type) or typ.refcount != 0 or typ.length != 1:
+            return None
+        if typ.basetype in ('int', 'enum'):
+            if value.__class__ is int:
+                return value
+            if value.__class__ is float and math.isfinite(value):
+                return optimizer.wrap(int(value))
+        elif typ.basetype == 'float':
+            if value.__class__ is int:
+                return optimizer.single(float(value))
+            if value.__class__ is float:
+                return value
+        return None
+
 class Sizeof (AST):
+    __slots__ = ('body',)
+
     def __init__(self, tok, body):
         self.tok = tok
         self.body = body
 
     def gencode(self, env, opt):
+        size = self.eval(env)
+        if size is None:
+            g.r.addReport(m.Report('fatal', self.tok, f"cannot eval size of type '{type(self.body)}'"))
+            return m.Insts()
+        return m.Insts(m.Type('int'), [m.Inst(opc.PUSH, size)])
+
+    def eval(self, env = None):
+        if env is None:
+            return None
         if isinstance(self.body, m.Type):
-            return m.Insts(m.Type('int'), [m.Inst(opc.PUSH, env.calcTypeSize(self.body))])
+            return env.calcTypeSize(self.body)
         elif isinstance(self.body, Symbol):
             try:
                 var = env.variableLookup(self.body.symbolname)
-            except m.SymbolNotFoundException as e:
-                g.r.addReport(m.Report('fatal', self.tok, f"cannot eval size of type '{type(self.body)}'"))
-                return m.Insts()
-
-            return m.Insts(m.Type('int'), [m.Inst(opc.PUSH, env.calcTypeSize(var.typ))])
-        else:
-            g.r.addReport(m.Report('fatal', self.tok, f"cannot eval size of type '{type(self.body)}'"))
-        return m.Insts()
+            except m.SymbolNotFoundException:
+                return None
+            return env.calcTypeSize(var.typ)
+        return None
 
 class Raw (AST):
+    __slots__ = ('typ', 'opc', 'arg', 'bodys')
+
     def __init__(self, tok, typ, opc, arg, bodys):
         self.tok = tok
         self.typ = typ
@@ -701,13 +1026,15 @@ class Raw (AST):
 #        self.typ.resolve(env)
         insts = []
         for elem in reversed(self.bodys):
-            insts.extend(elem.gencode(env, newopt(opt, 1)).bytecodes)
+            insts.append(elem.gencode(env, newopt(opt, 1)).bytecodes)
         #insts.append(m.Inst(opc[self.opc], self.arg.eval()))
         insts.append(m.Inst(opc[self.opc], self.arg))
 
         return m.Insts(self.typ, insts)
 
 class Assign (AST):
+    __slots__ = ('left', 'right')
+
     def __init__(self, tok, left, right):
         self.tok = tok
         self.left = left
@@ -715,20 +1042,57 @@ class Assign (AST):
 
     def gencode(self, env, opt):
 
-        right = self.right.gencode(env, newopt(opt, 1))
-        left = self.left.gencode(env, newopt(opt, 1, 'l'))
+        # a = b = c = ... nests in right. every inner assignment leaves its
+        # value on the stack for the one outside it
+        chain = [(self, opt)]
+        elem = self.right
+        while isinstance(elem, Assign):
+            chain.append((elem, newopt(opt, 1)))
+            elem = elem.right
+        right = elem.gencode(env, newopt(opt, 1))
+
+        for elem, elemopt in reversed(chain):
+            left = elem.left.gencode(env, newopt(elemopt, 1, 'l'))
+
+            typ = m.Type()
+
+            codes = right.bytecodes
+            if elemopt.popc == 1:
+                codes.append(m.Inst(opc.DUP, 1))
+                typ = right.typ
+            codes.append(left.bytecodes)
+
+            right = m.Insts(typ, codes)
+
+        return right
+
+class CompoundAssign (AST):
+    """a op= b. body is the binary operation (a op b) whose left is the
+    lvalue, which is evaluated only once"""
+    __slots__ = ('body',)
+
+    def __init__(self, tok, body):
+        self.tok = tok
+        self.body = body
+
+    def gencode(self, env, opt):
+
+        left, store = accessLvalue(env, opt, self.body.left)
+        right = self.body.right.gencode(env, newopt(opt, 1))
+        value = self.body.combine(env, left, right)
 
         typ = m.Type()
 
-        codes = right.bytecodes
+        codes = value.bytecodes
         if opt.popc == 1:
             codes.append(m.Inst(opc.DUP, 1))
-            typ = right.typ
-        codes.extend(left.bytecodes)
+            typ = value.typ
+        codes.append(store)
 
         return m.Insts(typ, codes)
 
 class Minus (AST):
+    __slots__ = ('right',)
 
     def __init__(self, tok, right):
         self.tok = tok
@@ -742,6 +1106,8 @@ class Minus (AST):
             return result
 
         right = self.right.gencode(env, newopt(opt, 1, 'r'))
+        if (value := Minus.fold(constant(right))) is not None:
+            return pushConstant(value)
         codes = right.bytecodes
         typ = copy(right.typ)
 
@@ -761,8 +1127,20 @@ class Minus (AST):
             g.r.addReport(m.Report('fatal', self.tok, f'fatal error in node.Minus'))
             return m.Insts()
 
+    def eval(self, env = None):
+        return Minus.fold(self.right.eval(env))
+
+    @staticmethod
+    def fold(value):
+        if value.__class__ is int:
+            return optimizer.wrap(-value)
+        if value.__class__ is float:
+            return -value
+        return None
+
 
 class Inv (AST):
+    __slots__ = ('right',)
 
     def __init__(self, tok, right):
         self.tok = tok
@@ -776,13 +1154,26 @@ class Inv (AST):
             return result
 
         right = self.right.gencode(env, newopt(opt, 1, 'r'))
+        if (value := Inv.fold(constant(right))) is not None:
+            return pushConstant(value)
 
         codes = right.bytecodes
         codes.append(m.Inst(opc.INV, self.nullarg))
 
         return m.Insts(right.typ, codes)
 
+    def eval(self, env = None):
+        return Inv.fold(self.right.eval(env))
+
+    def gencodeBranch(self, env, opt, label, when):
+        return self.right.gencodeBranch(env, opt, label, not when)
+
+    @staticmethod
+    def fold(value):
+        return int(value == 0) if value.__class__ is int else None
+
 class Pre_inc (AST):
+    __slots__ = ('right',)
 
     def __init__(self, tok, right):
         self.tok = tok
@@ -793,7 +1184,7 @@ class Pre_inc (AST):
         if (result := self.assertOnlyRValue(env, opt)) is not None:
             return result
 
-        right = self.right.gencode(env, newopt(opt, 1, 'r'))
+        right, store = accessLvalue(env, opt, self.right)
         codes = right.bytecodes
         typ = copy(right.typ)
 
@@ -807,11 +1198,12 @@ class Pre_inc (AST):
         else:
             typ = m.Type()
 
-        codes.extend(self.right.gencode(env, newopt(opt, 0, 'l')).bytecodes)
+        codes.append(store)
 
         return m.Insts(typ, codes)
 
 class Pre_dec (AST):
+    __slots__ = ('right',)
 
     def __init__(self, tok, right):
         self.tok = tok
@@ -822,7 +1214,7 @@ class Pre_dec (AST):
         if (result := self.assertOnlyRValue(env, opt)) is not None:
             return result
 
-        right = self.right.gencode(env, newopt(opt, 1, 'r'))
+        right, store = accessLvalue(env, opt, self.right)
         codes = right.bytecodes
         typ = copy(right.typ)
 
@@ -836,11 +1228,12 @@ class Pre_dec (AST):
         else:
             typ = m.Type()
 
-        codes.extend(self.right.gencode(env, newopt(opt, 0, 'l')).bytecodes)
+        codes.append(store)
 
         return m.Insts(typ, codes)
 
 class Post_inc (AST):
+    __slots__ = ('left',)
 
     def __init__(self, tok, left):
         self.tok = tok
@@ -851,26 +1244,25 @@ class Post_inc (AST):
         if (result := self.assertOnlyRValue(env, opt)) is not None:
             return result
 
-        left = self.left.gencode(env, newopt(opt, 1, 'r'))
+        left, store = accessLvalue(env, opt, self.left)
         codes = left.bytecodes
         typ = copy(left.typ)
+        step = env.calcPointeredSize(typ) if typ.isPointer() else 1
 
         if (opt.popc == 1):
             codes.append(m.Inst(opc.DUP, self.nullarg))
         else:
             typ = m.Type()
 
-        if typ.isPointer():
-            codes.append(m.Inst(opc.INC, env.calcPointeredSize(typ)))
-        else:
-            codes.append(m.Inst(opc.INC, 1))
+        codes.append(m.Inst(opc.INC, step))
 
-        codes.extend(self.left.gencode(env, newopt(opt, 0, 'l')).bytecodes)
+        codes.append(store)
 
         return m.Insts(typ, codes)
 
 
 class Post_dec (AST):
+    __slots__ = ('left',)
 
     def __init__(self, tok, left):
         self.tok = tok
@@ -881,40 +1273,28 @@ class Post_dec (AST):
         if (result := self.assertOnlyRValue(env, opt)) is not None:
             return result
 
-        left = self.left.gencode(env, newopt(opt, 1, 'r'))
+        left, store = accessLvalue(env, opt, self.left)
         codes = left.bytecodes
         typ = copy(left.typ)
+        step = env.calcPointeredSize(typ) if typ.isPointer() else 1
 
         if (opt.popc == 1):
             codes.append(m.Inst(opc.DUP, self.nullarg))
         else:
             typ = m.Type()
 
-        if typ.isPointer():
-            codes.append(m.Inst(opc.DEC, env.calcPointeredSize(typ)))
-        else:
-            codes.append(m.Inst(opc.DEC, 1))
+        codes.append(m.Inst(opc.DEC, step))
 
-        codes.extend(self.left.gencode(env, newopt(opt, 0, 'l')).bytecodes)
+        codes.append(store)
 
         return m.Insts(typ, codes)
 
-class Add (AST):
-
-    def __init__(self, tok, left, right):
-        self.tok = tok
-        self.left = left
-        self.right = right
-
-    def gencode(self, env, opt):
-
-        if (result := self.assertOnlyRValue(env, opt)) is not None:
-            return result
-        if (result := self.assertOnlyPop1(env, opt)) is not None:
-            return result
+class Add (Binary):
+    __slots__ = ()
+    opI = opc.ADDI
+    opF = opc.ADDF
 
-        left = self.left.gencode(env, newopt(opt, 1))
-        right = self.right.gencode(env, newopt(opt, 1))
+    def combine(self, env, left, right):
 
         code = right.bytecodes
 
@@ -941,16 +1321,16 @@ class Add (AST):
                 code.append(m.Inst(opc.PUSH, size))
                 code.append(m.Inst(opc.MULI, self.nullarg))
 
-            code.extend(left.bytecodes)
+            code.append(left.bytecodes)
             code.append(m.Inst(opc.ADDI, self.nullarg))
 
         elif (left.typ.basetype  == 'int') and (right.typ.basetype == 'int'):
-            code.extend(left.bytecodes)
+            code.append(left.bytecodes)
             code.append(m.Inst(opc.ADDI, self.nullarg))
             typ = m.Type('int')
 
         elif (left.typ.basetype == 'float') and (right.typ.basetype == 'float'):
-            code.extend(left.bytecodes)
+            code.append(left.bytecodes)
             code.append(m.Inst(opc.ADDF, self.nullarg))
             typ = m.Type('float')
 
@@ -961,22 +1341,12 @@ class Add (AST):
         return m.Insts(typ, code)
 
 
-class Sub (AST):
-
-    def __init__(self, tok, left, right):
-        self.tok = tok
-        self.left = left
-        self.right = right
-
-    def gencode(self, env, opt):
-
-        if (result := self.assertOnlyRValue(env, opt)) is not None:
-            return result
-        if (result := self.assertOnlyPop1(env, opt)) is not None:
-            return result
+class Sub (Binary):
+    __slots__ = ()
+    opI = opc.SUBI
+    opF = opc.SUBF
 
-        left = self.left.gencode(env, newopt(opt, 1))
-        right = self.right.gencode(env, newopt(opt, 1))
+    def combine(self, env, left, right):
 
         code = right.bytecodes
 
@@ -995,16 +1365,16 @@ class Sub (AST):
                 code.append(m.Inst(opc.PUSH, size))
                 code.append(m.Inst(opc.MULI, self.nullarg))
 
-            code.extend(left.bytecodes)
+            code.append(left.bytecodes)
             code.append(m.Inst(opc.SUBI, self.nullarg))
 
         elif (left.typ.basetype  == 'int') and (right.typ.basetype == 'int'):
-            code.extend(left.bytecodes)
+            code.append(left.bytecodes)
             code.append(m.Inst(opc.SUBI, self.nullarg))
             typ = m.Type('int')
 
         elif (left.typ.basetype == 'float') and (right.typ.basetype == 'float'):
-            code.extend(left.bytecodes)
+            code.append(left.bytecodes)
             code.append(m.Inst(opc.SUBF, self.nullarg))
             typ = m.Type('float')
 
@@ -1014,68 +1384,169 @@ class Sub (AST):
         return m.Insts(typ, code)
 
 class Mul (BIOP):
+    __slots__ = ()
     opI = opc.MULI
     opF = opc.MULF
 
 class Div (BIOP):
+    __slots__ = ()
     opI = opc.DIVI
     opF = opc.DIVF
 
 class Mod (BIOP):
+    __slots__ = ()
     opI = opc.MODI
     opF = opc.MODF
 
 class And (BIOP):
+    __slots__ = ()
     opI = opc.AND
     opF = opc.AND
 
 class Or (BIOP):
+    __slots__ = ()
     opI = opc.OR
     opF = opc.OR
 
+class Logical (Binary):
+    """&& and ||. the right operand is evaluated only if the left one does
+    not decide the result; as a condition, each operand jumps to where the
+    result leads, without making a 0 or 1 of it"""
+    __slots__ = ()
+    decides = None # truth of an operand that decides the result
+
+    def gencode(self, env, opt):
+
+        if (result := self.assertOnlyRValue(env, opt)) is not None:
+            return result
+        if (result := self.assertOnlyPop1(env, opt)) is not None:
+            return result
+
+        if (value := self.eval(env)) is not None:
+            return pushConstant(value)
+        false = env.issueLabel()
+        end = env.issueLabel()
+        codes = self.gencodeBranch(env, opt, false, False)
+        return m.Insts(m.Type('int'), codes + Logical.materialize(false, end))
+
+    def gencodeBranch(self, env, opt, label, when):
+        # a && b && c ... nests to the left, its operands are one sequence
+        operands = [self.right]
+        left = self.left
+        while left.__class__ is self.__class__:
+            operands.append(left.right)
+            left = left.left
+        operands.append(left)
+        operands.reverse()
+
+        if when == self.decides: # the first operand that decides jumps
+            codes = []
+            for elem in operands:
+                codes.append(elem.gencodeBranch(env, opt, label, when))
+            return codes
+
+        # only the last operand can jump, the others skip it when they decide
+        skip = env.issueLabel()
+        codes = []
+        for elem in operands[:-1]:
+            codes.append(elem.gencodeBranch(env, opt, skip, self.decides))
+        codes.append(operands[-1].gencodeBranch(env, opt, label, when))
+        codes.append(m.Inst(opc.LABEL, skip))
+        return codes
+
+    def combine(self, env, left, right):
+        # an operand of another binary operation, generated by it already
+        false = env.issueLabel()
+        end = env.issueLabel()
+        skip = false if self.decides is False else env.issueLabel()
+        codes = left.bytecodes
+        if self.decides:
+            codes.append(m.Inst(opc.INV, self.nullarg))
+        codes.append(m.Inst(opc.JIF0, skip))
+        codes.append(right.bytecodes)
+        codes.append(m.Inst(opc.JIF0, false))
+        if self.decides:
+            codes.append(m.Inst(opc.LABEL, skip))
+        codes.extend(Logical.materialize(false, end))
+        return m.Insts(m.Type('int'), codes)
+
+    @staticmethod
+    def materialize(false, end):
+        """the 1 or 0 of a condition that jumps to false when it is false"""
+        return [m.Inst(opc.PUSH, 1), m.Inst(opc.JUMP, end), m.Inst(opc.LABEL, false),
+                m.Inst(opc.PUSH, 0), m.Inst(opc.LABEL, end)]
+
+    def fold(self, left, right):
+        if left.__class__ not in (int, float):
+            return None
+        if bool(left) == self.decides:
+            return int(self.decides)
+        if right.__class__ not in (int, float):
+            return None
+        return int(bool(right))
+
+class LogicalAnd (Logical):
+    __slots__ = ()
+    decides = False
+
+class LogicalOr (Logical):
+    __slots__ = ()
+    decides = True
+
 class Xor (BIOP):
+    __slots__ = ()
     opI = opc.XOR
     opF = opc.XOR
 
 class LShift (BIOP):
+    __slots__ = ()
     opI = opc.LSHI
     opF = opc.LSHI
 
 class RShift (BIOP):
+    __slots__ = ()
     opI = opc.RSHI
     opF = opc.RSHI
 
 class Lt (BIOP):
+    __slots__ = ()
     opI = opc.LTI
     opF = opc.LTF
     isCompOP = True
 
 class Lte (BIOP):
+    __slots__ = ()
     opI = opc.LTEI
     opF = opc.LTEF
     isCompOP = True
 
 class Gt (BIOP):
+    __slots__ = ()
     opI = opc.GTI
     opF = opc.GTF
     isCompOP = True
 
 class Gte (BIOP):
+    __slots__ = ()
     opI = opc.GTEI
     opF = opc.GTEF
     isCompOP = True
 
 class Eq (BIOP):
+    __slots__ = ()
     opI = opc.EQI
     opF = opc.EQF
     isCompOP = True
 
 class Neq (BIOP):
+    __slots__ = ()
     opI = opc.NEQI
     opF = opc.NEQF
     isCompOP = True
 
 class Symbol (AST):
+    __slots__ = ('symbolname',)
+
     def __init__(self, tok, symbolname):
         self.tok = tok
         self.symbolname = symbolname
@@ -1113,7 +1584,22 @@ class Symbol (AST):
             codes = [var.genStoreCode()]
             return m.Insts(m.Type(), codes)
 
+    def eval(self, env = None):
+        if env is None:
+            return None
+        try:
+            env.variableLookup(self.symbolname)
+            return None
+        except m.SymbolNotFoundException:
+            pass
+        try:
+            return env.enumLookup(self.symbolname)
+        except m.SymbolNotFoundException:
+            return None
+
 class NumberI (AST):
+    __slots__ = ('value',)
+
     def __init__(self, tok, value):
         self.tok = tok
         if isinstance(value, str):
@@ -1129,10 +1615,12 @@ class NumberI (AST):
 
         return m.Insts(m.Type('int'), [m.Inst(opc.PUSH, self.value)])
 
-    def eval(self):
+    def eval(self, env = None):
         return self.value
 
 class NumberF (AST):
+    __slots__ = ('value',)
+
     def __init__(self, tok, value):
         self.tok = tok
         if isinstance(value, str):
@@ -1148,10 +1636,12 @@ class NumberF (AST):
 
         return m.Insts(m.Type('float'), [m.Inst(opc.PUSH, self.value)])
 
-    def eval(self):
+    def eval(self, env = None):
         return self.value
 
 class String (AST):
+    __slots__ = ('value',)
+
     def __init__(self, tok, value):
         self.tok = tok
         self.value = value
@@ -1166,7 +1656,7 @@ class String (AST):
         strid = env.issueString(self.value)
         return m.Insts(m.Type('int'), [m.Inst(opc.PUSH, strid)])
 
-    def eval(self):
+    def eval(self, env = None):
         return self.value
 
 
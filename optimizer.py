@@ -0,0 +1,452 @@
+import math
+import struct
+from bisect import bisect_left
+from collections import Counter
+from itertools import compress
+import glob as g
+import MODEL as m
+from mnemonic import mnemonic as opc
+
+# passes over the code of one function, an m.InstArray as Func.gencode makes
+# it: ENTRY/LABEL pseudo operations and symbolic CALL targets are still in
+# place. every rewrite is counted by rule name in g.stats
+
+def wrap(value):
+    """value as the 32 bit int the VM holds"""
+    return ((value + 0x80000000) & 0xffffffff) - 0x80000000
+
+def single(value):
+    """value rounded to the 32 bit float the VM computes in, None if it is out of range"""
+    try:
+        return struct.unpack('>f', struct.pack('>f', value))[0]
+    except OverflowError:
+        return None
+
+def truncdiv(l, r):
+    q = abs(l) // abs(r)
+    return q if (l < 0) == (r < 0) else -q
+
+# opcode -> what it computes out of the constant operands, as the VM does.
+# None where the VM result is not known at compile time (division by zero)
+FOLDI = {
+    opc.ADDI: lambda l, r: wrap(l + r),
+    opc.SUBI: lambda l, r: wrap(l - r),
+    opc.MULI: lambda l, r: wrap(l * r),
+    opc.DIVI: lambda l, r: wrap(truncdiv(l, r)) if r else None,
+    opc.MODI: lambda l, r: wrap(l - r * truncdiv(l, r)) if r else None,
+    opc.AND:  lambda l, r: l & r,
+    opc.OR:   lambda l, r: l | r,
+    opc.XOR:  lambda l, r: l ^ r,
+    opc.LSHI: lambda l, r: wrap(l << (r & 31)),
+    opc.RSHI: lambda l, r: l >> (r & 31),
+    opc.EQI:  lambda l, r: int(l == r),
+    opc.NEQI: lambda l, r: int(l != r),
+    opc.LTI:  lambda l, r: int(l < r),
+    opc.LTEI: lambda l, r: int(l <= r),
+    opc.GTI:  lambda l, r: int(l > r),
+    opc.GTEI: lambda l, r: int(l >= r),
+}
+
+FOLDF = {
+    opc.ADDF: lambda l, r: single(l + r),
+    opc.SUBF: lambda l, r: single(l - r),
+    opc.MULF: lambda l, r: single(l * r),
+    opc.DIVF: lambda l, r: single(l / r) if r else None,
+    opc.MODF: lambda l, r: single(math.fmod(l, r)) if r else None,
+    opc.EQF:  lambda l, r: int(l == r),
+    opc.NEQF: lambda l, r: int(l != r),
+    opc.LTF:  lambda l, r: int(l < r),
+    opc.LTEF: lambda l, r: int(l <= r),
+    opc.GTF:  lambda l, r: int(l > r),
+    opc.GTEF: lambda l, r: int(l >= r),
+}
+
+# -= :: PEEPHOLE :: =-
+
+# instructions that push one value and do nothing else
+PUSHES = frozenset((opc.PUSH, opc.LOADG, opc.LOADL, opc.LOADA, opc.PULP, opc.PUAP))
+STORES = frozenset((opc.STOREG, opc.STOREL, opc.STOREA))
+LOADS = frozenset((opc.LOADG, opc.LOADL, opc.LOADA))
+STEPS = frozenset((opc.INC, opc.DEC))
+FOLDABLE = frozenset(FOLDI)
+
+# comparison -> its negation, for INV after it. not for the float orderings,
+# which are all false on NaN
+NEGATED = {
+    opc.EQI: opc.NEQI, opc.NEQI: opc.EQI,
+    opc.LTI: opc.GTEI, opc.GTEI: opc.LTI,
+    opc.GTI: opc.LTEI, opc.LTEI: opc.GTI,
+    opc.EQF: opc.NEQF, opc.NEQF: opc.EQF,
+}
+
+def isint(arg):
+    """arg is a plain int: not an m.Address, which the linker relocates"""
+    return arg.__class__ is int
+
+def isaddend(arg):
+    return isinstance(arg, int)
+
+def step(op, arg):
+    return arg if op == opc.INC else -arg
+
+def foldConstants(ops, args):
+    if isint(args[0]) and isint(args[1]):
+        value = FOLDI[ops[2]](wrap(args[1]), wrap(args[0]))
+        if value is not None:
+            return [(opc.PUSH, value)]
+
+def addZero(ops, args):
+    if isint(args[0]) and args[0] == 0:
+        return []
+
+def addImmediate(ops, args):
+    if isaddend(args[0]):
+        return [(opc.INC, args[0])]
+
+def addImmediateBelow(ops, args):
+    if isaddend(args[0]):
+        return [(ops[1], args[1]), (opc.INC, args[0])]
+
+def subImmediate(ops, args):
+    if isint(args[0]):
+        return [(ops[1], args[1]), (opc.DEC, args[0])]
+
+def mulOne(ops, args):
+    if isint(args[0]) and args[0] == 1:
+        return []
+
+def mulOneBelow(ops, args):
+    if isint(args[0]) and args[0] == 1:
+        return [(ops[1], args[1])]
+
+def stepZero(ops, args):
+    if isint(args[0]) and args[0] == 0:
+        return []
+
+def mergeSteps(ops, args):
+    if isint(args[0]) and isint(args[1]):
+        total = wrap(step(ops[0], args[0]) + step(ops[1], args[1]))
+        return [(opc.INC, total)] if total else []
+
+def stepConstant(ops, args):
+    if isint(args[0]) and isint(args[1]):
+        return [(opc.PUSH, wrap(args[0] + step(ops[1], args[1])))]
+
+def drop(ops, args):
+    return []
+
+def storeReload(ops, args):
+    if args[0] == args[1] and ops[1] == ops[0] - (opc.STOREG - opc.LOADG):
+        return [(opc.DUP, 0), (ops[0], args[0])]
+
+def storeDiscard(ops, args):
+    return [(ops[1], args[1])]
+
+def negateCompare(ops, args):
+    return [(NEGATED[ops[0]], 0)]
+
+# rule name, the instructions it matches (an opcode, or a set of opcodes any
+# of which matches) and the rewrite: a function of the matched opcodes and
+# arguments giving the instructions that replace them, or None if it does
+# not apply. the replacement goes through the rules again, so rewrites
+# cascade. no rule makes code longer
+PEEPHOLE = [
+    ('fold constants',      (opc.PUSH, opc.PUSH, FOLDABLE),    foldConstants),
+    ('add zero',            (opc.PUSH, opc.ADDI),              addZero),
+    ('add immediate',       (opc.PUSH, opc.ADDI),              addImmediate),
+    ('add immediate below', (opc.PUSH, PUSHES, opc.ADDI),      addImmediateBelow),
+    ('sub immediate',       (opc.PUSH, PUSHES, opc.SUBI),      subImmediate),
+    ('mul one',             (opc.PUSH, opc.MULI),              mulOne),
+    ('mul one below',       (opc.PUSH, PUSHES, opc.MULI),      mulOneBelow),
+    ('div one',             (opc.PUSH, PUSHES, opc.DIVI),      mulOneBelow),
+    ('step zero',           (STEPS,),                          stepZero),
+    ('merge steps',         (STEPS, STEPS),                    mergeSteps),
+    ('step constant',       (opc.PUSH, STEPS),                 stepConstant),
+    ('dead push',           (PUSHES, opc.POP),                 drop),
+    ('dup pop',             (opc.DUP, opc.POP),                drop),
+    ('store reload',        (STORES, LOADS),                   storeReload),
+    ('store discard',       (opc.DUP, STORES, opc.POP),        storeDiscard),
+    ('negate compare',      (frozenset(NEGATED), opc.INV),     negateCompare),
+]
+
+def expand(want):
+    return want if isinstance(want, frozenset) else (want,)
+
+def index(rules):
+    """rules by the last two opcodes their pattern matches. a pattern of a
+    single instruction is listed after any opcode, and after None for the
+    first instruction"""
+    result = {}
+    for rule in rules:
+        pattern = rule[1]
+        for last in expand(pattern[-1]):
+            for prev in (expand(pattern[-2]) if len(pattern) > 1 else [None, *opc]):
+                result.setdefault((prev, last), []).append(rule)
+    return result
+
+PEEPHOLEINDEX = index(PEEPHOLE)
+# the opcodes single instruction patterns match, and the pairs the others end with
+PEEPHOLESINGLES = frozenset(op for _, pattern, _ in PEEPHOLE if len(pattern) == 1 for op in expand(pattern[0]))
+PEEPHOLEPAIRS = frozenset(key for key in PEEPHOLEINDEX if key[0] is not None and key[1] not in PEEPHOLESINGLES)
+
+def matches(pattern, ops):
+    """whether the opcodes before the last two match the rest of pattern"""
+    for want, op in zip(pattern[:-2], ops):
+        if op != want and not (isinstance(want, frozenset) and op in want):
+            return False
+    return True
+
+def peephole(insts):
+    """insts with the PEEPHOLE rules applied until none matches. patterns
+    never span a LABEL, so no jump leads into the middle of one.
+
+    matching starts only where the input has a pair of instructions some
+    pattern ends with, or after a rewrite, which may make a new one; the
+    stretches in between are copied as they are"""
+    opcodes = insts.opcodes
+    sites = [i for i, pair in enumerate(zip(opcodes, opcodes[1:]), 1) if pair in PEEPHOLEPAIRS]
+    sites.extend(i for i, op in enumerate(opcodes) if op in PEEPHOLESINGLES)
+    if not sites:
+        return insts
+    sites.sort()
+    sites.append(len(opcodes)) # sentinel
+
+    result = m.InstArray()
+    ops = result.opcodes
+    hits = Counter()
+    start = 0
+    k = 0
+    rewritten = False
+    while True:
+        if rewritten and start < len(opcodes):
+            i = start
+        else:
+            while sites[k] < start:
+                k += 1
+            i = sites[k]
+            if i == len(opcodes):
+                break
+        result.extendRange(insts, start, i)
+        start = i + 1
+
+        rewritten = False
+        todo = [(opcodes[i], insts.arg(i))]
+        while todo:
+            op, arg = todo.pop()
+            result.append(op, arg)
+            length = len(ops)
+            rules = PEEPHOLEINDEX.get((ops[-2] if length > 1 else None, op), ())
+            for name, pattern, rewrite in rules:
+                base = length - len(pattern)
+                if base < 0 or not matches(pattern, ops[base:]):
+                    continue
+                replacement = rewrite(ops[base:], [result.arg(j) for j in range(base, length)])
+                if replacement is None:
+                    continue
+                result.truncate(base)
+                todo.extend(reversed(replacement))
+                hits[name] += 1
+                rewritten = True
+                break
+    if not hits:
+        return insts
+    result.extendRange(insts, start, len(opcodes))
+
+    g.stats.update(hits)
+    return result
+
+# -= :: BRANCHES :: =-
+
+BRANCHING = frozenset((opc.LABEL, opc.JUMP, opc.JIF0))
+
+def branches(insts):
+    """insts with jumps threaded through the JUMPs they land on, jumps to
+    the next instruction removed, a JIF0 over a single JUMP turned around
+    and labels no jump uses dropped, until none of these applies"""
+    hits = Counter()
+    while True:
+        insts, again = simplifyBranches(insts, hits)
+        if not again:
+            break
+    g.stats.update(hits)
+    return insts
+
+def simplifyBranches(insts, hits):
+    """one round of branches: the new insts and whether another round may
+    find more to do"""
+    opcodes = insts.opcodes
+    n = len(opcodes)
+    labels = {}  # label -> index of its LABEL
+    first = {}   # label -> first label of the run of adjacent labels it is in
+    landing = {} # label -> index of the instruction control reaches from it
+    jumps = []   # [(index, target)] of JUMP and JIF0
+    for i in [i for i, op in enumerate(opcodes) if op in BRANCHING]:
+        arg = insts.arg(i)
+        if opcodes[i] != opc.LABEL:
+            jumps.append((i, arg))
+            continue
+        if i == 0 or opcodes[i - 1] != opc.LABEL:
+            head = arg
+        labels[arg] = i
+        first[arg] = head
+    if not labels:
+        return insts, False
+    for label, i in labels.items():
+        i += 1
+        while i < n and opcodes[i] == opc.LABEL:
+            i += 1
+        landing[label] = i
+
+    def destination(label):
+        seen = {label}
+        while landing[label] < n and opcodes[landing[label]] == opc.JUMP:
+            label = insts.arg(landing[label])
+            if label not in labels or label in seen:
+                break
+            seen.add(label)
+        return first.get(label, label)
+
+    def follows(label, i):
+        """whether label is at the instructions right after i"""
+        return (i + 1 < n and opcodes[i + 1] == opc.LABEL and labels[label] > i
+                and landing[label] == landing[insts.arg(i + 1)])
+
+    threaded = []
+    for i, target in jumps:
+        if target in labels: # else a goto to a label this function lacks, the linker reports it
+            label = destination(target)
+            if label != target:
+                insts.setArg(i, label)
+                hits['thread jump' if landing.get(label) != landing[target] else 'merge labels'] += 1
+                target = label
+        threaded.append((i, target))
+
+    dropped = []
+    used = set()
+    skip = -1
+    for i, target in threaded:
+        if i == skip:
+            continue
+        if target not in labels:
+            used.add(target)
+        elif follows(target, i):
+            if opcodes[i] == opc.JUMP:
+                dropped.append(i)
+                hits['jump to next'] += 1
+            else:
+                opcodes[i] = opc.POP
+                insts.setArg(i, 0)
+                hits['jif0 to next'] += 1
+        elif (opcodes[i] == opc.JIF0 and i + 1 < n and opcodes[i + 1] == opc.JUMP and follows(target, i + 1)
+              and i > 0 and (opcodes[i - 1] == opc.INV or opcodes[i - 1] in NEGATED)):
+            # COND; JIF0 L0; JUMP L1; L0: is NOTCOND; JIF0 L1; L0:
+            if opcodes[i - 1] == opc.INV:
+                dropped.append(i - 1)
+            else:
+                opcodes[i - 1] = NEGATED[opcodes[i - 1]]
+            target = insts.arg(i + 1)
+            insts.setArg(i, target)
+            used.add(target)
+            dropped.append(i + 1)
+            skip = i + 1
+            hits['jif0 over jump'] += 1
+        else:
+            used.add(target)
+
+    for label, i in labels.items():
+        if label not in used:
+            dropped.append(i)
+            hits['unused label'] += 1
+
+    if not dropped:
+        return insts, False
+    dropped.sort()
+    return insts.drop(dropped), exposesJump(insts, dropped, landing)
+
+def exposesJump(insts, dropped, landing):
+    """whether dropping the instructions at dropped puts a jump right before
+    its own label, or a JIF0 right before a JUMP or over a JUMP to its
+    label, so another round pays"""
+    opcodes = insts.opcodes
+    gone = set(dropped)
+    for i in dropped:
+        before = i - 1
+        while before in gone:
+            before -= 1
+        after = i + 1
+        while after in gone:
+            after += 1
+        if before < 0 or after == len(opcodes) or opcodes[before] not in (opc.JUMP, opc.JIF0):
+            continue
+        if opcodes[after] == opc.LABEL:
+            label = landing[insts.arg(after)]
+            if landing.get(insts.arg(before)) == label:
+                return True
+            if (opcodes[before] == opc.JUMP and before > 0 and opcodes[before - 1] == opc.JIF0
+                    and landing.get(insts.arg(before - 1)) == label):
+                return True
+        if opcodes[before] == opc.JIF0 and opcodes[after] == opc.JUMP:
+            return True
+    return False
+
+# -= :: REACHABILITY :: =-
+
+# instructions control does not simply fall through
+TRANSFERS = frozenset((opc.JUMP, opc.JIF0, opc.RET, opc.EXIT))
+
+def unreachable(insts):
+    """insts without the instructions no control flow from the ENTRY
+    reaches: the code after a RET or a JUMP up to a label some reached jump
+    goes to, and the LABELs no reached jump uses"""
+    opcodes = insts.opcodes
+    n = len(opcodes)
+    transfers = []
+    labels = {}
+    for i in [i for i, op in enumerate(opcodes) if op in TRANSFERS or op == opc.LABEL]:
+        if opcodes[i] == opc.LABEL:
+            labels[insts.arg(i)] = i
+        else:
+            transfers.append(i)
+
+    reached = bytearray(n)
+    todo = [0]
+    while todo:
+        start = todo.pop()
+        if start >= n or reached[start]:
+            continue
+        k = bisect_left(transfers, start)
+        end = transfers[k] if k < len(transfers) else n - 1
+        reached[start:end + 1] = b'\x01' * (end + 1 - start)
+        op = opcodes[end]
+        if op == opc.JUMP or op == opc.JIF0:
+            target = labels.get(insts.arg(end))
+            if target is not None: # else a goto to a label this function lacks, the linker reports it
+                todo.append(target)
+        if op != opc.JUMP and op != opc.RET and op != opc.EXIT:
+            todo.append(end + 1)
+
+    removed = reached.count(0)
+    if not removed:
+        return insts
+    # a LABEL reached only by falling through to it is dropped with the rest
+    used = {insts.arg(i) for i in transfers if reached[i] and opcodes[i] != opc.RET and opcodes[i] != opc.EXIT}
+    for label, i in labels.items():
+        if reached[i] and label not in used:
+            reached[i] = 0
+    dropped = list(compress(range(n), reached.translate(FLIP)))
+    g.stats['unreachable'] += removed
+    result = insts.drop(dropped)
+    # a jump the dropped code followed may now be right before its label
+    for i in transfers:
+        if reached[i] and i + 1 < n and not reached[i + 1] and (opcodes[i] == opc.JUMP or opcodes[i] == opc.JIF0):
+            return branches(result)
+    return result
+
+FLIP = bytes.maketrans(b'\x00\x01', b'\x01\x00')
+
+PASSES = [branches, unreachable, peephole]
+
+def optimize(insts):
+    for run in PASSES:
+        insts = run(insts)
+    return insts
@@ -0,0 +1,148 @@
+import os
+import re
+import pickle
+import hashlib
+import glob as g
+import MODEL as m
+from node import OPT
+from astConstructor import makeAST, projectAST, compilerDigest
+from pycparser._tables import make_parser
+
+# bump when the layout of PrecompiledHeader changes
+FORMAT = 1
+
+LINEDIRECTIVE = re.compile(r'^#line \d+ "(.*)"$', re.M)
+
+def split(source, libpath):
+    """splits preprocessed source into the leading part that comes from lvmxlib
+    headers and the rest. the prefix is empty when the translation unit does
+    not start with header includes."""
+    for match in LINEDIRECTIVE.finditer(source):
+        if not os.path.abspath(match.group(1)).startswith(libpath):
+            return source[:match.start()], source[match.start():]
+    return source, ''
+
+
+class PrecompiledHeader:
+    """state of MODEL.Env after the header prefix of a translation unit went
+    through parse, projectAST and gencode: the functions with their Inst lists,
+    structs, typedefs, enums and statics, plus the typedef names the parser
+    needs to continue after the prefix.
+
+    the Env is kept pickled, so every restore() hands out a private copy
+    (compile patches the Insts of called functions in place)."""
+
+    def __init__(self, key, scope, env, reports):
+        self.key = key         # digest of the prefix source and the compiler
+        self.scope = scope     # pycparser file scope after the prefix
+        self.env = env         # pickled MODEL.Env, None if the prefix does not compile
+        self.reports = reports # warnings issued while compiling the prefix
+
+    @staticmethod
+    def build(key, prefix, parser):
+        """compiles prefix on its own. if it does not compile cleanly the
+        result is not usable() and the whole source is compiled as usual."""
+        r = g.r
+        positions = g.positions
+        g.r = m.ErrorModule()
+        g.positions = m.Positions() # nothing is kept that refers to it
+        try:
+            ast = parser.parse(prefix, filename=g.filename)
+            scope = parser.file_scope()
+            program = projectAST(ast)
+            env = m.Env()
+            if not g.r.hasError():
+                # node.Program.gencode without the trailing magic statics
+                for elem in program.body:
+                    elem.gencode(env, OPT())
+            if g.r.hasError():
+                return PrecompiledHeader(key, None, None, [])
+            return PrecompiledHeader(key, scope, pickle.dumps(env), g.r.reports)
+        except Exception:
+            return PrecompiledHeader(key, None, None, [])
+        finally:
+            g.r = r
+            g.positions = positions
+
+    def usable(self):
+        return self.env is not None
+
+    def restore(self):
+        for report in self.reports:
+            g.r.addReport(report)
+        return pickle.loads(self.env)
+
+    def dump(self, filename):
+        with open(filename, mode="wb") as f:
+            pickle.dump((FORMAT, self.key, self.scope, self.env, self.reports), f)
+
+    @staticmethod
+    def load(filename):
+        with open(filename, mode="rb") as f:
+            version, key, scope, env, reports = pickle.load(f)
+        if version != FORMAT:
+            return None
+        return PrecompiledHeader(key, scope, env, reports)
+
+
+class PCHStore:
+    """precompiled headers by prefix digest, in memory and, with a directory,
+    on disk. a changed header changes the preprocessed prefix and so the key:
+    the stale PCH is simply not found again."""
+
+    def __init__(self, libpath, directory = None):
+        self.libpath = libpath
+        self.directory = directory
+        self.headers = {} # key -> PrecompiledHeader
+
+    def get(self, prefix, parser):
+        h = hashlib.sha256(f"{FORMAT}\0{compilerDigest()}\0".encode())
+        h.update(prefix.encode())
+        key = h.hexdigest()
+
+        if key in self.headers:
+            return self.headers[key]
+
+        filename = None
+        header = None
+        if self.directory is not None:
+            filename = os.path.join(self.directory, key[:32] + '.pch')
+            try:
+                header = PrecompiledHeader.load(filename)
+            except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+                header = None
+            if header is not None and header.key != key:
+                header = None
+
+        if header is None:
+            header = PrecompiledHeader.build(key, prefix, parser)
+            if filename is not None:
+                try:
+                    os.makedirs(self.directory, exist_ok=True)
+                    header.dump(filename)
+                except OSError:
+                    pass # read-only deployment, keep it in memory only
+
+        self.headers[key] = header
+        return header
+
+    def apply(self, code, parser):
+        """returns the Env to generate code into, the source left to compile
+        and the parser file scope to compile it in: the part after the header
+        prefix if a PCH applies, otherwise a fresh Env and the whole source."""
+        prefix, rest = split(code, self.libpath)
+        header = self.get(prefix, parser) if prefix != '' else None
+        if header is None or not header.usable():
+            return m.Env(), code, None
+
+        env = header.restore()
+        # blank lines keep the line numbers of the rest as they were
+        return env, '\n' * prefix.count('\n') + rest, header.scope
+
+    def prepare(self, code, parser):
+        """returns the Env to generate code into and the AST of what is left
+        to compile (see apply)"""
+        if parser is None:
+            parser = make_parser()
+        env, rest, scope = self.apply(code, parser)
+        return env, makeAST(rest, parser, scope)
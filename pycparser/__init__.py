@@ -11,7 +11,6 @@ __all__ = ['c_lexer', 'c_parser', 'c_ast']
 __version__ = '2.20'
 
 import io
-from subprocess import check_output
 from .c_parser import CParser
 
 
@@ -29,6 +28,8 @@ def preprocess_file(filename, cpp_path='cpp', cpp_args=''):
         When successful, returns the preprocessed file's contents.
         Errors from cpp will be printed out.
     """
+    from subprocess import check_output
+
     path_list = [cpp_path]
     if isinstance(cpp_args, list):
         path_list += cpp_args
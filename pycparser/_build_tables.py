@@ -21,14 +21,11 @@ from _ast_gen import ASTCodeGenerator
 ast_gen = ASTCodeGenerator('_c_ast.cfg')
 ast_gen.generate(open('c_ast.py', 'w'))
 
-from pycparser import c_parser
+from pycparser import _tables
 
-# Generates the tables
+# Generates the tables, stamped with the current grammar hash
 #
-c_parser.CParser(
-    lex_optimize=True,
-    yacc_debug=False,
-    yacc_optimize=True)
+_tables.build_tables()
 
 # Load to compile into .pyc
 #
@@ -0,0 +1,138 @@
+#-----------------------------------------------------------------
+# pycparser: _tables.py
+#
+# Loading and validation of the pre-generated lextab/yacctab
+# modules shipped with this package.
+#
+# The tables carry a hash of the grammar productions in c_parser.py
+# and the token rules in c_lexer.py. When the hash stored in the
+# tables does not match the current grammar, they are regenerated
+# (once) and stamped with the new hash.
+#-----------------------------------------------------------------
+import os
+import sys
+import hashlib
+import importlib
+
+from .ply import lex, yacc
+from .c_lexer import CLexer
+from .c_fastlexer import CFastLexer
+from .c_parser import CParser
+
+TABDIR = os.path.dirname(os.path.abspath(__file__))
+LEXTAB = 'pycparser.lextab'
+YACCTAB = 'pycparser.yacctab'
+
+# lexers make_parser can feed CParser with. Both produce the same token
+# stream, 'ply' is the table driven CLexer and the reference for 'fast'.
+LEXERS = {
+    'fast': CFastLexer,
+    'ply': CLexer,
+}
+
+
+def grammar_hash():
+    """ Returns a hex digest over everything the tables are built
+        from: the precedence table and productions of CParser, and
+        the token list and token rules of CLexer.
+    """
+    h = hashlib.sha256()
+    h.update(yacc.__tabversion__.encode())
+    h.update(lex.__tabversion__.encode())
+
+    h.update(repr(CParser.precedence).encode())
+    for name in sorted(dir(CParser)):
+        func = getattr(CParser, name)
+        if not name.startswith('p_') or not callable(func):
+            continue
+        # <rule>_opt productions are attached by _create_opt_rule on
+        # first instantiation, the rules they wrap are hashed already
+        if func.__qualname__.endswith('optrule'):
+            continue
+        h.update(name.encode())
+        h.update((func.__doc__ or '').encode())
+
+    h.update(' '.join(CLexer.tokens).encode())
+    h.update(repr(CLexer.states).encode())
+    for name in sorted(vars(CLexer)):
+        if not name.startswith('t_'):
+            continue
+        rule = getattr(CLexer, name)
+        if callable(rule):
+            rule = getattr(rule, 'regex', rule.__doc__)
+        h.update(name.encode())
+        h.update(str(rule).encode())
+
+    return h.hexdigest()
+
+
+def _stored_hash(tabmodule):
+    try:
+        module = importlib.import_module(tabmodule)
+    except ImportError:
+        return None
+    return getattr(module, '_grammar_hash', None)
+
+
+def tables_valid(digest=None):
+    """ True if both shipped tables were generated from the current
+        grammar.
+    """
+    digest = digest or grammar_hash()
+    return _stored_hash(LEXTAB) == digest and _stored_hash(YACCTAB) == digest
+
+
+def build_tables(digest=None):
+    """ Regenerates lextab.py and yacctab.py in the package directory,
+        stamps them with the grammar hash and returns the CParser that
+        was built along the way.
+    """
+    digest = digest or grammar_hash()
+
+    for tabmodule in (LEXTAB, YACCTAB):
+        sys.modules.pop(tabmodule, None)
+        path = os.path.join(TABDIR, tabmodule.split('.')[-1] + '.py')
+        if os.path.exists(path):
+            os.remove(path)
+    importlib.invalidate_caches()
+
+    # with no tables on disk, optimize mode builds them and writes them out
+    parser = CParser(
+        lex_optimize=True,
+        lextab=LEXTAB,
+        yacc_optimize=True,
+        yacctab=YACCTAB,
+        taboutputdir=TABDIR)
+
+    for tabmodule in (LEXTAB, YACCTAB):
+        path = os.path.join(TABDIR, tabmodule.split('.')[-1] + '.py')
+        with open(path, 'a') as f:
+            f.write('_grammar_hash = %r\n' % digest)
+        sys.modules.pop(tabmodule, None)
+
+    return parser
+
+
+def make_parser(lexer='fast'):
+    """ Returns a CParser backed by the validated tables, regenerating
+        them first if the grammar has changed since they were built.
+        lexer selects the token source, one of LEXERS.
+    """
+    lexer = LEXERS[lexer]
+    digest = grammar_hash()
+    if not tables_valid(digest):
+        try:
+            parser = build_tables(digest)
+        except OSError:
+            # read-only deployment: fall back to building in memory
+            return CParser(lex_optimize=False, lexer=lexer, yacc_optimize=False,
+                           yacctab=YACCTAB, taboutputdir=TABDIR)
+        if lexer is CLexer:
+            return parser
+
+    return CParser(
+        lex_optimize=True,
+        lexer=lexer,
+        lextab=LEXTAB,
+        yacc_optimize=True,
+        yacctab=YACCTAB)
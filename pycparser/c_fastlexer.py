@@ -0,0 +1,246 @@
+#------------------------------------------------------------------------------
+# pycparser: c_fastlexer.py
+#
+# CFastLexer class: a drop-in replacement for CLexer specialized for the
+# dialect we compile (preprocessed pcpp output, including __raw).
+#
+# It is built from the very same token regexes as CLexer, but matches them
+# with a single master regex straight from offsets into the input string:
+# whitespace is skipped by the regex instead of char by char, rules that only
+# return their token need no Python call, and tokens are small slotted
+# objects instead of ply LexTokens.
+#------------------------------------------------------------------------------
+import re
+
+from .c_lexer import CLexer
+
+
+class FastToken(object):
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'lexer')
+
+    def __init__(self, type, value, lineno, lexpos):
+        self.type = type
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+        self.lexer = None # set by token(), yacc reads it on a syntax error
+
+    def __str__(self):
+        return 'LexToken(%s,%r,%d,%d)' % (self.type, self.value, self.lineno, self.lexpos)
+
+    __repr__ = __str__
+
+
+class CFastLexer(object):
+    """ A lexer for the C language with the same interface as CLexer
+        (input(), token(), filename, last_token, ...), so CParser can
+        use it unchanged:
+
+            CParser(lexer=CFastLexer)
+    """
+    tokens = CLexer.tokens
+    keyword_map = CLexer.keyword_map
+
+    # Rules tried in the same order the ply master regex uses: function
+    # rules in definition order, then string rules longest regex first.
+    # PPHASH is handled separately since it drives the #line state.
+    _rules = [
+        ('NEWLINE', CLexer.t_NEWLINE.__doc__),
+        ('LBRACE', CLexer.t_LBRACE.regex),
+        ('RBRACE', CLexer.t_RBRACE.regex),
+        ('FLOAT_CONST', CLexer.floating_constant),
+        ('HEX_FLOAT_CONST', CLexer.hex_floating_constant),
+        ('INT_CONST_HEX', CLexer.hex_constant),
+        ('INT_CONST_BIN', CLexer.bin_constant),
+        ('BAD_CONST_OCT', CLexer.bad_octal_constant),
+        ('INT_CONST_OCT', CLexer.octal_constant),
+        ('INT_CONST_DEC', CLexer.decimal_constant),
+        ('INT_CONST_CHAR', CLexer.multicharacter_constant),
+        ('CHAR_CONST', CLexer.char_const),
+        ('WCHAR_CONST', CLexer.wchar_const),
+        ('UNMATCHED_QUOTE', CLexer.unmatched_quote),
+        ('BAD_CHAR_CONST', CLexer.bad_char_const),
+        ('WSTRING_LITERAL', CLexer.wstring_literal),
+        ('BAD_STRING_LITERAL', CLexer.bad_string_literal),
+        ('ID', CLexer.identifier),
+        ('STRING_LITERAL', CLexer.string_literal),
+    ]
+
+    # operators and delimiters, value -> token type
+    _operators = dict(
+        (re.sub(r'\\(.)', r'\1', getattr(CLexer, name)), name[2:])
+        for name in vars(CLexer)
+        if name.startswith('t_') and name[2:] in CLexer.tokens
+            and name not in ('t_STRING_LITERAL',)
+            and isinstance(getattr(CLexer, name), str))
+
+    _errors = {
+        'BAD_CONST_OCT': lambda value: 'Invalid octal constant',
+        'UNMATCHED_QUOTE': lambda value: "Unmatched '",
+        'BAD_CHAR_CONST': lambda value: 'Invalid char constant %s' % value,
+        'BAD_STRING_LITERAL': lambda value: 'String contains invalid escape code',
+    }
+
+    _master = re.compile(
+        r'[ \t]*(?:(?P<PPHASH>\#)|' +
+        '|'.join('(?P<%s>%s)' % rule for rule in _rules) +
+        '|(?P<OP>' + '|'.join(re.escape(op) for op in
+                              sorted(_operators, key=len, reverse=True)) + '))',
+        re.VERBOSE)
+
+    _ppline = re.compile(
+        r'[ \t]*(line)?[ \t]*(?P<line>' + CLexer.decimal_constant + r')' +
+        r'([ \t]*(?P<file>' + CLexer.string_literal + r'))?' +
+        r'([ \t]*(' + CLexer.decimal_constant + r'))*[ \t]*(\n|$)',
+        re.VERBOSE)
+
+    _pppragma = re.compile(r'[ \t]*(pragma)[ \t]*(?P<str>.+)?(\n|$)')
+
+    def __init__(self, error_func, on_lbrace_func, on_rbrace_func,
+                 type_lookup_func):
+        """ Create a new Lexer. Arguments are the same as for CLexer.
+        """
+        self.error_func = error_func
+        self.on_lbrace_func = on_lbrace_func
+        self.on_rbrace_func = on_rbrace_func
+        self.type_lookup_func = type_lookup_func
+        self.filename = ''
+        self.last_token = None
+
+        self.line_pattern = re.compile(r'([ \t]*line\W)|([ \t]*\d+)')
+        self.pragma_pattern = re.compile(r'[ \t]*pragma\W')
+
+        # CParser reaches the input through clex.lexer.lexdata
+        self.lexer = self
+        self.lexdata = ''
+        self.lexpos = 0
+        self.lineno = 1
+        self._pending = []
+
+    def build(self, **kwargs):
+        """ Nothing to build: the master regex is compiled once with the
+            class. Accepts (and ignores) the CLexer.build arguments.
+        """
+        pass
+
+    def reset_lineno(self):
+        self.lineno = 1
+
+    def input(self, text):
+        self.lexdata = text
+        self.lexpos = 0
+        self._pending = []
+
+    def token(self):
+        tok = self._token()
+        if tok is not None:
+            tok.lexer = self # as ply's LexToken
+        self.last_token = tok
+        return tok
+
+    def find_tok_column(self, token):
+        """ Find the column of the token in its line.
+        """
+        last_cr = self.lexdata.rfind('\n', 0, token.lexpos)
+        return token.lexpos - last_cr
+
+    ######################--   PRIVATE   --######################
+
+    def _token(self):
+        if self._pending:
+            return self._pending.pop(0)
+
+        data = self.lexdata
+        match = self._master.match
+        operators = self._operators
+        end = len(data)
+        pos = self.lexpos
+
+        while True:
+            m = match(data, pos)
+            if m is None:
+                while pos < end and data[pos] in ' \t':
+                    pos += 1
+                self.lexpos = pos
+                if pos >= end:
+                    return None
+                self._error('Illegal character %s' % repr(data[pos]), pos)
+                pos = self.lexpos
+                continue
+
+            kind = m.lastgroup
+            value = m.group(kind)
+            pos = m.end()
+            start = pos - len(value)
+
+            if kind == 'OP':
+                self.lexpos = pos
+                return FastToken(operators[value], value, self.lineno, start)
+
+            elif kind == 'ID':
+                self.lexpos = pos
+                typ = self.keyword_map.get(value, 'ID')
+                if typ == 'ID' and self.type_lookup_func(value):
+                    typ = 'TYPEID'
+                return FastToken(typ, value, self.lineno, start)
+
+            elif kind == 'NEWLINE':
+                self.lineno += len(value)
+
+            elif kind == 'PPHASH':
+                pos = self._pphash(start, pos)
+                if pos is None:
+                    self.lexpos = start + 1
+                    return FastToken('PPHASH', value, self.lineno, start)
+                if self._pending:
+                    self.lexpos = pos
+                    return self._pending.pop(0)
+
+            elif kind in self._errors:
+                self.lexpos = pos
+                self._error(self._errors[kind](value), start)
+                pos = self.lexpos
+
+            else:
+                self.lexpos = pos
+                tok = FastToken(kind, value, self.lineno, start)
+                if kind == 'LBRACE':
+                    self.on_lbrace_func()
+                elif kind == 'RBRACE':
+                    self.on_rbrace_func()
+                return tok
+
+    def _pphash(self, start, pos):
+        """ Handles #line and #pragma directives starting after the '#' at
+            pos. Returns the position after the directive, or None if the
+            '#' is a plain PPHASH token.
+        """
+        data = self.lexdata
+        if self.line_pattern.match(data, pos):
+            m = self._ppline.match(data, pos)
+            if m is None:
+                self.lexpos = pos
+                self._error('invalid #line directive', pos)
+                return data.find('\n', pos) + 1 or len(data)
+            self.lineno = int(m.group('line'))
+            if m.group('file') is not None:
+                self.filename = m.group('file').lstrip('"').rstrip('"')
+            return m.end()
+
+        elif self.pragma_pattern.match(data, pos):
+            m = self._pppragma.match(data, pos)
+            self._pending.append(FastToken('PPPRAGMA', 'pragma', self.lineno, m.start(1)))
+            if m.group('str') is not None:
+                self._pending.append(FastToken('PPPRAGMASTR', m.group('str'), self.lineno, m.start('str')))
+            if m.group(3) == '\n':
+                self.lineno += 1
+            return m.end()
+
+        return None
+
+    def _error(self, msg, lexpos):
+        # like CLexer, report at the token start and resume one char past
+        # the current position
+        last_cr = self.lexdata.rfind('\n', 0, lexpos)
+        self.error_func(msg, self.lineno, lexpos - last_cr)
+        self.lexpos += 1
@@ -129,7 +129,7 @@ class CParser(PLYParser):
         # Keeps track of the last token given to yacc (the lookahead token)
         self._last_yielded_token = None
 
-    def parse(self, text, filename='', debuglevel=0):
+    def parse(self, text, filename='', debuglevel=0, scope=None):
         """ Parses C code and returns an AST.
 
             text:
@@ -141,16 +141,26 @@ class CParser(PLYParser):
 
             debuglevel:
                 Debug level to yacc
+
+            scope:
+                File scope to start from, as returned by file_scope()
+                after parsing the code preceding text
         """
         self.clex.filename = filename
         self.clex.reset_lineno()
-        self._scope_stack = [dict()]
+        self._scope_stack = [dict(scope or ())]
         self._last_yielded_token = None
         return self.cparser.parse(
                 input=text,
                 lexer=self.clex,
                 debug=debuglevel)
 
+    def file_scope(self):
+        """ Returns a copy of the file scope (names declared at the top
+            level and whether they are types) left by the last parse.
+        """
+        return dict(self._scope_stack[0])
+
     ######################--   PRIVATE   --######################
 
     def _push_scope(self):
@@ -1,341 +0,0 @@
-
-# yacctab.py
-# This file is automatically generated. Do not edit.
-_tabversion = '3.10'
-
-_lr_method = 'LALR'
-
-_lr_signature = 'translation_unit_or_emptyleftLORleftLANDleftORleftXORleftANDleftEQNEleftGTGELTLEleftRSHIFTLSHIFTleftPLUSMINUSleftTIMESDIVIDEMOD_BOOL _COMPLEX AUTO BREAK CASE CHAR CONST CONTINUE DEFAULT DO DOUBLE ELSE ENUM EXTERN FLOAT FOR GOTO IF INLINE INT LONG REGISTER OFFSETOF RESTRICT RETURN SHORT SIGNED SIZEOF STATIC STRUCT SWITCH TYPEDEF UNION UNSIGNED VOID VOLATILE WHILE __INT128 __RAW ID TYPEID INT_CONST_DEC INT_CONST_OCT INT_CONST_HEX INT_CONST_BIN INT_CONST_CHAR FLOAT_CONST HEX_FLOAT_CONST CHAR_CONST WCHAR_CONST STRING_LITERAL WSTRING_LITERAL PLUS MINUS TIMES DIVIDE MOD OR AND NOT XOR LSHIFT RSHIFT LOR LAND LNOT LT LE GT GE EQ NE EQUALS TIMESEQUAL DIVEQUAL MODEQUAL PLUSEQUAL MINUSEQUAL LSHIFTEQUAL RSHIFTEQUAL ANDEQUAL XOREQUAL OREQUAL PLUSPLUS MINUSMINUS ARROW CONDOP LPAREN RPAREN LBRACKET RBRACKET LBRACE RBRACE COMMA PERIOD SEMI COLON ELLIPSIS PPHASH PPPRAGMA PPPRAGMASTRabstract_declarator_opt : empty\n| abstract_declaratorassignment_expression_opt : empty\n| assignment_expressionblock_item_list_opt : empty\n| block_item_listdeclaration_list_opt : empty\n| declaration_listdeclaration_specifiers_no_type_opt : empty\n| declaration_specifiers_no_typedesignation_opt : empty\n| designationexpression_opt : empty\n| expressionid_init_declarator_list_opt : empty\n| id_init_declarator_listidentifier_list_opt : empty\n| identifier_listinit_declarator_list_opt : empty\n| init_declarator_listinitializer_list_opt : empty\n| initializer_listparameter_type_list_opt : empty\n| parameter_type_liststruct_declarator_list_opt : empty\n| struct_declarator_listtype_qualifier_list_opt : empty\n| type_qualifier_list direct_id_declarator   : ID\n         direct_id_declarator   : LPAREN id_declarator RPAREN\n         direct_id_declarator   : direct_id_declarator LBRACKET type_qualifier_list_opt assignment_expression_opt RBRACKET\n         direct_id_declarator   : direct_id_declarator LBRACKET STATIC type_qualifier_list_opt assignment_expression RBRACKET\n                                    | direct_id_declarator LBRACKET type_qualifier_list STATIC assignment_expression RBRACKET\n         direct_id_declarator   : direct_id_declarator LBRACKET type_qualifier_list_opt TIMES RBRACKET\n         direct_id_declarator   : direct_id_declarator LPAREN parameter_type_list RPAREN\n                                    | direct_id_declarator LPAREN identifier_list_opt RPAREN\n         direct_typeid_declarator   : TYPEID\n         direct_typeid_declarator   : LPAREN typeid_declarator RPAREN\n         direct_typeid_declarator   : direct_typeid_declarator LBRACKET type_qualifier_list_opt assignment_expression_opt RBRACKET\n         direct_typeid_declarator   : direct_typeid_declarator LBRACKET STATIC type_qualifier_list_opt assignment_expression RBRACKET\n                                    | direct_typeid_declarator LBRACKET type_qualifier_list STATIC assignment_expression RBRACKET\n         direct_typeid_declarator   : direct_typeid_declarator LBRACKET type_qualifier_list_opt TIMES RBRACKET\n         direct_typeid_declarator   : direct_typeid_declarator LPAREN parameter_type_list RPAREN\n                                    | direct_typeid_declarator LPAREN identifier_list_opt RPAREN\n         direct_typeid_noparen_declarator   : TYPEID\n         direct_typeid_noparen_declarator   : direct_typeid_noparen_declarator LBRACKET type_qualifier_list_opt assignment_expression_opt RBRACKET\n         direct_typeid_noparen_declarator   : direct_typeid_noparen_declarator LBRACKET STATIC type_qualifier_list_opt assignment_expression RBRACKET\n                                    | direct_typeid_noparen_declarator LBRACKET type_qualifier_list STATIC assignment_expression RBRACKET\n         direct_typeid_noparen_declarator   : direct_typeid_noparen_declarator LBRACKET type_qualifier_list_opt TIMES RBRACKET\n         direct_typeid_noparen_declarator   : direct_typeid_noparen_declarator LPAREN parameter_type_list RPAREN\n                                    | direct_typeid_noparen_declarator LPAREN identifier_list_opt RPAREN\n         id_declarator  : direct_id_declarator\n         id_declarator  : pointer direct_id_declarator\n         typeid_declarator  : direct_typeid_declarator\n         typeid_declarator  : pointer direct_typeid_declarator\n         typeid_noparen_declarator  : direct_typeid_noparen_declarator\n         typeid_noparen_declarator  : pointer direct_typeid_noparen_declarator\n         translation_unit_or_empty   : translation_unit\n                                        | empty\n         translation_unit    : external_declaration\n         translation_unit    : translation_unit external_declaration\n         external_declaration    : function_definition\n         external_declaration    : declaration\n         external_declaration    : pp_directive\n                                    | pppragma_directive\n         external_declaration    : SEMI\n         pp_directive  : PPHASH\n         pppragma_directive      : PPPRAGMA\n                                    | PPPRAGMA PPPRAGMASTR\n         function_definition : id_declarator declaration_list_opt compound_statement\n         function_definition : declaration_specifiers id_declarator declaration_list_opt compound_statement\n         statement   : labeled_statement\n                        | expression_statement\n                        | compound_statement\n                        | selection_statement\n                        | iteration_statement\n                        | jump_statement\n                        | pppragma_directive\n         pragmacomp_or_statement     : pppragma_directive statement\n                                        | statement\n         decl_body : declaration_specifiers init_declarator_list_opt\n                      | declaration_specifiers_no_type id_init_declarator_list_opt\n         declaration : decl_body SEMI\n         declaration_list    : declaration\n                                | declaration_list declaration\n         declaration_specifiers_no_type  : type_qualifier declaration_specifiers_no_type_opt\n         declaration_specifiers_no_type  : storage_class_specifier declaration_specifiers_no_type_opt\n         declaration_specifiers_no_type  : function_specifier declaration_specifiers_no_type_opt\n         declaration_specifiers  : declaration_specifiers type_qualifier\n         declaration_specifiers  : declaration_specifiers storage_class_specifier\n         declaration_specifiers  : declaration_specifiers function_specifier\n         declaration_specifiers  : declaration_specifiers type_specifier_no_typeid\n         declaration_specifiers  : type_specifier\n         declaration_specifiers  : declaration_specifiers_no_type type_specifier\n         storage_class_specifier : AUTO\n                                    | REGISTER\n                                    | STATIC\n                                    | EXTERN\n                                    | TYPEDEF\n         function_specifier  : INLINE\n         type_specifier_no_typeid  : VOID\n                                      | _BOOL\n                                      | CHAR\n                                      | SHORT\n                                      | INT\n                                      | LONG\n                                      | FLOAT\n                                      | DOUBLE\n                                      | _COMPLEX\n                                      | SIGNED\n                                      | UNSIGNED\n                                      | __INT128\n         type_specifier  : typedef_name\n                            | enum_specifier\n                            | struct_or_union_specifier\n                            | type_specifier_no_typeid\n         type_qualifier  : CONST\n                            | RESTRICT\n                            | VOLATILE\n         init_declarator_list    : init_declarator\n                                    | init_declarator_list COMMA init_declarator\n         init_declarator : declarator\n                            | declarator EQUALS initializer\n         id_init_declarator_list    : id_init_declarator\n                                       | id_init_declarator_list COMMA init_declarator\n         id_init_declarator : id_declarator\n                               | id_declarator EQUALS initializer\n         specifier_qualifier_list    : specifier_qualifier_list type_specifier_no_typeid\n         specifier_qualifier_list    : specifier_qualifier_list type_qualifier\n         specifier_qualifier_list  : type_specifier\n         specifier_qualifier_list  : type_qualifier_list type_specifier\n         struct_or_union_specifier   : struct_or_union ID\n                                        | struct_or_union TYPEID\n         struct_or_union_specifier : struct_or_union brace_open struct_declaration_list brace_close\n                                      | struct_or_union brace_open brace_close\n         struct_or_union_specifier   : struct_or_union ID brace_open struct_declaration_list brace_close\n                                        | struct_or_union ID brace_open brace_close\n                                        | struct_or_union TYPEID brace_open struct_declaration_list brace_close\n                                        | struct_or_union TYPEID brace_open brace_close\n         struct_or_union : STRUCT\n                            | UNION\n         struct_declaration_list     : struct_declaration\n                                        | struct_declaration_list struct_declaration\n         struct_declaration : specifier_qualifier_list struct_declarator_list_opt SEMI\n         struct_declaration : SEMI\n         struct_declaration : pppragma_directive\n         struct_declarator_list  : struct_declarator\n                                    | struct_declarator_list COMMA struct_declarator\n         struct_declarator : declarator\n         struct_declarator   : declarator COLON constant_expression\n                                | COLON constant_expression\n         enum_specifier  : ENUM ID\n                            | ENUM TYPEID\n         enum_specifier  : ENUM brace_open enumerator_list brace_close\n         enum_specifier  : ENUM ID brace_open enumerator_list brace_close\n                            | ENUM TYPEID brace_open enumerator_list brace_close\n         enumerator_list : enumerator\n                            | enumerator_list COMMA\n                            | enumerator_list COMMA enumerator\n         enumerator  : ID\n                        | ID EQUALS constant_expression\n         declarator  : id_declarator\n                        | typeid_declarator\n         pointer : TIMES type_qualifier_list_opt\n                    | TIMES type_qualifier_list_opt pointer\n         type_qualifier_list : type_qualifier\n                                | type_qualifier_list type_qualifier\n         parameter_type_list : parameter_list\n                                | parameter_list COMMA ELLIPSIS\n         parameter_list  : parameter_declaration\n                            | parameter_list COMMA parameter_declaration\n         parameter_declaration   : declaration_specifiers id_declarator\n                                    | declaration_specifiers typeid_noparen_declarator\n         parameter_declaration   : declaration_specifiers abstract_declarator_opt\n         identifier_list : identifier\n                            | identifier_list COMMA identifier\n         initializer : assignment_expression\n         initializer : brace_open initializer_list_opt brace_close\n                        | brace_open initializer_list COMMA brace_close\n         initializer_list    : designation_opt initializer\n                                | initializer_list COMMA designation_opt initializer\n         designation : designator_list EQUALS\n         designator_list : designator\n                            | designator_list designator\n         designator  : LBRACKET constant_expression RBRACKET\n                        | PERIOD identifier\n         type_name   : specifier_qualifier_list abstract_declarator_opt\n         abstract_declarator     : pointer\n         abstract_declarator     : pointer direct_abstract_declarator\n         abstract_declarator     : direct_abstract_declarator\n         direct_abstract_declarator  : LPAREN abstract_declarator RPAREN  direct_abstract_declarator  : direct_abstract_declarator LBRACKET assignment_expression_opt RBRACKET\n         direct_abstract_declarator  : LBRACKET type_qualifier_list_opt assignment_expression_opt RBRACKET\n         direct_abstract_declarator  : direct_abstract_declarator LBRACKET TIMES RBRACKET\n         direct_abstract_declarator  : LBRACKET TIMES RBRACKET\n         direct_abstract_declarator  : direct_abstract_declarator LPAREN parameter_type_list_opt RPAREN\n         direct_abstract_declarator  : LPAREN parameter_type_list_opt RPAREN\n         block_item  : declaration\n                        | statement\n         block_item_list : block_item\n                            | block_item_list block_item\n         compound_statement : brace_open block_item_list_opt brace_close  labeled_statement : ID COLON pragmacomp_or_statement  labeled_statement : CASE constant_expression COLON pragmacomp_or_statement  labeled_statement : DEFAULT COLON pragmacomp_or_statement  selection_statement : IF LPAREN expression RPAREN pragmacomp_or_statement  selection_statement : IF LPAREN expression RPAREN statement ELSE pragmacomp_or_statement  selection_statement : SWITCH LPAREN expression RPAREN pragmacomp_or_statement  iteration_statement : WHILE LPAREN expression RPAREN pragmacomp_or_statement  iteration_statement : DO pragmacomp_or_statement WHILE LPAREN expression RPAREN SEMI  iteration_statement : FOR LPAREN expression_opt SEMI expression_opt SEMI expression_opt RPAREN pragmacomp_or_statement  iteration_statement : FOR LPAREN declaration expression_opt SEMI expression_opt RPAREN pragmacomp_or_statement  jump_statement  : GOTO ID SEMI  jump_statement  : BREAK SEMI  jump_statement  : CONTINUE SEMI  jump_statement  : RETURN expression SEMI\n                            | RETURN SEMI\n         expression_statement : expression_opt SEMI  expression  : assignment_expression\n                        | expression COMMA assignment_expression\n         typedef_name : TYPEID  assignment_expression   : conditional_expression\n                                    | unary_expression assignment_operator assignment_expression\n         assignment_operator : EQUALS\n                                | XOREQUAL\n                                | TIMESEQUAL\n                                | DIVEQUAL\n                                | MODEQUAL\n                                | PLUSEQUAL\n                                | MINUSEQUAL\n                                | LSHIFTEQUAL\n                                | RSHIFTEQUAL\n                                | ANDEQUAL\n                                | OREQUAL\n         constant_expression : conditional_expression  conditional_expression  : binary_expression\n                                    | binary_expression CONDOP expression COLON conditional_expression\n         binary_expression   : cast_expression\n                                | binary_expression TIMES binary_expression\n                                | binary_expression DIVIDE binary_expression\n                                | binary_expression MOD binary_expression\n                                | binary_expression PLUS binary_expression\n                                | binary_expression MINUS binary_expression\n                                | binary_expression RSHIFT binary_expression\n                                | binary_expression LSHIFT binary_expression\n                                | binary_expression LT binary_expression\n                                | binary_expression LE binary_expression\n                                | binary_expression GE binary_expression\n                                | binary_expression GT binary_expression\n                                | binary_expression EQ binary_expression\n                                | binary_expression NE binary_expression\n                                | binary_expression AND binary_expression\n                                | binary_expression OR binary_expression\n                                | binary_expression XOR binary_expression\n                                | binary_expression LAND binary_expression\n                                | binary_expression LOR binary_expression\n         cast_expression : unary_expression  cast_expression : LPAREN type_name RPAREN cast_expression  unary_expression    : postfix_expression  unary_expression    : PLUSPLUS unary_expression\n                                | MINUSMINUS unary_expression\n                                | unary_operator cast_expression\n         unary_expression    : SIZEOF unary_expression\n                                | SIZEOF LPAREN type_name RPAREN\n         unary_operator  : AND\n                            | TIMES\n                            | PLUS\n                            | MINUS\n                            | NOT\n                            | LNOT\n         postfix_expression  : primary_expression  postfix_expression  : postfix_expression LBRACKET expression RBRACKET  postfix_expression  : postfix_expression LPAREN argument_expression_list RPAREN\n                                | postfix_expression LPAREN RPAREN\n         postfix_expression  : postfix_expression PERIOD ID\n                                | postfix_expression PERIOD TYPEID\n                                | postfix_expression ARROW ID\n                                | postfix_expression ARROW TYPEID\n         postfix_expression  : postfix_expression PLUSPLUS\n                                | postfix_expression MINUSMINUS\n         postfix_expression  : LPAREN type_name RPAREN brace_open initializer_list brace_close\n                                | LPAREN type_name RPAREN brace_open initializer_list COMMA brace_close\n         postfix_expression  : __RAW LPAREN type_name COMMA STRING_LITERAL COMMA constant_expression RPAREN\n                                | __RAW LPAREN type_name COMMA STRING_LITERAL COMMA constant_expression COMMA argument_expression_list RPAREN\n         primary_expression  : identifier  primary_expression  : constant  primary_expression  : unified_string_literal\n                                | unified_wstring_literal\n         primary_expression  : LPAREN expression RPAREN  primary_expression  : OFFSETOF LPAREN type_name COMMA offsetof_member_designator RPAREN\n         offsetof_member_designator : identifier\n                                         | offsetof_member_designator PERIOD identifier\n                                         | offsetof_member_designator LBRACKET expression RBRACKET\n         argument_expression_list    : assignment_expression\n                                        | argument_expression_list COMMA assignment_expression\n         identifier  : ID  constant    : INT_CONST_DEC\n                        | INT_CONST_OCT\n                        | INT_CONST_HEX\n                        | INT_CONST_BIN\n                        | INT_CONST_CHAR\n         constant    : FLOAT_CONST\n                        | HEX_FLOAT_CONST\n         constant    : CHAR_CONST\n                        | WCHAR_CONST\n         unified_string_literal  : STRING_LITERAL\n                                    | unified_string_literal STRING_LITERAL\n         unified_wstring_literal : WSTRING_LITERAL\n                                    | unified_wstring_literal WSTRING_LITERAL\n         brace_open  :   LBRACE\n         brace_close :   RBRACE\n        empty : '
-    
-_lr_action_items = {'$end':([0,1,2,3,4,5,6,7,8,9,13,14,55,77,78,105,144,212,266,],[-312,0,-58,-59,-60,-62,-63,-64,-65,-66,-67,-68,-61,-83,-69,-70,-311,-71,-202,]),'SEMI':([0,2,4,5,6,7,8,9,11,12,13,14,15,17,18,19,20,21,22,23,25,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,60,61,62,63,64,65,66,67,69,70,72,73,74,75,76,77,78,81,82,83,84,85,86,87,88,89,90,91,92,98,99,101,102,103,104,105,106,108,110,127,131,139,140,141,142,143,144,145,146,147,148,151,152,153,154,155,156,157,158,159,160,161,162,163,166,169,172,175,176,177,178,179,180,181,182,186,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,229,230,244,245,248,251,252,253,254,255,256,257,258,259,260,261,262,263,265,266,267,268,269,271,272,274,275,284,285,286,287,288,289,290,291,327,328,329,331,332,333,336,337,352,353,354,355,374,375,378,379,380,383,384,385,387,390,394,398,399,400,401,402,403,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,425,427,428,429,430,435,442,443,446,447,460,461,462,464,466,467,468,470,471,473,474,477,480,484,485,496,497,499,500,502,504,514,515,517,521,526,527,528,530,534,535,537,539,541,],[9,9,-60,-62,-63,-64,-65,-66,-312,77,-67,-68,-52,-312,-312,-312,-116,-93,-312,-29,-97,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-61,-312,-312,-162,-89,-90,-91,-92,-81,-19,-20,-120,-122,-163,-54,-37,-83,-69,-53,-86,-9,-10,-87,-88,-94,-82,-15,-16,-124,-126,-152,-153,-310,-132,-133,146,-70,-312,-162,-55,-296,-30,146,146,146,-135,-142,-311,-312,-145,-146,-130,-13,-312,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,-296,275,-14,-312,288,289,291,-219,-222,-257,-236,-259,-238,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-71,-121,-38,-123,-177,-35,-36,-125,-127,-154,146,-137,146,-139,-134,-143,380,-128,-129,-25,-26,-147,-149,-131,-202,-201,-13,-312,-235,-257,-312,-218,-78,-80,-312,401,-214,-215,402,-217,-279,-280,-260,-261,-262,-263,-307,-309,-43,-44,-31,-34,-155,-156,-136,-138,-144,-151,-203,-312,-205,-289,-220,-79,470,-312,-213,-216,-223,-239,-240,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-274,-275,-276,-277,-278,-178,-39,-42,-32,-33,-148,-150,-204,-312,-258,-312,-312,-312,503,-272,-273,-264,-179,-40,-41,-206,-80,-208,-209,518,-237,-312,-281,528,-290,-207,-282,-210,-312,-312,-212,-283,-211,-284,]),'PPHASH':([0,2,4,5,6,7,8,9,13,14,55,77,78,105,144,212,266,],[13,13,-60,-62,-63,-64,-65,-66,-67,-68,-61,-83,-69,-70,-311,-71,-202,]),'PPPRAGMA':([0,2,4,5,6,7,8,9,13,14,55,77,78,101,104,105,106,139,140,141,143,144,146,147,152,153,154,155,156,157,158,159,160,161,162,172,212,251,253,256,266,267,269,274,275,284,285,288,289,291,380,384,385,387,398,401,402,462,464,467,468,496,497,499,500,514,526,528,530,534,535,539,],[14,14,-60,-62,-63,-64,-65,-66,-67,-68,-61,-83,-69,-310,14,-70,14,14,14,14,-142,-311,-145,-146,14,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,14,-71,14,14,-143,-202,-201,14,14,-218,14,-80,-214,-215,-217,-144,-203,14,-205,-79,-213,-216,-204,14,14,14,-206,-80,-208,-209,14,-207,-210,14,14,-212,-211,]),'ID':([0,2,4,5,6,7,8,9,11,13,14,16,17,18,19,20,21,22,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,60,61,63,64,65,66,68,71,77,78,79,80,82,83,84,85,86,87,94,95,96,97,98,99,100,101,102,103,105,106,111,113,114,115,116,117,118,126,129,130,132,133,134,135,142,144,145,148,152,153,154,155,156,157,158,159,160,161,162,164,168,172,174,177,183,184,185,187,188,189,190,191,195,196,212,217,218,219,220,224,227,228,232,236,240,241,248,249,250,252,254,255,258,259,264,265,266,267,269,273,274,275,276,280,281,282,284,285,286,288,289,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,330,334,341,342,343,346,347,349,350,351,363,364,367,370,372,374,375,378,379,381,382,384,385,387,389,398,400,401,402,436,438,448,449,450,458,462,463,464,465,467,468,469,470,472,475,479,481,482,487,488,489,496,497,499,500,503,514,516,518,520,522,523,526,528,530,534,535,536,539,],[23,23,-60,-62,-63,-64,-65,-66,23,-67,-68,23,-312,-312,-312,-116,-93,23,23,-97,-312,-113,-114,-115,-221,98,102,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-140,-141,-61,23,23,-89,-90,-91,-92,23,23,-83,-69,-312,127,-86,-9,-10,-87,-88,-94,-164,-27,-28,-166,-152,-153,138,-310,-132,-133,-70,163,23,127,-312,127,127,-312,-28,23,23,127,-165,-167,138,138,-135,-311,23,-130,163,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,127,127,163,287,127,127,127,127,127,-266,-267,-268,-265,-269,-270,-71,-312,127,-312,-28,-266,127,127,127,23,23,-312,-154,138,127,-137,-139,-134,-128,-129,127,-131,-202,-201,163,127,163,-218,127,127,127,127,163,-80,127,-214,-215,-217,127,-224,-225,-226,-227,-228,-229,-230,-231,-232,-233,-234,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,427,429,127,127,-11,127,-12,127,127,-266,127,127,-312,127,23,127,127,-155,-156,-136,-138,23,127,-203,163,-205,127,-79,127,-213,-216,-312,-182,127,-312,-28,-266,-204,127,163,-312,163,163,127,127,127,127,127,127,-11,-266,127,127,-206,-80,-208,-209,127,163,-312,127,127,127,127,-207,-210,163,163,-212,127,-211,]),'LPAREN':([0,2,4,5,6,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,60,61,63,64,65,66,68,71,75,76,77,78,79,81,82,83,84,85,86,87,94,95,96,97,98,99,101,102,103,105,106,110,111,113,114,116,117,118,126,127,129,130,131,132,133,142,144,145,148,152,153,154,155,156,157,158,159,160,161,162,163,164,167,168,170,171,172,173,177,182,183,184,185,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,214,217,218,219,220,224,227,228,229,230,236,237,240,241,242,243,248,250,252,254,255,258,259,264,265,266,267,269,273,274,275,276,279,280,281,282,284,285,286,288,289,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,327,328,330,334,336,337,341,342,343,346,349,350,351,352,353,354,355,361,362,363,367,370,372,374,375,378,379,381,382,384,385,387,389,390,392,393,397,398,400,401,402,425,427,428,429,430,436,438,442,443,446,447,448,449,450,453,454,456,458,462,463,464,465,467,468,469,470,472,473,474,475,481,482,484,485,487,488,489,490,491,492,493,494,495,496,497,499,500,503,510,511,514,515,516,518,520,521,523,524,525,526,527,528,530,534,535,536,537,539,541,],[24,24,-60,-62,-63,-64,-65,-66,71,-67,-68,80,24,-312,-312,-312,-116,-93,24,-29,24,-97,-312,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-61,71,24,-89,-90,-91,-92,71,71,115,-37,-83,-69,-312,80,-86,-9,-10,-87,-88,-94,-164,-27,-28,-166,-152,-153,-310,-132,-133,-70,168,115,71,168,-312,168,-312,-28,240,-296,71,168,-30,-165,-167,-135,-311,71,-130,168,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,-296,273,276,168,281,282,168,286,168,324,330,330,273,334,-266,-267,-268,-265,-271,335,-306,-269,-270,-285,-286,-287,-288,338,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-71,-38,-312,168,-312,-28,-266,168,168,-35,-36,240,364,240,-312,-45,373,-154,273,-137,-139,-134,-128,-129,273,-131,-202,-201,168,168,168,-218,168,393,168,168,168,168,-80,168,-214,-215,-217,168,-224,-225,-226,-227,-228,-229,-230,-231,-232,-233,-234,168,273,273,273,273,273,273,273,273,273,273,273,273,273,273,273,273,273,273,168,168,-279,-280,168,168,-307,-309,-11,168,-12,273,-266,168,168,-43,-44,-31,-34,364,373,-312,240,168,168,-155,-156,-136,-138,71,273,-203,168,-205,273,-289,393,393,469,-79,168,-213,-216,-274,-275,-276,-277,-278,-312,-182,-39,-42,-32,-33,168,-312,-28,-191,-197,-195,-266,-204,273,168,-312,168,168,168,168,273,-272,-273,168,168,-11,-40,-41,-266,168,168,-50,-51,-193,-192,-194,-196,-206,-80,-208,-209,168,-46,-49,168,-281,-312,168,273,-290,168,-47,-48,-207,-282,-210,168,168,-212,168,-283,-211,-284,]),'TIMES':([0,2,4,5,6,7,8,9,11,13,14,17,18,19,20,21,22,24,25,26,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,60,61,63,64,65,66,71,77,78,79,82,83,84,85,86,87,94,95,96,97,98,99,101,102,103,105,106,111,113,114,116,117,118,126,127,129,130,133,142,144,145,148,152,153,154,155,156,157,158,159,160,161,162,163,164,168,172,177,180,181,182,183,184,185,186,187,188,189,190,191,192,194,195,196,197,198,199,200,202,203,204,205,206,207,208,209,210,211,212,217,218,219,220,224,227,228,240,241,248,250,252,254,255,258,259,264,265,266,267,269,272,273,274,275,276,279,280,281,282,284,285,286,288,289,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,327,328,329,330,331,332,333,334,336,337,341,342,343,346,349,350,351,363,370,372,374,375,378,379,381,382,384,385,387,389,390,393,398,400,401,402,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,425,427,428,429,430,436,438,448,449,450,458,462,463,464,465,466,467,468,469,470,472,473,474,475,477,481,482,487,488,489,496,497,499,500,503,514,515,516,518,520,521,523,526,527,528,530,534,535,536,537,539,541,],[26,26,-60,-62,-63,-64,-65,-66,26,-67,-68,-312,-312,-312,-116,-93,26,26,-97,-312,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-61,26,26,-89,-90,-91,-92,26,-83,-69,-312,-86,-9,-10,-87,-88,-94,26,-27,-28,-166,-152,-153,-310,-132,-133,-70,188,26,188,-312,224,-312,-28,26,-296,26,188,-167,-135,-311,26,-130,188,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,-296,188,188,188,188,-257,305,-259,188,188,188,-238,188,-266,-267,-268,-265,-271,-306,-269,-270,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-71,-312,349,-312,-28,-266,188,188,26,371,-154,188,-137,-139,-134,-128,-129,188,-131,-202,-201,188,-257,188,188,-218,188,26,188,188,188,188,-80,188,-214,-215,-217,188,-224,-225,-226,-227,-228,-229,-230,-231,-232,-233,-234,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,-279,-280,-260,188,-261,-262,-263,188,-307,-309,-11,188,-12,188,-266,188,188,-312,188,458,-155,-156,-136,-138,26,188,-203,188,-205,188,-289,26,-79,188,-213,-216,-239,-240,-241,305,305,305,305,305,305,305,305,305,305,305,305,305,305,305,-274,-275,-276,-277,-278,-312,-182,487,-312,-28,-266,-204,188,188,-312,-258,188,188,188,188,188,-272,-273,188,-264,188,-11,-266,188,188,-206,-80,-208,-209,188,188,-281,-312,188,188,-290,188,-207,-282,-210,188,188,-212,188,-283,-211,-284,]),'TYPEID':([0,2,4,5,6,7,8,9,10,11,13,14,15,17,18,19,20,21,22,23,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,58,59,60,61,62,63,64,65,66,68,71,77,78,80,81,82,83,84,85,86,87,94,95,96,97,98,99,101,102,103,104,105,106,107,111,115,126,128,129,131,132,133,139,140,141,142,143,144,145,146,147,148,149,152,153,154,155,156,157,158,159,160,161,162,168,212,229,230,231,236,240,248,251,252,253,254,255,256,258,259,265,266,267,273,275,284,285,286,288,289,291,325,326,330,334,335,338,354,355,364,373,374,375,378,379,380,381,384,387,393,398,401,402,446,447,462,496,497,499,500,526,528,535,539,],[30,30,-60,-62,-63,-64,-65,-66,30,76,-67,-68,-52,-312,-312,-312,-116,-93,30,-29,-97,-312,-113,-114,-115,-221,99,103,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-140,-141,-61,30,-84,76,30,30,-89,-90,-91,-92,76,76,-83,-69,30,-53,-86,-9,-10,-87,-88,-94,-164,-27,-28,-166,-152,-153,-310,-132,-133,30,-70,30,-85,76,30,242,30,76,-30,-165,-167,30,30,30,-135,-142,-311,76,-145,-146,-130,30,30,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,30,-71,-35,-36,30,242,30,-154,30,-137,30,-139,-134,-143,-128,-129,-131,-202,-201,30,-218,-78,-80,30,-214,-215,-217,428,430,30,30,30,30,-31,-34,30,30,-155,-156,-136,-138,-144,76,-203,-205,30,-79,-213,-216,-32,-33,-204,-206,-80,-208,-209,-207,-210,-212,-211,]),'ENUM':([0,2,4,5,6,7,8,9,10,13,14,15,17,18,19,22,23,25,45,46,47,48,49,50,51,52,55,58,59,61,62,77,78,80,81,82,83,84,85,86,97,101,104,105,106,107,115,128,131,133,139,140,141,143,144,146,147,149,152,153,154,155,156,157,158,159,160,161,162,168,212,229,230,231,240,251,253,256,266,267,273,275,284,285,286,288,289,291,330,334,335,338,354,355,364,373,380,384,387,393,398,401,402,446,447,462,496,497,499,500,526,528,535,539,],[31,31,-60,-62,-63,-64,-65,-66,31,-67,-68,-52,-312,-312,-312,31,-29,-97,-117,-118,-119,-95,-96,-98,-99,-100,-61,31,-84,31,31,-83,-69,31,-53,-86,-9,-10,-87,-88,-166,-310,31,-70,31,-85,31,31,-30,-167,31,31,31,-142,-311,-145,-146,31,31,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,31,-71,-35,-36,31,31,31,31,-143,-202,-201,31,-218,-78,-80,31,-214,-215,-217,31,31,31,31,-31,-34,31,31,-144,-203,-205,31,-79,-213,-216,-32,-33,-204,-206,-80,-208,-209,-207,-210,-212,-211,]),'VOID':([0,2,4,5,6,7,8,9,10,11,13,14,15,17,18,19,20,21,22,23,25,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,58,59,60,61,62,63,64,65,66,77,78,80,81,82,83,84,85,86,87,97,98,99,101,102,103,104,105,106,107,115,126,128,131,133,139,140,141,142,143,144,145,146,147,148,149,152,153,154,155,156,157,158,159,160,161,162,168,212,229,230,231,240,248,251,252,253,254,255,256,258,259,265,266,267,273,275,279,284,285,286,288,289,291,330,334,335,338,354,355,364,373,374,375,378,379,380,384,387,393,398,401,402,446,447,462,496,497,499,500,526,528,535,539,],[33,33,-60,-62,-63,-64,-65,-66,33,33,-67,-68,-52,-312,-312,-312,-116,-93,33,-29,-97,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-61,33,-84,33,33,33,-89,-90,-91,-92,-83,-69,33,-53,-86,-9,-10,-87,-88,-94,-166,-152,-153,-310,-132,-133,33,-70,33,-85,33,33,33,-30,-167,33,33,33,-135,-142,-311,33,-145,-146,-130,33,33,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,33,-71,-35,-36,33,33,-154,33,-137,33,-139,-134,-143,-128,-129,-131,-202,-201,33,-218,33,-78,-80,33,-214,-215,-217,33,33,33,33,-31,-34,33,33,-155,-156,-136,-138,-144,-203,-205,33,-79,-213,-216,-32,-33,-204,-206,-80,-208,-209,-207,-210,-212,-211,]),'_BOOL':([0,2,4,5,6,7,8,9,10,11,13,14,15,17,18,19,20,21,22,23,25,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,58,59,60,61,62,63,64,65,66,77,78,80,81,82,83,84,85,86,87,97,98,99,101,102,103,104,105,106,107,115,126,128,131,133,139,140,141,142,143,144,145,146,147,148,149,152,153,154,155,156,157,158,159,160,161,162,168,212,229,230,231,240,248,251,252,253,254,255,256,258,259,265,266,267,273,275,279,284,285,286,288,289,291,330,334,335,338,354,355,364,373,374,375,378,379,380,384,387,393,398,401,402,446,447,462,496,497,499,500,526,528,535,539,],[34,34,-60,-62,-63,-64,-65,-66,34,34,-67,-68,-52,-312,-312,-312,-116,-93,34,-29,-97,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-61,34,-84,34,34,34,-89,-90,-91,-92,-83,-69,34,-53,-86,-9,-10,-87,-88,-94,-166,-152,-153,-310,-132,-133,34,-70,34,-85,34,34,34,-30,-167,34,34,34,-135,-142,-311,34,-145,-146,-130,34,34,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,34,-71,-35,-36,34,34,-154,34,-137,34,-139,-134,-143,-128,-129,-131,-202,-201,34,-218,34,-78,-80,34,-214,-215,-217,34,34,34,34,-31,-34,34,34,-155,-156,-136,-138,-144,-203,-205,34,-79,-213,-216,-32,-33,-204,-206,-80,-208,-209,-207,-210,-212,-211,]),'CHAR':([0,2,4,5,6,7,8,9,10,11,13,14,15,17,18,19,20,21,22,23,25,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,58,59,60,61,62,63,64,65,66,77,78,80,81,82,83,84,85,86,87,97,98,99,101,102,103,104,105,106,107,115,126,128,131,133,139,140,141,142,143,144,145,146,147,148,149,152,153,154,155,156,157,158,159,160,161,162,168,212,229,230,231,240,248,251,252,253,254,255,256,258,259,265,266,267,273,275,279,284,285,286,288,289,291,330,334,335,338,354,355,364,373,374,375,378,379,380,384,387,393,398,401,402,446,447,462,496,497,499,500,526,528,535,539,],[35,35,-60,-62,-63,-64,-65,-66,35,35,-67,-68,-52,-312,-312,-312,-116,-93,35,-29,-97,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-61,35,-84,35,35,35,-89,-90,-91,-92,-83,-69,35,-53,-86,-9,-10,-87,-88,-94,-166,-152,-153,-310,-132,-133,35,-70,35,-85,35,35,35,-30,-167,35,35,35,-135,-142,-311,35,-145,-146,-130,35,35,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,35,-71,-35,-36,35,35,-154,35,-137,35,-139,-134,-143,-128,-129,-131,-202,-201,35,-218,35,-78,-80,35,-214,-215,-217,35,35,35,35,-31,-34,35,35,-155,-156,-136,-138,-144,-203,-205,35,-79,-213,-216,-32,-33,-204,-206,-80,-208,-209,-207,-210,-212,-211,]),'SHORT':([0,2,4,5,6,7,8,9,10,11,13,14,15,17,18,19,20,21,22,23,25,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,58,59,60,61,62,63,64,65,66,77,78,80,81,82,83,84,85,86,87,97,98,99,101,102,103,104,105,106,107,115,126,128,131,133,139,140,141,142,143,144,145,146,147,148,149,152,153,154,155,156,157,158,159,160,161,162,168,212,229,230,231,240,248,251,252,253,254,255,256,258,259,265,266,267,273,275,279,284,285,286,288,289,291,330,334,335,338,354,355,364,373,374,375,378,379,380,384,387,393,398,401,402,446,447,462,496,497,499,500,526,528,535,539,],[36,36,-60,-62,-63,-64,-65,-66,36,36,-67,-68,-52,-312,-312,-312,-116,-93,36,-29,-97,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-61,36,-84,36,36,36,-89,-90,-91,-92,-83,-69,36,-53,-86,-9,-10,-87,-88,-94,-166,-152,-153,-310,-132,-133,36,-70,36,-85,36,36,36,-30,-167,36,36,36,-135,-142,-311,36,-145,-146,-130,36,36,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,36,-71,-35,-36,36,36,-154,36,-137,36,-139,-134,-143,-128,-129,-131,-202,-201,36,-218,36,-78,-80,36,-214,-215,-217,36,36,36,36,-31,-34,36,36,-155,-156,-136,-138,-144,-203,-205,36,-79,-213,-216,-32,-33,-204,-206,-80,-208,-209,-207,-210,-212,-211,]),'INT':([0,2,4,5,6,7,8,9,10,11,13,14,15,17,18,19,20,21,22,23,25,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,58,59,60,61,62,63,64,65,66,77,78,80,81,82,83,84,85,86,87,97,98,99,101,102,103,104,105,106,107,115,126,128,131,133,139,140,141,142,143,144,145,146,147,148,149,152,153,154,155,156,157,158,159,160,161,162,168,212,229,230,231,240,248,251,252,253,254,255,256,258,259,265,266,267,273,275,279,284,285,286,288,289,291,330,334,335,338,354,355,364,373,374,375,378,379,380,384,387,393,398,401,402,446,447,462,496,497,499,500,526,528,535,539,],[37,37,-60,-62,-63,-64,-65,-66,37,37,-67,-68,-52,-312,-312,-312,-116,-93,37,-29,-97,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-61,37,-84,37,37,37,-89,-90,-91,-92,-83,-69,37,-53,-86,-9,-10,-87,-88,-94,-166,-152,-153,-310,-132,-133,37,-70,37,-85,37,37,37,-30,-167,37,37,37,-135,-142,-311,37,-145,-146,-130,37,37,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,37,-71,-35,-36,37,37,-154,37,-137,37,-139,-134,-143,-128,-129,-131,-202,-201,37,-218,37,-78,-80,37,-214,-215,-217,37,37,37,37,-31,-34,37,37,-155,-156,-136,-138,-144,-203,-205,37,-79,-213,-216,-32,-33,-204,-206,-80,-208,-209,-207,-210,-212,-211,]),'LONG':([0,2,4,5,6,7,8,9,10,11,13,14,15,17,18,19,20,21,22,23,25,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,58,59,60,61,62,63,64,65,66,77,78,80,81,82,83,84,85,86,87,97,98,99,101,102,103,104,105,106,107,115,126,128,131,133,139,140,141,142,143,144,145,146,147,148,149,152,153,154,155,156,157,158,159,160,161,162,168,212,229,230,231,240,248,251,252,253,254,255,256,258,259,265,266,267,273,275,279,284,285,286,288,289,291,330,334,335,338,354,355,364,373,374,375,378,379,380,384,387,393,398,401,402,446,447,462,496,497,499,500,526,528,535,539,],[38,38,-60,-62,-63,-64,-65,-66,38,38,-67,-68,-52,-312,-312,-312,-116,-93,38,-29,-97,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-61,38,-84,38,38,38,-89,-90,-91,-92,-83,-69,38,-53,-86,-9,-10,-87,-88,-94,-166,-152,-153,-310,-132,-133,38,-70,38,-85,38,38,38,-30,-167,38,38,38,-135,-142,-311,38,-145,-146,-130,38,38,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,38,-71,-35,-36,38,38,-154,38,-137,38,-139,-134,-143,-128,-129,-131,-202,-201,38,-218,38,-78,-80,38,-214,-215,-217,38,38,38,38,-31,-34,38,38,-155,-156,-136,-138,-144,-203,-205,38,-79,-213,-216,-32,-33,-204,-206,-80,-208,-209,-207,-210,-212,-211,]),'FLOAT':([0,2,4,5,6,7,8,9,10,11,13,14,15,17,18,19,20,21,22,23,25,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,58,59,60,61,62,63,64,65,66,77,78,80,81,82,83,84,85,86,87,97,98,99,101,102,103,104,105,106,107,115,126,128,131,133,139,140,141,142,143,144,145,146,147,148,149,152,153,154,155,156,157,158,159,160,161,162,168,212,229,230,231,240,248,251,252,253,254,255,256,258,259,265,266,267,273,275,279,284,285,286,288,289,291,330,334,335,338,354,355,364,373,374,375,378,379,380,384,387,393,398,401,402,446,447,462,496,497,499,500,526,528,535,539,],[39,39,-60,-62,-63,-64,-65,-66,39,39,-67,-68,-52,-312,-312,-312,-116,-93,39,-29,-97,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-61,39,-84,39,39,39,-89,-90,-91,-92,-83,-69,39,-53,-86,-9,-10,-87,-88,-94,-166,-152,-153,-310,-132,-133,39,-70,39,-85,39,39,39,-30,-167,39,39,39,-135,-142,-311,39,-145,-146,-130,39,39,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,39,-71,-35,-36,39,39,-154,39,-137,39,-139,-134,-143,-128,-129,-131,-202,-201,39,-218,39,-78,-80,39,-214,-215,-217,39,39,39,39,-31,-34,39,39,-155,-156,-136,-138,-144,-203,-205,39,-79,-213,-216,-32,-33,-204,-206,-80,-208,-209,-207,-210,-212,-211,]),'DOUBLE':([0,2,4,5,6,7,8,9,10,11,13,14,15,17,18,19,20,21,22,23,25,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,58,59,60,61,62,63,64,65,66,77,78,80,81,82,83,84,85,86,87,97,98,99,101,102,103,104,105,106,107,115,126,128,131,133,139,140,141,142,143,144,145,146,147,148,149,152,153,154,155,156,157,158,159,160,161,162,168,212,229,230,231,240,248,251,252,253,254,255,256,258,259,265,266,267,273,275,279,284,285,286,288,289,291,330,334,335,338,354,355,364,373,374,375,378,379,380,384,387,393,398,401,402,446,447,462,496,497,499,500,526,528,535,539,],[40,40,-60,-62,-63,-64,-65,-66,40,40,-67,-68,-52,-312,-312,-312,-116,-93,40,-29,-97,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-61,40,-84,40,40,40,-89,-90,-91,-92,-83,-69,40,-53,-86,-9,-10,-87,-88,-94,-166,-152,-153,-310,-132,-133,40,-70,40,-85,40,40,40,-30,-167,40,40,40,-135,-142,-311,40,-145,-146,-130,40,40,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,40,-71,-35,-36,40,40,-154,40,-137,40,-139,-134,-143,-128,-129,-131,-202,-201,40,-218,40,-78,-80,40,-214,-215,-217,40,40,40,40,-31,-34,40,40,-155,-156,-136,-138,-144,-203,-205,40,-79,-213,-216,-32,-33,-204,-206,-80,-208,-209,-207,-210,-212,-211,]),'_COMPLEX':([0,2,4,5,6,7,8,9,10,11,13,14,15,17,18,19,20,21,22,23,25,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,58,59,60,61,62,63,64,65,66,77,78,80,81,82,83,84,85,86,87,97,98,99,101,102,103,104,105,106,107,115,126,128,131,133,139,140,141,142,143,144,145,146,147,148,149,152,153,154,155,156,157,158,159,160,161,162,168,212,229,230,231,240,248,251,252,253,254,255,256,258,259,265,266,267,273,275,279,284,285,286,288,289,291,330,334,335,338,354,355,364,373,374,375,378,379,380,384,387,393,398,401,402,446,447,462,496,497,499,500,526,528,535,539,],[41,41,-60,-62,-63,-64,-65,-66,41,41,-67,-68,-52,-312,-312,-312,-116,-93,41,-29,-97,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-61,41,-84,41,41,41,-89,-90,-91,-92,-83,-69,41,-53,-86,-9,-10,-87,-88,-94,-166,-152,-153,-310,-132,-133,41,-70,41,-85,41,41,41,-30,-167,41,41,41,-135,-142,-311,41,-145,-146,-130,41,41,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,41,-71,-35,-36,41,41,-154,41,-137,41,-139,-134,-143,-128,-129,-131,-202,-201,41,-218,41,-78,-80,41,-214,-215,-217,41,41,41,41,-31,-34,41,41,-155,-156,-136,-138,-144,-203,-205,41,-79,-213,-216,-32,-33,-204,-206,-80,-208,-209,-207,-210,-212,-211,]),'SIGNED':([0,2,4,5,6,7,8,9,10,11,13,14,15,17,18,19,20,21,22,23,25,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,58,59,60,61,62,63,64,65,66,77,78,80,81,82,83,84,85,86,87,97,98,99,101,102,103,104,105,106,107,115,126,128,131,133,139,140,141,142,143,144,145,146,147,148,149,152,153,154,155,156,157,158,159,160,161,162,168,212,229,230,231,240,248,251,252,253,254,255,256,258,259,265,266,267,273,275,279,284,285,286,288,289,291,330,334,335,338,354,355,364,373,374,375,378,379,380,384,387,393,398,401,402,446,447,462,496,497,499,500,526,528,535,539,],[42,42,-60,-62,-63,-64,-65,-66,42,42,-67,-68,-52,-312,-312,-312,-116,-93,42,-29,-97,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-61,42,-84,42,42,42,-89,-90,-91,-92,-83,-69,42,-53,-86,-9,-10,-87,-88,-94,-166,-152,-153,-310,-132,-133,42,-70,42,-85,42,42,42,-30,-167,42,42,42,-135,-142,-311,42,-145,-146,-130,42,42,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,42,-71,-35,-36,42,42,-154,42,-137,42,-139,-134,-143,-128,-129,-131,-202,-201,42,-218,42,-78,-80,42,-214,-215,-217,42,42,42,42,-31,-34,42,42,-155,-156,-136,-138,-144,-203,-205,42,-79,-213,-216,-32,-33,-204,-206,-80,-208,-209,-207,-210,-212,-211,]),'UNSIGNED':([0,2,4,5,6,7,8,9,10,11,13,14,15,17,18,19,20,21,22,23,25,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,58,59,60,61,62,63,64,65,66,77,78,80,81,82,83,84,85,86,87,97,98,99,101,102,103,104,105,106,107,115,126,128,131,133,139,140,141,142,143,144,145,146,147,148,149,152,153,154,155,156,157,158,159,160,161,162,168,212,229,230,231,240,248,251,252,253,254,255,256,258,259,265,266,267,273,275,279,284,285,286,288,289,291,330,334,335,338,354,355,364,373,374,375,378,379,380,384,387,393,398,401,402,446,447,462,496,497,499,500,526,528,535,539,],[43,43,-60,-62,-63,-64,-65,-66,43,43,-67,-68,-52,-312,-312,-312,-116,-93,43,-29,-97,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-61,43,-84,43,43,43,-89,-90,-91,-92,-83,-69,43,-53,-86,-9,-10,-87,-88,-94,-166,-152,-153,-310,-132,-133,43,-70,43,-85,43,43,43,-30,-167,43,43,43,-135,-142,-311,43,-145,-146,-130,43,43,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,43,-71,-35,-36,43,43,-154,43,-137,43,-139,-134,-143,-128,-129,-131,-202,-201,43,-218,43,-78,-80,43,-214,-215,-217,43,43,43,43,-31,-34,43,43,-155,-156,-136,-138,-144,-203,-205,43,-79,-213,-216,-32,-33,-204,-206,-80,-208,-209,-207,-210,-212,-211,]),'__INT128':([0,2,4,5,6,7,8,9,10,11,13,14,15,17,18,19,20,21,22,23,25,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,58,59,60,61,62,63,64,65,66,77,78,80,81,82,83,84,85,86,87,97,98,99,101,102,103,104,105,106,107,115,126,128,131,133,139,140,141,142,143,144,145,146,147,148,149,152,153,154,155,156,157,158,159,160,161,162,168,212,229,230,231,240,248,251,252,253,254,255,256,258,259,265,266,267,273,275,279,284,285,286,288,289,291,330,334,335,338,354,355,364,373,374,375,378,379,380,384,387,393,398,401,402,446,447,462,496,497,499,500,526,528,535,539,],[44,44,-60,-62,-63,-64,-65,-66,44,44,-67,-68,-52,-312,-312,-312,-116,-93,44,-29,-97,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-61,44,-84,44,44,44,-89,-90,-91,-92,-83,-69,44,-53,-86,-9,-10,-87,-88,-94,-166,-152,-153,-310,-132,-133,44,-70,44,-85,44,44,44,-30,-167,44,44,44,-135,-142,-311,44,-145,-146,-130,44,44,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,44,-71,-35,-36,44,44,-154,44,-137,44,-139,-134,-143,-128,-129,-131,-202,-201,44,-218,44,-78,-80,44,-214,-215,-217,44,44,44,44,-31,-34,44,44,-155,-156,-136,-138,-144,-203,-205,44,-79,-213,-216,-32,-33,-204,-206,-80,-208,-209,-207,-210,-212,-211,]),'CONST':([0,2,4,5,6,7,8,9,10,11,13,14,15,17,18,19,20,21,23,25,26,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,58,59,60,62,63,64,65,66,77,78,79,80,81,87,96,97,98,99,101,102,103,104,105,106,107,114,115,117,118,126,131,133,139,140,141,142,143,144,145,146,147,148,149,152,153,154,155,156,157,158,159,160,161,162,168,212,219,220,229,230,231,240,241,248,251,252,253,254,255,256,258,259,265,266,267,273,275,279,284,285,286,288,289,291,330,334,335,338,354,355,363,364,373,374,375,378,379,380,384,387,393,398,401,402,446,447,449,450,462,496,497,499,500,526,528,535,539,],[45,45,-60,-62,-63,-64,-65,-66,45,45,-67,-68,-52,45,45,45,-116,-93,-29,-97,45,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-61,45,-84,45,45,-89,-90,-91,-92,-83,-69,45,45,-53,-94,45,-166,-152,-153,-310,-132,-133,45,-70,45,-85,45,45,45,45,45,-30,-167,45,45,45,-135,-142,-311,45,-145,-146,-130,45,45,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,45,-71,45,45,-35,-36,45,45,45,-154,45,-137,45,-139,-134,-143,-128,-129,-131,-202,-201,45,-218,45,-78,-80,45,-214,-215,-217,45,45,45,45,-31,-34,45,45,45,-155,-156,-136,-138,-144,-203,-205,45,-79,-213,-216,-32,-33,45,45,-204,-206,-80,-208,-209,-207,-210,-212,-211,]),'RESTRICT':([0,2,4,5,6,7,8,9,10,11,13,14,15,17,18,19,20,21,23,25,26,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,58,59,60,62,63,64,65,66,77,78,79,80,81,87,96,97,98,99,101,102,103,104,105,106,107,114,115,117,118,126,131,133,139,140,141,142,143,144,145,146,147,148,149,152,153,154,155,156,157,158,159,160,161,162,168,212,219,220,229,230,231,240,241,248,251,252,253,254,255,256,258,259,265,266,267,273,275,279,284,285,286,288,289,291,330,334,335,338,354,355,363,364,373,374,375,378,379,380,384,387,393,398,401,402,446,447,449,450,462,496,497,499,500,526,528,535,539,],[46,46,-60,-62,-63,-64,-65,-66,46,46,-67,-68,-52,46,46,46,-116,-93,-29,-97,46,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-61,46,-84,46,46,-89,-90,-91,-92,-83,-69,46,46,-53,-94,46,-166,-152,-153,-310,-132,-133,46,-70,46,-85,46,46,46,46,46,-30,-167,46,46,46,-135,-142,-311,46,-145,-146,-130,46,46,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,46,-71,46,46,-35,-36,46,46,46,-154,46,-137,46,-139,-134,-143,-128,-129,-131,-202,-201,46,-218,46,-78,-80,46,-214,-215,-217,46,46,46,46,-31,-34,46,46,46,-155,-156,-136,-138,-144,-203,-205,46,-79,-213,-216,-32,-33,46,46,-204,-206,-80,-208,-209,-207,-210,-212,-211,]),'VOLATILE':([0,2,4,5,6,7,8,9,10,11,13,14,15,17,18,19,20,21,23,25,26,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,58,59,60,62,63,64,65,66,77,78,79,80,81,87,96,97,98,99,101,102,103,104,105,106,107,114,115,117,118,126,131,133,139,140,141,142,143,144,145,146,147,148,149,152,153,154,155,156,157,158,159,160,161,162,168,212,219,220,229,230,231,240,241,248,251,252,253,254,255,256,258,259,265,266,267,273,275,279,284,285,286,288,289,291,330,334,335,338,354,355,363,364,373,374,375,378,379,380,384,387,393,398,401,402,446,447,449,450,462,496,497,499,500,526,528,535,539,],[47,47,-60,-62,-63,-64,-65,-66,47,47,-67,-68,-52,47,47,47,-116,-93,-29,-97,47,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-61,47,-84,47,47,-89,-90,-91,-92,-83,-69,47,47,-53,-94,47,-166,-152,-153,-310,-132,-133,47,-70,47,-85,47,47,47,47,47,-30,-167,47,47,47,-135,-142,-311,47,-145,-146,-130,47,47,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,47,-71,47,47,-35,-36,47,47,47,-154,47,-137,47,-139,-134,-143,-128,-129,-131,-202,-201,47,-218,47,-78,-80,47,-214,-215,-217,47,47,47,47,-31,-34,47,47,47,-155,-156,-136,-138,-144,-203,-205,47,-79,-213,-216,-32,-33,47,47,-204,-206,-80,-208,-209,-207,-210,-212,-211,]),'AUTO':([0,2,4,5,6,7,8,9,10,11,13,14,15,17,18,19,20,21,23,25,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,58,59,60,62,63,64,65,66,77,78,80,81,87,98,99,101,102,103,105,106,107,115,126,131,142,144,152,153,154,155,156,157,158,159,160,161,162,212,229,230,231,240,248,252,254,255,266,267,275,284,285,286,288,289,291,354,355,364,373,374,375,378,379,384,387,393,398,401,402,446,447,462,496,497,499,500,526,528,535,539,],[48,48,-60,-62,-63,-64,-65,-66,48,48,-67,-68,-52,48,48,48,-116,-93,-29,-97,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-61,48,-84,48,48,-89,-90,-91,-92,-83,-69,48,-53,-94,-152,-153,-310,-132,-133,-70,48,-85,48,48,-30,-135,-311,48,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,-71,-35,-36,48,48,-154,-137,-139,-134,-202,-201,-218,-78,-80,48,-214,-215,-217,-31,-34,48,48,-155,-156,-136,-138,-203,-205,48,-79,-213,-216,-32,-33,-204,-206,-80,-208,-209,-207,-210,-212,-211,]),'REGISTER':([0,2,4,5,6,7,8,9,10,11,13,14,15,17,18,19,20,21,23,25,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,58,59,60,62,63,64,65,66,77,78,80,81,87,98,99,101,102,103,105,106,107,115,126,131,142,144,152,153,154,155,156,157,158,159,160,161,162,212,229,230,231,240,248,252,254,255,266,267,275,284,285,286,288,289,291,354,355,364,373,374,375,378,379,384,387,393,398,401,402,446,447,462,496,497,499,500,526,528,535,539,],[49,49,-60,-62,-63,-64,-65,-66,49,49,-67,-68,-52,49,49,49,-116,-93,-29,-97,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-61,49,-84,49,49,-89,-90,-91,-92,-83,-69,49,-53,-94,-152,-153,-310,-132,-133,-70,49,-85,49,49,-30,-135,-311,49,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,-71,-35,-36,49,49,-154,-137,-139,-134,-202,-201,-218,-78,-80,49,-214,-215,-217,-31,-34,49,49,-155,-156,-136,-138,-203,-205,49,-79,-213,-216,-32,-33,-204,-206,-80,-208,-209,-207,-210,-212,-211,]),'STATIC':([0,2,4,5,6,7,8,9,10,11,13,14,15,17,18,19,20,21,23,25,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,58,59,60,62,63,64,65,66,77,78,79,80,81,87,97,98,99,101,102,103,105,106,107,114,115,118,126,131,133,142,144,152,153,154,155,156,157,158,159,160,161,162,212,220,229,230,231,240,248,252,254,255,266,267,275,284,285,286,288,289,291,354,355,363,364,373,374,375,378,379,384,387,393,398,401,402,446,447,450,462,496,497,499,500,526,528,535,539,],[25,25,-60,-62,-63,-64,-65,-66,25,25,-67,-68,-52,25,25,25,-116,-93,-29,-97,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-61,25,-84,25,25,-89,-90,-91,-92,-83,-69,117,25,-53,-94,-166,-152,-153,-310,-132,-133,-70,25,-85,219,25,228,25,-30,-167,-135,-311,25,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,-71,351,-35,-36,25,25,-154,-137,-139,-134,-202,-201,-218,-78,-80,25,-214,-215,-217,-31,-34,449,25,25,-155,-156,-136,-138,-203,-205,25,-79,-213,-216,-32,-33,489,-204,-206,-80,-208,-209,-207,-210,-212,-211,]),'EXTERN':([0,2,4,5,6,7,8,9,10,11,13,14,15,17,18,19,20,21,23,25,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,58,59,60,62,63,64,65,66,77,78,80,81,87,98,99,101,102,103,105,106,107,115,126,131,142,144,152,153,154,155,156,157,158,159,160,161,162,212,229,230,231,240,248,252,254,255,266,267,275,284,285,286,288,289,291,354,355,364,373,374,375,378,379,384,387,393,398,401,402,446,447,462,496,497,499,500,526,528,535,539,],[50,50,-60,-62,-63,-64,-65,-66,50,50,-67,-68,-52,50,50,50,-116,-93,-29,-97,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-61,50,-84,50,50,-89,-90,-91,-92,-83,-69,50,-53,-94,-152,-153,-310,-132,-133,-70,50,-85,50,50,-30,-135,-311,50,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,-71,-35,-36,50,50,-154,-137,-139,-134,-202,-201,-218,-78,-80,50,-214,-215,-217,-31,-34,50,50,-155,-156,-136,-138,-203,-205,50,-79,-213,-216,-32,-33,-204,-206,-80,-208,-209,-207,-210,-212,-211,]),'TYPEDEF':([0,2,4,5,6,7,8,9,10,11,13,14,15,17,18,19,20,21,23,25,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,58,59,60,62,63,64,65,66,77,78,80,81,87,98,99,101,102,103,105,106,107,115,126,131,142,144,152,153,154,155,156,157,158,159,160,161,162,212,229,230,231,240,248,252,254,255,266,267,275,284,285,286,288,289,291,354,355,364,373,374,375,378,379,384,387,393,398,401,402,446,447,462,496,497,499,500,526,528,535,539,],[51,51,-60,-62,-63,-64,-65,-66,51,51,-67,-68,-52,51,51,51,-116,-93,-29,-97,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-61,51,-84,51,51,-89,-90,-91,-92,-83,-69,51,-53,-94,-152,-153,-310,-132,-133,-70,51,-85,51,51,-30,-135,-311,51,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,-71,-35,-36,51,51,-154,-137,-139,-134,-202,-201,-218,-78,-80,51,-214,-215,-217,-31,-34,51,51,-155,-156,-136,-138,-203,-205,51,-79,-213,-216,-32,-33,-204,-206,-80,-208,-209,-207,-210,-212,-211,]),'INLINE':([0,2,4,5,6,7,8,9,10,11,13,14,15,17,18,19,20,21,23,25,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,58,59,60,62,63,64,65,66,77,78,80,81,87,98,99,101,102,103,105,106,107,115,126,131,142,144,152,153,154,155,156,157,158,159,160,161,162,212,229,230,231,240,248,252,254,255,266,267,275,284,285,286,288,289,291,354,355,364,373,374,375,378,379,384,387,393,398,401,402,446,447,462,496,497,499,500,526,528,535,539,],[52,52,-60,-62,-63,-64,-65,-66,52,52,-67,-68,-52,52,52,52,-116,-93,-29,-97,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-61,52,-84,52,52,-89,-90,-91,-92,-83,-69,52,-53,-94,-152,-153,-310,-132,-133,-70,52,-85,52,52,-30,-135,-311,52,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,-71,-35,-36,52,52,-154,-137,-139,-134,-202,-201,-218,-78,-80,52,-214,-215,-217,-31,-34,52,52,-155,-156,-136,-138,-203,-205,52,-79,-213,-216,-32,-33,-204,-206,-80,-208,-209,-207,-210,-212,-211,]),'STRUCT':([0,2,4,5,6,7,8,9,10,13,14,15,17,18,19,22,23,25,45,46,47,48,49,50,51,52,55,58,59,61,62,77,78,80,81,82,83,84,85,86,97,101,104,105,106,107,115,128,131,133,139,140,141,143,144,146,147,149,152,153,154,155,156,157,158,159,160,161,162,168,212,229,230,231,240,251,253,256,266,267,273,275,284,285,286,288,289,291,330,334,335,338,354,355,364,373,380,384,387,393,398,401,402,446,447,462,496,497,499,500,526,528,535,539,],[53,53,-60,-62,-63,-64,-65,-66,53,-67,-68,-52,-312,-312,-312,53,-29,-97,-117,-118,-119,-95,-96,-98,-99,-100,-61,53,-84,53,53,-83,-69,53,-53,-86,-9,-10,-87,-88,-166,-310,53,-70,53,-85,53,53,-30,-167,53,53,53,-142,-311,-145,-146,53,53,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,53,-71,-35,-36,53,53,53,53,-143,-202,-201,53,-218,-78,-80,53,-214,-215,-217,53,53,53,53,-31,-34,53,53,-144,-203,-205,53,-79,-213,-216,-32,-33,-204,-206,-80,-208,-209,-207,-210,-212,-211,]),'UNION':([0,2,4,5,6,7,8,9,10,13,14,15,17,18,19,22,23,25,45,46,47,48,49,50,51,52,55,58,59,61,62,77,78,80,81,82,83,84,85,86,97,101,104,105,106,107,115,128,131,133,139,140,141,143,144,146,147,149,152,153,154,155,156,157,158,159,160,161,162,168,212,229,230,231,240,251,253,256,266,267,273,275,284,285,286,288,289,291,330,334,335,338,354,355,364,373,380,384,387,393,398,401,402,446,447,462,496,497,499,500,526,528,535,539,],[54,54,-60,-62,-63,-64,-65,-66,54,-67,-68,-52,-312,-312,-312,54,-29,-97,-117,-118,-119,-95,-96,-98,-99,-100,-61,54,-84,54,54,-83,-69,54,-53,-86,-9,-10,-87,-88,-166,-310,54,-70,54,-85,54,54,-30,-167,54,54,54,-142,-311,-145,-146,54,54,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,54,-71,-35,-36,54,54,54,54,-143,-202,-201,54,-218,-78,-80,54,-214,-215,-217,54,54,54,54,-31,-34,54,54,-144,-203,-205,54,-79,-213,-216,-32,-33,-204,-206,-80,-208,-209,-207,-210,-212,-211,]),'LBRACE':([10,14,15,23,31,32,53,54,56,57,58,59,62,77,78,81,98,99,101,102,103,106,107,109,113,130,131,144,152,153,154,155,156,157,158,159,160,161,162,172,217,229,230,266,267,269,274,275,284,285,288,289,291,341,342,343,354,355,384,385,387,389,398,401,402,436,438,446,447,462,463,464,465,467,468,476,477,481,482,496,497,499,500,514,516,526,528,530,534,535,539,],[-312,-68,-52,-29,101,101,-140,-141,101,-7,-8,-84,-312,-83,-69,-53,101,101,-310,101,101,101,-85,101,101,101,-30,-311,101,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,101,-312,-35,-36,-202,-201,101,101,-218,101,-80,-214,-215,-217,-11,101,-12,-31,-34,-203,101,-205,101,-79,-213,-216,-312,-182,-32,-33,-204,101,101,-312,101,101,101,101,101,-11,-206,-80,-208,-209,101,-312,-207,-210,101,101,-212,-211,]),'RBRACE':([14,77,78,101,104,106,127,136,137,138,139,140,141,143,144,146,147,150,151,152,153,154,155,156,157,158,159,160,161,162,179,180,181,182,186,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,216,217,246,247,249,251,253,256,266,267,271,272,275,284,285,288,289,291,327,328,329,331,332,333,336,337,339,340,341,376,377,380,384,387,390,398,401,402,403,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,425,427,428,429,430,435,436,437,462,466,473,474,477,480,496,497,498,499,500,504,509,515,516,521,526,527,528,535,537,539,541,],[-68,-83,-69,-310,144,-312,-296,144,-157,-160,144,144,144,-142,-311,-145,-146,144,-5,-6,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,-222,-257,-236,-259,-238,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-177,-312,144,144,-158,144,144,-143,-202,-201,-235,-257,-218,-78,-80,-214,-215,-217,-279,-280,-260,-261,-262,-263,-307,-309,144,-22,-21,-159,-161,-144,-203,-205,-289,-79,-213,-216,-223,-239,-240,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-274,-275,-276,-277,-278,-178,144,-180,-204,-258,-272,-273,-264,-179,-206,-80,144,-208,-209,-237,-181,-281,144,-290,-207,-282,-210,-212,-283,-211,-284,]),'CASE':([14,77,78,101,106,144,152,153,154,155,156,157,158,159,160,161,162,172,266,267,269,274,275,284,285,288,289,291,384,385,387,398,401,402,462,464,467,468,496,497,499,500,514,526,528,530,534,535,539,],[-68,-83,-69,-310,164,-311,164,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,164,-202,-201,164,164,-218,164,-80,-214,-215,-217,-203,164,-205,-79,-213,-216,-204,164,164,164,-206,-80,-208,-209,164,-207,-210,164,164,-212,-211,]),'DEFAULT':([14,77,78,101,106,144,152,153,154,155,156,157,158,159,160,161,162,172,266,267,269,274,275,284,285,288,289,291,384,385,387,398,401,402,462,464,467,468,496,497,499,500,514,526,528,530,534,535,539,],[-68,-83,-69,-310,165,-311,165,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,165,-202,-201,165,165,-218,165,-80,-214,-215,-217,-203,165,-205,-79,-213,-216,-204,165,165,165,-206,-80,-208,-209,165,-207,-210,165,165,-212,-211,]),'IF':([14,77,78,101,106,144,152,153,154,155,156,157,158,159,160,161,162,172,266,267,269,274,275,284,285,288,289,291,384,385,387,398,401,402,462,464,467,468,496,497,499,500,514,526,528,530,534,535,539,],[-68,-83,-69,-310,167,-311,167,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,167,-202,-201,167,167,-218,167,-80,-214,-215,-217,-203,167,-205,-79,-213,-216,-204,167,167,167,-206,-80,-208,-209,167,-207,-210,167,167,-212,-211,]),'SWITCH':([14,77,78,101,106,144,152,153,154,155,156,157,158,159,160,161,162,172,266,267,269,274,275,284,285,288,289,291,384,385,387,398,401,402,462,464,467,468,496,497,499,500,514,526,528,530,534,535,539,],[-68,-83,-69,-310,170,-311,170,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,170,-202,-201,170,170,-218,170,-80,-214,-215,-217,-203,170,-205,-79,-213,-216,-204,170,170,170,-206,-80,-208,-209,170,-207,-210,170,170,-212,-211,]),'WHILE':([14,77,78,101,106,144,152,153,154,155,156,157,158,159,160,161,162,172,266,267,269,274,275,283,284,285,288,289,291,384,385,387,398,401,402,462,464,467,468,496,497,499,500,514,526,528,530,534,535,539,],[-68,-83,-69,-310,171,-311,171,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,171,-202,-201,171,171,-218,397,171,-80,-214,-215,-217,-203,171,-205,-79,-213,-216,-204,171,171,171,-206,-80,-208,-209,171,-207,-210,171,171,-212,-211,]),'DO':([14,77,78,101,106,144,152,153,154,155,156,157,158,159,160,161,162,172,266,267,269,274,275,284,285,288,289,291,384,385,387,398,401,402,462,464,467,468,496,497,499,500,514,526,528,530,534,535,539,],[-68,-83,-69,-310,172,-311,172,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,172,-202,-201,172,172,-218,172,-80,-214,-215,-217,-203,172,-205,-79,-213,-216,-204,172,172,172,-206,-80,-208,-209,172,-207,-210,172,172,-212,-211,]),'FOR':([14,77,78,101,106,144,152,153,154,155,156,157,158,159,160,161,162,172,266,267,269,274,275,284,285,288,289,291,384,385,387,398,401,402,462,464,467,468,496,497,499,500,514,526,528,530,534,535,539,],[-68,-83,-69,-310,173,-311,173,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,173,-202,-201,173,173,-218,173,-80,-214,-215,-217,-203,173,-205,-79,-213,-216,-204,173,173,173,-206,-80,-208,-209,173,-207,-210,173,173,-212,-211,]),'GOTO':([14,77,78,101,106,144,152,153,154,155,156,157,158,159,160,161,162,172,266,267,269,274,275,284,285,288,289,291,384,385,387,398,401,402,462,464,467,468,496,497,499,500,514,526,528,530,534,535,539,],[-68,-83,-69,-310,174,-311,174,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,174,-202,-201,174,174,-218,174,-80,-214,-215,-217,-203,174,-205,-79,-213,-216,-204,174,174,174,-206,-80,-208,-209,174,-207,-210,174,174,-212,-211,]),'BREAK':([14,77,78,101,106,144,152,153,154,155,156,157,158,159,160,161,162,172,266,267,269,274,275,284,285,288,289,291,384,385,387,398,401,402,462,464,467,468,496,497,499,500,514,526,528,530,534,535,539,],[-68,-83,-69,-310,175,-311,175,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,175,-202,-201,175,175,-218,175,-80,-214,-215,-217,-203,175,-205,-79,-213,-216,-204,175,175,175,-206,-80,-208,-209,175,-207,-210,175,175,-212,-211,]),'CONTINUE':([14,77,78,101,106,144,152,153,154,155,156,157,158,159,160,161,162,172,266,267,269,274,275,284,285,288,289,291,384,385,387,398,401,402,462,464,467,468,496,497,499,500,514,526,528,530,534,535,539,],[-68,-83,-69,-310,176,-311,176,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,176,-202,-201,176,176,-218,176,-80,-214,-215,-217,-203,176,-205,-79,-213,-216,-204,176,176,176,-206,-80,-208,-209,176,-207,-210,176,176,-212,-211,]),'RETURN':([14,77,78,101,106,144,152,153,154,155,156,157,158,159,160,161,162,172,266,267,269,274,275,284,285,288,289,291,384,385,387,398,401,402,462,464,467,468,496,497,499,500,514,526,528,530,534,535,539,],[-68,-83,-69,-310,177,-311,177,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,177,-202,-201,177,177,-218,177,-80,-214,-215,-217,-203,177,-205,-79,-213,-216,-204,177,177,177,-206,-80,-208,-209,177,-207,-210,177,177,-212,-211,]),'PLUSPLUS':([14,45,46,47,77,78,79,95,96,97,101,106,113,114,116,117,118,127,130,133,144,152,153,154,155,156,157,158,159,160,161,162,163,164,168,172,177,182,183,184,185,187,188,189,190,191,192,194,195,196,197,198,199,200,202,203,204,205,206,207,208,209,210,211,217,218,219,220,224,227,228,241,250,264,266,267,269,273,274,275,276,280,281,282,284,285,286,288,289,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,327,328,330,334,336,337,341,342,343,346,349,350,351,363,370,372,382,384,385,387,389,390,398,400,401,402,425,427,428,429,430,436,438,448,449,450,458,462,463,464,465,467,468,469,470,472,473,474,475,481,482,487,488,489,496,497,499,500,503,514,515,516,518,520,521,523,526,527,528,530,534,535,536,537,539,541,],[-68,-117,-118,-119,-83,-69,-312,-27,-28,-166,-310,183,183,-312,183,-312,-28,-296,183,-167,-311,183,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,-296,183,183,183,183,327,183,183,183,183,-266,-267,-268,-265,-271,-306,-269,-270,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-312,183,-312,-28,-266,183,183,-312,183,183,-202,-201,183,183,183,-218,183,183,183,183,183,-80,183,-214,-215,-217,183,-224,-225,-226,-227,-228,-229,-230,-231,-232,-233,-234,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,-279,-280,183,183,-307,-309,-11,183,-12,183,-266,183,183,-312,183,183,183,-203,183,-205,183,-289,-79,183,-213,-216,-274,-275,-276,-277,-278,-312,-182,183,-312,-28,-266,-204,183,183,-312,183,183,183,183,183,-272,-273,183,183,-11,-266,183,183,-206,-80,-208,-209,183,183,-281,-312,183,183,-290,183,-207,-282,-210,183,183,-212,183,-283,-211,-284,]),'MINUSMINUS':([14,45,46,47,77,78,79,95,96,97,101,106,113,114,116,117,118,127,130,133,144,152,153,154,155,156,157,158,159,160,161,162,163,164,168,172,177,182,183,184,185,187,188,189,190,191,192,194,195,196,197,198,199,200,202,203,204,205,206,207,208,209,210,211,217,218,219,220,224,227,228,241,250,264,266,267,269,273,274,275,276,280,281,282,284,285,286,288,289,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,327,328,330,334,336,337,341,342,343,346,349,350,351,363,370,372,382,384,385,387,389,390,398,400,401,402,425,427,428,429,430,436,438,448,449,450,458,462,463,464,465,467,468,469,470,472,473,474,475,481,482,487,488,489,496,497,499,500,503,514,515,516,518,520,521,523,526,527,528,530,534,535,536,537,539,541,],[-68,-117,-118,-119,-83,-69,-312,-27,-28,-166,-310,184,184,-312,184,-312,-28,-296,184,-167,-311,184,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,-296,184,184,184,184,328,184,184,184,184,-266,-267,-268,-265,-271,-306,-269,-270,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-312,184,-312,-28,-266,184,184,-312,184,184,-202,-201,184,184,184,-218,184,184,184,184,184,-80,184,-214,-215,-217,184,-224,-225,-226,-227,-228,-229,-230,-231,-232,-233,-234,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,-279,-280,184,184,-307,-309,-11,184,-12,184,-266,184,184,-312,184,184,184,-203,184,-205,184,-289,-79,184,-213,-216,-274,-275,-276,-277,-278,-312,-182,184,-312,-28,-266,-204,184,184,-312,184,184,184,184,184,-272,-273,184,184,-11,-266,184,184,-206,-80,-208,-209,184,184,-281,-312,184,184,-290,184,-207,-282,-210,184,184,-212,184,-283,-211,-284,]),'SIZEOF':([14,45,46,47,77,78,79,95,96,97,101,106,113,114,116,117,118,130,133,144,152,153,154,155,156,157,158,159,160,161,162,164,168,172,177,183,184,185,187,188,189,190,191,195,196,217,218,219,220,224,227,228,241,250,264,266,267,269,273,274,275,276,280,281,282,284,285,286,288,289,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,341,342,343,346,349,350,351,363,370,372,382,384,385,387,389,398,400,401,402,436,438,448,449,450,458,462,463,464,465,467,468,469,470,472,475,481,482,487,488,489,496,497,499,500,503,514,516,518,520,523,526,528,530,534,535,536,539,],[-68,-117,-118,-119,-83,-69,-312,-27,-28,-166,-310,187,187,-312,187,-312,-28,187,-167,-311,187,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,187,187,187,187,187,187,187,187,-266,-267,-268,-265,-269,-270,-312,187,-312,-28,-266,187,187,-312,187,187,-202,-201,187,187,187,-218,187,187,187,187,187,-80,187,-214,-215,-217,187,-224,-225,-226,-227,-228,-229,-230,-231,-232,-233,-234,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,-11,187,-12,187,-266,187,187,-312,187,187,187,-203,187,-205,187,-79,187,-213,-216,-312,-182,187,-312,-28,-266,-204,187,187,-312,187,187,187,187,187,187,187,-11,-266,187,187,-206,-80,-208,-209,187,187,-312,187,187,187,-207,-210,187,187,-212,187,-211,]),'__RAW':([14,45,46,47,77,78,79,95,96,97,101,106,113,114,116,117,118,130,133,144,152,153,154,155,156,157,158,159,160,161,162,164,168,172,177,183,184,185,187,188,189,190,191,195,196,217,218,219,220,224,227,228,241,250,264,266,267,269,273,274,275,276,280,281,282,284,285,286,288,289,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,341,342,343,346,349,350,351,363,370,372,382,384,385,387,389,398,400,401,402,436,438,448,449,450,458,462,463,464,465,467,468,469,470,472,475,481,482,487,488,489,496,497,499,500,503,514,516,518,520,523,526,528,530,534,535,536,539,],[-68,-117,-118,-119,-83,-69,-312,-27,-28,-166,-310,193,193,-312,193,-312,-28,193,-167,-311,193,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,193,193,193,193,193,193,193,193,-266,-267,-268,-265,-269,-270,-312,193,-312,-28,-266,193,193,-312,193,193,-202,-201,193,193,193,-218,193,193,193,193,193,-80,193,-214,-215,-217,193,-224,-225,-226,-227,-228,-229,-230,-231,-232,-233,-234,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,-11,193,-12,193,-266,193,193,-312,193,193,193,-203,193,-205,193,-79,193,-213,-216,-312,-182,193,-312,-28,-266,-204,193,193,-312,193,193,193,193,193,193,193,-11,-266,193,193,-206,-80,-208,-209,193,193,-312,193,193,193,-207,-210,193,193,-212,193,-211,]),'AND':([14,45,46,47,77,78,79,95,96,97,101,106,113,114,116,117,118,127,130,133,144,152,153,154,155,156,157,158,159,160,161,162,163,164,168,172,177,180,181,182,183,184,185,186,187,188,189,190,191,192,194,195,196,197,198,199,200,202,203,204,205,206,207,208,209,210,211,217,218,219,220,224,227,228,241,250,264,266,267,269,272,273,274,275,276,280,281,282,284,285,286,288,289,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,327,328,329,330,331,332,333,334,336,337,341,342,343,346,349,350,351,363,370,372,382,384,385,387,389,390,398,400,401,402,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,425,427,428,429,430,436,438,448,449,450,458,462,463,464,465,466,467,468,469,470,472,473,474,475,477,481,482,487,488,489,496,497,499,500,503,514,515,516,518,520,521,523,526,527,528,530,534,535,536,537,539,541,],[-68,-117,-118,-119,-83,-69,-312,-27,-28,-166,-310,191,191,-312,191,-312,-28,-296,191,-167,-311,191,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,-296,191,191,191,191,-257,318,-259,191,191,191,-238,191,-266,-267,-268,-265,-271,-306,-269,-270,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-312,191,-312,-28,-266,191,191,-312,191,191,-202,-201,191,-257,191,191,-218,191,191,191,191,191,-80,191,-214,-215,-217,191,-224,-225,-226,-227,-228,-229,-230,-231,-232,-233,-234,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,-279,-280,-260,191,-261,-262,-263,191,-307,-309,-11,191,-12,191,-266,191,191,-312,191,191,191,-203,191,-205,191,-289,-79,191,-213,-216,-239,-240,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-252,318,318,318,318,-274,-275,-276,-277,-278,-312,-182,191,-312,-28,-266,-204,191,191,-312,-258,191,191,191,191,191,-272,-273,191,-264,191,-11,-266,191,191,-206,-80,-208,-209,191,191,-281,-312,191,191,-290,191,-207,-282,-210,191,191,-212,191,-283,-211,-284,]),'PLUS':([14,45,46,47,77,78,79,95,96,97,101,106,113,114,116,117,118,127,130,133,144,152,153,154,155,156,157,158,159,160,161,162,163,164,168,172,177,180,181,182,183,184,185,186,187,188,189,190,191,192,194,195,196,197,198,199,200,202,203,204,205,206,207,208,209,210,211,217,218,219,220,224,227,228,241,250,264,266,267,269,272,273,274,275,276,280,281,282,284,285,286,288,289,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,327,328,329,330,331,332,333,334,336,337,341,342,343,346,349,350,351,363,370,372,382,384,385,387,389,390,398,400,401,402,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,425,427,428,429,430,436,438,448,449,450,458,462,463,464,465,466,467,468,469,470,472,473,474,475,477,481,482,487,488,489,496,497,499,500,503,514,515,516,518,520,521,523,526,527,528,530,534,535,536,537,539,541,],[-68,-117,-118,-119,-83,-69,-312,-27,-28,-166,-310,189,189,-312,189,-312,-28,-296,189,-167,-311,189,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,-296,189,189,189,189,-257,308,-259,189,189,189,-238,189,-266,-267,-268,-265,-271,-306,-269,-270,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-312,189,-312,-28,-266,189,189,-312,189,189,-202,-201,189,-257,189,189,-218,189,189,189,189,189,-80,189,-214,-215,-217,189,-224,-225,-226,-227,-228,-229,-230,-231,-232,-233,-234,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,-279,-280,-260,189,-261,-262,-263,189,-307,-309,-11,189,-12,189,-266,189,189,-312,189,189,189,-203,189,-205,189,-289,-79,189,-213,-216,-239,-240,-241,-242,-243,308,308,308,308,308,308,308,308,308,308,308,308,308,-274,-275,-276,-277,-278,-312,-182,189,-312,-28,-266,-204,189,189,-312,-258,189,189,189,189,189,-272,-273,189,-264,189,-11,-266,189,189,-206,-80,-208,-209,189,189,-281,-312,189,189,-290,189,-207,-282,-210,189,189,-212,189,-283,-211,-284,]),'MINUS':([14,45,46,47,77,78,79,95,96,97,101,106,113,114,116,117,118,127,130,133,144,152,153,154,155,156,157,158,159,160,161,162,163,164,168,172,177,180,181,182,183,184,185,186,187,188,189,190,191,192,194,195,196,197,198,199,200,202,203,204,205,206,207,208,209,210,211,217,218,219,220,224,227,228,241,250,264,266,267,269,272,273,274,275,276,280,281,282,284,285,286,288,289,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,327,328,329,330,331,332,333,334,336,337,341,342,343,346,349,350,351,363,370,372,382,384,385,387,389,390,398,400,401,402,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,425,427,428,429,430,436,438,448,449,450,458,462,463,464,465,466,467,468,469,470,472,473,474,475,477,481,482,487,488,489,496,497,499,500,503,514,515,516,518,520,521,523,526,527,528,530,534,535,536,537,539,541,],[-68,-117,-118,-119,-83,-69,-312,-27,-28,-166,-310,190,190,-312,190,-312,-28,-296,190,-167,-311,190,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,-296,190,190,190,190,-257,309,-259,190,190,190,-238,190,-266,-267,-268,-265,-271,-306,-269,-270,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-312,190,-312,-28,-266,190,190,-312,190,190,-202,-201,190,-257,190,190,-218,190,190,190,190,190,-80,190,-214,-215,-217,190,-224,-225,-226,-227,-228,-229,-230,-231,-232,-233,-234,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,-279,-280,-260,190,-261,-262,-263,190,-307,-309,-11,190,-12,190,-266,190,190,-312,190,190,190,-203,190,-205,190,-289,-79,190,-213,-216,-239,-240,-241,-242,-243,309,309,309,309,309,309,309,309,309,309,309,309,309,-274,-275,-276,-277,-278,-312,-182,190,-312,-28,-266,-204,190,190,-312,-258,190,190,190,190,190,-272,-273,190,-264,190,-11,-266,190,190,-206,-80,-208,-209,190,190,-281,-312,190,190,-290,190,-207,-282,-210,190,190,-212,190,-283,-211,-284,]),'NOT':([14,45,46,47,77,78,79,95,96,97,101,106,113,114,116,117,118,130,133,144,152,153,154,155,156,157,158,159,160,161,162,164,168,172,177,183,184,185,187,188,189,190,191,195,196,217,218,219,220,224,227,228,241,250,264,266,267,269,273,274,275,276,280,281,282,284,285,286,288,289,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,341,342,343,346,349,350,351,363,370,372,382,384,385,387,389,398,400,401,402,436,438,448,449,450,458,462,463,464,465,467,468,469,470,472,475,481,482,487,488,489,496,497,499,500,503,514,516,518,520,523,526,528,530,534,535,536,539,],[-68,-117,-118,-119,-83,-69,-312,-27,-28,-166,-310,195,195,-312,195,-312,-28,195,-167,-311,195,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,195,195,195,195,195,195,195,195,-266,-267,-268,-265,-269,-270,-312,195,-312,-28,-266,195,195,-312,195,195,-202,-201,195,195,195,-218,195,195,195,195,195,-80,195,-214,-215,-217,195,-224,-225,-226,-227,-228,-229,-230,-231,-232,-233,-234,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,-11,195,-12,195,-266,195,195,-312,195,195,195,-203,195,-205,195,-79,195,-213,-216,-312,-182,195,-312,-28,-266,-204,195,195,-312,195,195,195,195,195,195,195,-11,-266,195,195,-206,-80,-208,-209,195,195,-312,195,195,195,-207,-210,195,195,-212,195,-211,]),'LNOT':([14,45,46,47,77,78,79,95,96,97,101,106,113,114,116,117,118,130,133,144,152,153,154,155,156,157,158,159,160,161,162,164,168,172,177,183,184,185,187,188,189,190,191,195,196,217,218,219,220,224,227,228,241,250,264,266,267,269,273,274,275,276,280,281,282,284,285,286,288,289,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,341,342,343,346,349,350,351,363,370,372,382,384,385,387,389,398,400,401,402,436,438,448,449,450,458,462,463,464,465,467,468,469,470,472,475,481,482,487,488,489,496,497,499,500,503,514,516,518,520,523,526,528,530,534,535,536,539,],[-68,-117,-118,-119,-83,-69,-312,-27,-28,-166,-310,196,196,-312,196,-312,-28,196,-167,-311,196,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,196,196,196,196,196,196,196,196,-266,-267,-268,-265,-269,-270,-312,196,-312,-28,-266,196,196,-312,196,196,-202,-201,196,196,196,-218,196,196,196,196,196,-80,196,-214,-215,-217,196,-224,-225,-226,-227,-228,-229,-230,-231,-232,-233,-234,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,-11,196,-12,196,-266,196,196,-312,196,196,196,-203,196,-205,196,-79,196,-213,-216,-312,-182,196,-312,-28,-266,-204,196,196,-312,196,196,196,196,196,196,196,-11,-266,196,196,-206,-80,-208,-209,196,196,-312,196,196,196,-207,-210,196,196,-212,196,-211,]),'OFFSETOF':([14,45,46,47,77,78,79,95,96,97,101,106,113,114,116,117,118,130,133,144,152,153,154,155,156,157,158,159,160,161,162,164,168,172,177,183,184,185,187,188,189,190,191,195,196,217,218,219,220,224,227,228,241,250,264,266,267,269,273,274,275,276,280,281,282,284,285,286,288,289,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,341,342,343,346,349,350,351,363,370,372,382,384,385,387,389,398,400,401,402,436,438,448,449,450,458,462,463,464,465,467,468,469,470,472,475,481,482,487,488,489,496,497,499,500,503,514,516,518,520,523,526,528,530,534,535,536,539,],[-68,-117,-118,-119,-83,-69,-312,-27,-28,-166,-310,201,201,-312,201,-312,-28,201,-167,-311,201,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,201,201,201,201,201,201,201,201,-266,-267,-268,-265,-269,-270,-312,201,-312,-28,-266,201,201,-312,201,201,-202,-201,201,201,201,-218,201,201,201,201,201,-80,201,-214,-215,-217,201,-224,-225,-226,-227,-228,-229,-230,-231,-232,-233,-234,201,201,201,201,201,201,201,201,201,201,201,201,201,201,201,201,201,201,201,201,201,201,201,-11,201,-12,201,-266,201,201,-312,201,201,201,-203,201,-205,201,-79,201,-213,-216,-312,-182,201,-312,-28,-266,-204,201,201,-312,201,201,201,201,201,201,201,-11,-266,201,201,-206,-80,-208,-209,201,201,-312,201,201,201,-207,-210,201,201,-212,201,-211,]),'INT_CONST_DEC':([14,45,46,47,77,78,79,95,96,97,101,106,113,114,116,117,118,130,133,144,152,153,154,155,156,157,158,159,160,161,162,164,168,172,177,183,184,185,187,188,189,190,191,195,196,217,218,219,220,224,227,228,241,250,264,266,267,269,273,274,275,276,280,281,282,284,285,286,288,289,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,341,342,343,346,349,350,351,363,370,372,382,384,385,387,389,398,400,401,402,436,438,448,449,450,458,462,463,464,465,467,468,469,470,472,475,481,482,487,488,489,496,497,499,500,503,514,516,518,520,523,526,528,530,534,535,536,539,],[-68,-117,-118,-119,-83,-69,-312,-27,-28,-166,-310,202,202,-312,202,-312,-28,202,-167,-311,202,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,202,202,202,202,202,202,202,202,-266,-267,-268,-265,-269,-270,-312,202,-312,-28,-266,202,202,-312,202,202,-202,-201,202,202,202,-218,202,202,202,202,202,-80,202,-214,-215,-217,202,-224,-225,-226,-227,-228,-229,-230,-231,-232,-233,-234,202,202,202,202,202,202,202,202,202,202,202,202,202,202,202,202,202,202,202,202,202,202,202,-11,202,-12,202,-266,202,202,-312,202,202,202,-203,202,-205,202,-79,202,-213,-216,-312,-182,202,-312,-28,-266,-204,202,202,-312,202,202,202,202,202,202,202,-11,-266,202,202,-206,-80,-208,-209,202,202,-312,202,202,202,-207,-210,202,202,-212,202,-211,]),'INT_CONST_OCT':([14,45,46,47,77,78,79,95,96,97,101,106,113,114,116,117,118,130,133,144,152,153,154,155,156,157,158,159,160,161,162,164,168,172,177,183,184,185,187,188,189,190,191,195,196,217,218,219,220,224,227,228,241,250,264,266,267,269,273,274,275,276,280,281,282,284,285,286,288,289,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,341,342,343,346,349,350,351,363,370,372,382,384,385,387,389,398,400,401,402,436,438,448,449,450,458,462,463,464,465,467,468,469,470,472,475,481,482,487,488,489,496,497,499,500,503,514,516,518,520,523,526,528,530,534,535,536,539,],[-68,-117,-118,-119,-83,-69,-312,-27,-28,-166,-310,203,203,-312,203,-312,-28,203,-167,-311,203,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,203,203,203,203,203,203,203,203,-266,-267,-268,-265,-269,-270,-312,203,-312,-28,-266,203,203,-312,203,203,-202,-201,203,203,203,-218,203,203,203,203,203,-80,203,-214,-215,-217,203,-224,-225,-226,-227,-228,-229,-230,-231,-232,-233,-234,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,-11,203,-12,203,-266,203,203,-312,203,203,203,-203,203,-205,203,-79,203,-213,-216,-312,-182,203,-312,-28,-266,-204,203,203,-312,203,203,203,203,203,203,203,-11,-266,203,203,-206,-80,-208,-209,203,203,-312,203,203,203,-207,-210,203,203,-212,203,-211,]),'INT_CONST_HEX':([14,45,46,47,77,78,79,95,96,97,101,106,113,114,116,117,118,130,133,144,152,153,154,155,156,157,158,159,160,161,162,164,168,172,177,183,184,185,187,188,189,190,191,195,196,217,218,219,220,224,227,228,241,250,264,266,267,269,273,274,275,276,280,281,282,284,285,286,288,289,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,341,342,343,346,349,350,351,363,370,372,382,384,385,387,389,398,400,401,402,436,438,448,449,450,458,462,463,464,465,467,468,469,470,472,475,481,482,487,488,489,496,497,499,500,503,514,516,518,520,523,526,528,530,534,535,536,539,],[-68,-117,-118,-119,-83,-69,-312,-27,-28,-166,-310,204,204,-312,204,-312,-28,204,-167,-311,204,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,204,204,204,204,204,204,204,204,-266,-267,-268,-265,-269,-270,-312,204,-312,-28,-266,204,204,-312,204,204,-202,-201,204,204,204,-218,204,204,204,204,204,-80,204,-214,-215,-217,204,-224,-225,-226,-227,-228,-229,-230,-231,-232,-233,-234,204,204,204,204,204,204,204,204,204,204,204,204,204,204,204,204,204,204,204,204,204,204,204,-11,204,-12,204,-266,204,204,-312,204,204,204,-203,204,-205,204,-79,204,-213,-216,-312,-182,204,-312,-28,-266,-204,204,204,-312,204,204,204,204,204,204,204,-11,-266,204,204,-206,-80,-208,-209,204,204,-312,204,204,204,-207,-210,204,204,-212,204,-211,]),'INT_CONST_BIN':([14,45,46,47,77,78,79,95,96,97,101,106,113,114,116,117,118,130,133,144,152,153,154,155,156,157,158,159,160,161,162,164,168,172,177,183,184,185,187,188,189,190,191,195,196,217,218,219,220,224,227,228,241,250,264,266,267,269,273,274,275,276,280,281,282,284,285,286,288,289,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,341,342,343,346,349,350,351,363,370,372,382,384,385,387,389,398,400,401,402,436,438,448,449,450,458,462,463,464,465,467,468,469,470,472,475,481,482,487,488,489,496,497,499,500,503,514,516,518,520,523,526,528,530,534,535,536,539,],[-68,-117,-118,-119,-83,-69,-312,-27,-28,-166,-310,205,205,-312,205,-312,-28,205,-167,-311,205,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,205,205,205,205,205,205,205,205,-266,-267,-268,-265,-269,-270,-312,205,-312,-28,-266,205,205,-312,205,205,-202,-201,205,205,205,-218,205,205,205,205,205,-80,205,-214,-215,-217,205,-224,-225,-226,-227,-228,-229,-230,-231,-232,-233,-234,205,205,205,205,205,205,205,205,205,205,205,205,205,205,205,205,205,205,205,205,205,205,205,-11,205,-12,205,-266,205,205,-312,205,205,205,-203,205,-205,205,-79,205,-213,-216,-312,-182,205,-312,-28,-266,-204,205,205,-312,205,205,205,205,205,205,205,-11,-266,205,205,-206,-80,-208,-209,205,205,-312,205,205,205,-207,-210,205,205,-212,205,-211,]),'INT_CONST_CHAR':([14,45,46,47,77,78,79,95,96,97,101,106,113,114,116,117,118,130,133,144,152,153,154,155,156,157,158,159,160,161,162,164,168,172,177,183,184,185,187,188,189,190,191,195,196,217,218,219,220,224,227,228,241,250,264,266,267,269,273,274,275,276,280,281,282,284,285,286,288,289,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,341,342,343,346,349,350,351,363,370,372,382,384,385,387,389,398,400,401,402,436,438,448,449,450,458,462,463,464,465,467,468,469,470,472,475,481,482,487,488,489,496,497,499,500,503,514,516,518,520,523,526,528,530,534,535,536,539,],[-68,-117,-118,-119,-83,-69,-312,-27,-28,-166,-310,206,206,-312,206,-312,-28,206,-167,-311,206,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,206,206,206,206,206,206,206,206,-266,-267,-268,-265,-269,-270,-312,206,-312,-28,-266,206,206,-312,206,206,-202,-201,206,206,206,-218,206,206,206,206,206,-80,206,-214,-215,-217,206,-224,-225,-226,-227,-228,-229,-230,-231,-232,-233,-234,206,206,206,206,206,206,206,206,206,206,206,206,206,206,206,206,206,206,206,206,206,206,206,-11,206,-12,206,-266,206,206,-312,206,206,206,-203,206,-205,206,-79,206,-213,-216,-312,-182,206,-312,-28,-266,-204,206,206,-312,206,206,206,206,206,206,206,-11,-266,206,206,-206,-80,-208,-209,206,206,-312,206,206,206,-207,-210,206,206,-212,206,-211,]),'FLOAT_CONST':([14,45,46,47,77,78,79,95,96,97,101,106,113,114,116,117,118,130,133,144,152,153,154,155,156,157,158,159,160,161,162,164,168,172,177,183,184,185,187,188,189,190,191,195,196,217,218,219,220,224,227,228,241,250,264,266,267,269,273,274,275,276,280,281,282,284,285,286,288,289,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,341,342,343,346,349,350,351,363,370,372,382,384,385,387,389,398,400,401,402,436,438,448,449,450,458,462,463,464,465,467,468,469,470,472,475,481,482,487,488,489,496,497,499,500,503,514,516,518,520,523,526,528,530,534,535,536,539,],[-68,-117,-118,-119,-83,-69,-312,-27,-28,-166,-310,207,207,-312,207,-312,-28,207,-167,-311,207,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,207,207,207,207,207,207,207,207,-266,-267,-268,-265,-269,-270,-312,207,-312,-28,-266,207,207,-312,207,207,-202,-201,207,207,207,-218,207,207,207,207,207,-80,207,-214,-215,-217,207,-224,-225,-226,-227,-228,-229,-230,-231,-232,-233,-234,207,207,207,207,207,207,207,207,207,207,207,207,207,207,207,207,207,207,207,207,207,207,207,-11,207,-12,207,-266,207,207,-312,207,207,207,-203,207,-205,207,-79,207,-213,-216,-312,-182,207,-312,-28,-266,-204,207,207,-312,207,207,207,207,207,207,207,-11,-266,207,207,-206,-80,-208,-209,207,207,-312,207,207,207,-207,-210,207,207,-212,207,-211,]),'HEX_FLOAT_CONST':([14,45,46,47,77,78,79,95,96,97,101,106,113,114,116,117,118,130,133,144,152,153,154,155,156,157,158,159,160,161,162,164,168,172,177,183,184,185,187,188,189,190,191,195,196,217,218,219,220,224,227,228,241,250,264,266,267,269,273,274,275,276,280,281,282,284,285,286,288,289,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,341,342,343,346,349,350,351,363,370,372,382,384,385,387,389,398,400,401,402,436,438,448,449,450,458,462,463,464,465,467,468,469,470,472,475,481,482,487,488,489,496,497,499,500,503,514,516,518,520,523,526,528,530,534,535,536,539,],[-68,-117,-118,-119,-83,-69,-312,-27,-28,-166,-310,208,208,-312,208,-312,-28,208,-167,-311,208,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,208,208,208,208,208,208,208,208,-266,-267,-268,-265,-269,-270,-312,208,-312,-28,-266,208,208,-312,208,208,-202,-201,208,208,208,-218,208,208,208,208,208,-80,208,-214,-215,-217,208,-224,-225,-226,-227,-228,-229,-230,-231,-232,-233,-234,208,208,208,208,208,208,208,208,208,208,208,208,208,208,208,208,208,208,208,208,208,208,208,-11,208,-12,208,-266,208,208,-312,208,208,208,-203,208,-205,208,-79,208,-213,-216,-312,-182,208,-312,-28,-266,-204,208,208,-312,208,208,208,208,208,208,208,-11,-266,208,208,-206,-80,-208,-209,208,208,-312,208,208,208,-207,-210,208,208,-212,208,-211,]),'CHAR_CONST':([14,45,46,47,77,78,79,95,96,97,101,106,113,114,116,117,118,130,133,144,152,153,154,155,156,157,158,159,160,161,162,164,168,172,177,183,184,185,187,188,189,190,191,195,196,217,218,219,220,224,227,228,241,250,264,266,267,269,273,274,275,276,280,281,282,284,285,286,288,289,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,341,342,343,346,349,350,351,363,370,372,382,384,385,387,389,398,400,401,402,436,438,448,449,450,458,462,463,464,465,467,468,469,470,472,475,481,482,487,488,489,496,497,499,500,503,514,516,518,520,523,526,528,530,534,535,536,539,],[-68,-117,-118,-119,-83,-69,-312,-27,-28,-166,-310,209,209,-312,209,-312,-28,209,-167,-311,209,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,209,209,209,209,209,209,209,209,-266,-267,-268,-265,-269,-270,-312,209,-312,-28,-266,209,209,-312,209,209,-202,-201,209,209,209,-218,209,209,209,209,209,-80,209,-214,-215,-217,209,-224,-225,-226,-227,-228,-229,-230,-231,-232,-233,-234,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,-11,209,-12,209,-266,209,209,-312,209,209,209,-203,209,-205,209,-79,209,-213,-216,-312,-182,209,-312,-28,-266,-204,209,209,-312,209,209,209,209,209,209,209,-11,-266,209,209,-206,-80,-208,-209,209,209,-312,209,209,209,-207,-210,209,209,-212,209,-211,]),'WCHAR_CONST':([14,45,46,47,77,78,79,95,96,97,101,106,113,114,116,117,118,130,133,144,152,153,154,155,156,157,158,159,160,161,162,164,168,172,177,183,184,185,187,188,189,190,191,195,196,217,218,219,220,224,227,228,241,250,264,266,267,269,273,274,275,276,280,281,282,284,285,286,288,289,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,341,342,343,346,349,350,351,363,370,372,382,384,385,387,389,398,400,401,402,436,438,448,449,450,458,462,463,464,465,467,468,469,470,472,475,481,482,487,488,489,496,497,499,500,503,514,516,518,520,523,526,528,530,534,535,536,539,],[-68,-117,-118,-119,-83,-69,-312,-27,-28,-166,-310,210,210,-312,210,-312,-28,210,-167,-311,210,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,210,210,210,210,210,210,210,210,-266,-267,-268,-265,-269,-270,-312,210,-312,-28,-266,210,210,-312,210,210,-202,-201,210,210,210,-218,210,210,210,210,210,-80,210,-214,-215,-217,210,-224,-225,-226,-227,-228,-229,-230,-231,-232,-233,-234,210,210,210,210,210,210,210,210,210,210,210,210,210,210,210,210,210,210,210,210,210,210,210,-11,210,-12,210,-266,210,210,-312,210,210,210,-203,210,-205,210,-79,210,-213,-216,-312,-182,210,-312,-28,-266,-204,210,210,-312,210,210,210,210,210,210,210,-11,-266,210,210,-206,-80,-208,-209,210,210,-312,210,210,210,-207,-210,210,210,-212,210,-211,]),'STRING_LITERAL':([14,45,46,47,77,78,79,95,96,97,101,106,113,114,116,117,118,130,133,144,152,153,154,155,156,157,158,159,160,161,162,164,168,172,177,183,184,185,187,188,189,190,191,194,195,196,199,217,218,219,220,224,227,228,241,250,264,266,267,269,273,274,275,276,280,281,282,284,285,286,288,289,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,336,341,342,343,346,349,350,351,363,370,372,382,384,385,387,389,398,400,401,402,436,438,448,449,450,458,462,463,464,465,467,468,469,470,472,475,478,481,482,487,488,489,496,497,499,500,503,514,516,518,520,523,526,528,530,534,535,536,539,],[-68,-117,-118,-119,-83,-69,-312,-27,-28,-166,-310,194,194,-312,194,-312,-28,194,-167,-311,194,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,194,194,194,194,194,194,194,194,-266,-267,-268,-265,-306,-269,-270,336,-312,194,-312,-28,-266,194,194,-312,194,194,-202,-201,194,194,194,-218,194,194,194,194,194,-80,194,-214,-215,-217,194,-224,-225,-226,-227,-228,-229,-230,-231,-232,-233,-234,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,-307,-11,194,-12,194,-266,194,194,-312,194,194,194,-203,194,-205,194,-79,194,-213,-216,-312,-182,194,-312,-28,-266,-204,194,194,-312,194,194,194,194,194,194,506,194,-11,-266,194,194,-206,-80,-208,-209,194,194,-312,194,194,194,-207,-210,194,194,-212,194,-211,]),'WSTRING_LITERAL':([14,45,46,47,77,78,79,95,96,97,101,106,113,114,116,117,118,130,133,144,152,153,154,155,156,157,158,159,160,161,162,164,168,172,177,183,184,185,187,188,189,190,191,195,196,200,211,217,218,219,220,224,227,228,241,250,264,266,267,269,273,274,275,276,280,281,282,284,285,286,288,289,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,337,341,342,343,346,349,350,351,363,370,372,382,384,385,387,389,398,400,401,402,436,438,448,449,450,458,462,463,464,465,467,468,469,470,472,475,481,482,487,488,489,496,497,499,500,503,514,516,518,520,523,526,528,530,534,535,536,539,],[-68,-117,-118,-119,-83,-69,-312,-27,-28,-166,-310,211,211,-312,211,-312,-28,211,-167,-311,211,-200,-198,-199,-72,-73,-74,-75,-76,-77,-78,211,211,211,211,211,211,211,211,-266,-267,-268,-265,-269,-270,337,-308,-312,211,-312,-28,-266,211,211,-312,211,211,-202,-201,211,211,211,-218,211,211,211,211,211,-80,211,-214,-215,-217,211,-224,-225,-226,-227,-228,-229,-230,-231,-232,-233,-234,211,211,211,211,211,211,211,211,211,211,211,211,211,211,211,211,211,211,211,211,211,211,211,-309,-11,211,-12,211,-266,211,211,-312,211,211,211,-203,211,-205,211,-79,211,-213,-216,-312,-182,211,-312,-28,-266,-204,211,211,-312,211,211,211,211,211,211,211,-11,-266,211,211,-206,-80,-208,-209,211,211,-312,211,211,211,-207,-210,211,211,-212,211,-211,]),'ELSE':([14,78,144,156,157,158,159,160,161,162,266,275,284,285,288,289,291,384,387,398,401,402,462,496,497,499,500,526,528,535,539,],[-68,-69,-311,-72,-73,-74,-75,-76,-77,-78,-202,-218,-78,-80,-214,-215,-217,-203,-205,-79,-213,-216,-204,-206,514,-208,-209,-207,-210,-212,-211,]),'PPPRAGMASTR':([14,],[78,]),'EQUALS':([15,23,62,73,74,75,76,81,92,108,110,127,131,138,144,163,180,182,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,214,229,230,272,327,328,329,331,332,333,336,337,344,345,352,353,354,355,390,425,427,428,429,430,439,441,442,443,446,447,466,473,474,477,483,484,485,515,521,527,537,541,],[-52,-29,-162,113,-163,-54,-37,-53,130,-162,-55,-296,-30,250,-311,-296,293,-259,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-38,-35,-36,-257,-279,-280,-260,-261,-262,-263,-307,-309,438,-183,-43,-44,-31,-34,-289,-274,-275,-276,-277,-278,-184,-186,-39,-42,-32,-33,-258,-272,-273,-264,-185,-40,-41,-281,-290,-282,-283,-284,]),'COMMA':([15,20,21,23,25,26,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,62,63,64,65,66,70,72,73,74,75,76,81,87,90,91,92,94,95,96,97,98,99,102,103,108,110,121,123,124,125,126,127,131,132,133,136,137,138,142,144,148,163,169,178,179,180,181,182,186,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,213,214,215,216,229,230,233,234,235,236,237,238,239,242,243,244,245,246,247,248,249,252,254,255,258,259,261,262,263,265,271,272,278,279,290,327,328,329,331,332,333,336,337,340,352,353,354,355,359,360,361,362,374,375,376,377,378,379,383,388,390,391,392,394,395,396,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,433,434,435,437,442,443,446,447,453,454,456,460,461,466,473,474,477,480,484,485,490,491,492,493,494,495,498,501,504,505,506,509,510,511,515,521,524,525,527,531,533,537,540,541,],[-52,-116,-93,-29,-97,-312,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-162,-89,-90,-91,-92,111,-120,-122,-163,-54,-37,-53,-94,129,-124,-126,-164,-27,-28,-166,-152,-153,-132,-133,-162,-55,231,232,-170,-175,-312,-296,-30,-165,-167,249,-157,-160,-135,-311,-130,-296,280,-219,-222,-257,-236,-259,-238,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-121,-38,-123,-177,-35,-36,-172,-173,-174,-188,-56,-1,-2,-45,-190,-125,-127,249,249,-154,-158,-137,-139,-134,-128,-129,381,-147,-149,-131,-235,-257,280,-312,280,-279,-280,-260,-261,-262,-263,-307,-309,436,-43,-44,-31,-34,-171,-176,-57,-189,-155,-156,-159,-161,-136,-138,-151,280,-289,-187,-188,-220,280,280,-223,280,-239,-240,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,280,475,-274,-294,-275,-276,-277,-278,478,479,-178,-180,-39,-42,-32,-33,-191,-197,-195,-148,-150,-258,-272,-273,-264,-179,-40,-41,-50,-51,-193,-192,-194,-196,516,280,-237,-295,520,-181,-46,-49,-281,-290,-47,-48,-282,536,280,-283,475,-284,]),'RPAREN':([15,20,21,23,25,26,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,63,64,65,66,75,76,80,81,87,93,94,95,96,97,98,99,102,103,110,112,115,119,120,121,122,123,124,125,126,127,131,132,133,142,144,148,169,178,179,180,181,182,186,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,214,221,222,229,230,233,234,235,236,237,238,239,240,242,243,248,252,254,255,258,259,265,268,271,272,277,278,279,324,327,328,329,331,332,333,336,337,352,353,354,355,358,359,360,361,362,364,365,366,367,368,369,373,374,375,378,379,386,388,390,391,392,393,394,395,396,403,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,424,425,426,427,428,429,430,431,432,442,443,446,447,451,452,453,454,456,459,466,473,474,477,484,485,490,491,492,493,494,495,501,503,504,505,507,508,510,511,515,518,519,521,524,525,527,529,531,532,537,538,540,541,],[-52,-116,-93,-29,-97,-312,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-89,-90,-91,-92,-54,-37,-312,-53,-94,131,-164,-27,-28,-166,-152,-153,-132,-133,-55,214,-312,229,230,-168,-17,-18,-170,-175,-312,-296,-30,-165,-167,-135,-311,-130,-14,-219,-222,-257,-236,-259,-238,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-38,352,353,-35,-36,-172,-173,-174,-188,-56,-1,-2,-312,-45,-190,-154,-137,-139,-134,-128,-129,-131,-13,-235,-257,389,390,-312,425,-279,-280,-260,-261,-262,-263,-307,-309,-43,-44,-31,-34,-169,-171,-176,-57,-189,-312,453,454,-188,-23,-24,-312,-155,-156,-136,-138,463,464,-289,-187,-188,-312,-220,467,468,-223,-239,-240,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,474,-274,-294,-275,-276,-277,-278,476,477,-39,-42,-32,-33,490,491,-191,-197,-195,495,-258,-272,-273,-264,-40,-41,-50,-51,-193,-192,-194,-196,517,-312,-237,-295,521,-291,-46,-49,-281,-312,530,-290,-47,-48,-282,534,537,-292,-283,-293,541,-284,]),'COLON':([15,20,23,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,74,75,76,81,98,99,102,103,108,110,127,131,142,144,145,148,163,165,178,179,180,181,182,186,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,214,229,230,248,252,254,255,258,259,263,265,270,271,272,327,328,329,331,332,333,336,337,352,353,354,355,374,375,378,379,381,390,394,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,425,427,428,429,430,442,443,446,447,466,473,474,477,484,485,504,515,521,527,537,541,],[-52,-116,-29,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-163,-54,-37,-53,-152,-153,-132,-133,-162,-55,-296,-30,-135,-311,264,-130,269,274,-219,-222,-257,-236,-259,-238,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-38,-35,-36,-154,-137,-139,-134,-128,-129,382,-131,385,-235,-257,-279,-280,-260,-261,-262,-263,-307,-309,-43,-44,-31,-34,-155,-156,-136,-138,264,-289,-220,-223,472,-239,-240,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-274,-275,-276,-277,-278,-39,-42,-32,-33,-258,-272,-273,-264,-40,-41,-237,-281,-290,-282,-283,-284,]),'LBRACKET':([15,20,21,23,25,26,27,28,29,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,63,64,65,66,75,76,81,87,94,95,96,97,98,99,101,102,103,110,126,127,131,132,133,142,144,148,163,182,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,214,217,229,230,236,237,240,242,243,248,252,254,255,258,259,265,279,327,328,336,337,344,345,352,353,354,355,361,362,367,374,375,378,379,390,392,393,425,427,428,429,430,436,439,441,442,443,446,447,453,454,456,465,473,474,483,484,485,490,491,492,493,494,495,507,508,510,511,515,516,521,524,525,527,532,537,538,541,],[79,-116,-93,-29,-97,-312,-113,-114,-115,-221,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-117,-118,-119,-95,-96,-98,-99,-100,-89,-90,-91,-92,114,-37,79,-94,-164,-27,-28,-166,-152,-153,-310,-132,-133,114,241,-296,-30,-165,-167,-135,-311,-130,-296,323,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-38,346,-35,-36,241,363,241,-45,372,-154,-137,-139,-134,-128,-129,-131,241,-279,-280,-307,-309,346,-183,-43,-44,-31,-34,363,372,241,-155,-156,-136,-138,-289,241,241,-274,-275,-276,-277,-278,346,-184,-186,-39,-42,-32,-33,-191,-197,-195,346,-272,-273,-185,-40,-41,-50,-51,-193,-192,-194,-196,523,-291,-46,-49,-281,346,-290,-47,-48,-282,-292,-283,-293,-284,]),'RBRACKET':([45,46,47,79,95,96,97,114,116,118,127,133,144,178,179,180,181,182,186,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,218,220,223,224,225,226,241,271,272,327,328,329,331,332,333,336,337,348,349,356,357,363,370,371,372,390,394,403,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,425,427,428,429,430,440,444,445,448,450,455,457,458,466,473,474,477,486,487,504,512,513,515,521,527,533,537,541,],[-117,-118,-119,-312,-27,-28,-166,-312,-312,-28,-296,-167,-311,-219,-222,-257,-236,-259,-238,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-312,-28,354,355,-3,-4,-312,-235,-257,-279,-280,-260,-261,-262,-263,-307,-309,442,443,446,447,-312,-312,456,-312,-289,-220,-223,-239,-240,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,473,-274,-275,-276,-277,-278,483,484,485,-312,-28,492,493,494,-258,-272,-273,-264,510,511,-237,524,525,-281,-290,-282,538,-283,-284,]),'PERIOD':([101,127,144,163,182,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,217,327,328,336,337,344,345,390,425,427,428,429,430,436,439,441,465,473,474,483,507,508,515,516,521,527,532,537,538,541,],[-310,-296,-311,-296,325,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,347,-279,-280,-307,-309,347,-183,-289,-274,-275,-276,-277,-278,347,-184,-186,347,-272,-273,-185,522,-291,-281,347,-290,-282,-292,-283,-293,-284,]),'ARROW':([127,144,163,182,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,327,328,336,337,390,425,427,428,429,430,473,474,515,521,527,537,541,],[-296,-311,-296,326,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-279,-280,-307,-309,-289,-274,-275,-276,-277,-278,-272,-273,-281,-290,-282,-283,-284,]),'XOREQUAL':([127,144,163,180,182,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,272,327,328,329,331,332,333,336,337,390,425,427,428,429,430,466,473,474,477,515,521,527,537,541,],[-296,-311,-296,294,-259,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-257,-279,-280,-260,-261,-262,-263,-307,-309,-289,-274,-275,-276,-277,-278,-258,-272,-273,-264,-281,-290,-282,-283,-284,]),'TIMESEQUAL':([127,144,163,180,182,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,272,327,328,329,331,332,333,336,337,390,425,427,428,429,430,466,473,474,477,515,521,527,537,541,],[-296,-311,-296,295,-259,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-257,-279,-280,-260,-261,-262,-263,-307,-309,-289,-274,-275,-276,-277,-278,-258,-272,-273,-264,-281,-290,-282,-283,-284,]),'DIVEQUAL':([127,144,163,180,182,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,272,327,328,329,331,332,333,336,337,390,425,427,428,429,430,466,473,474,477,515,521,527,537,541,],[-296,-311,-296,296,-259,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-257,-279,-280,-260,-261,-262,-263,-307,-309,-289,-274,-275,-276,-277,-278,-258,-272,-273,-264,-281,-290,-282,-283,-284,]),'MODEQUAL':([127,144,163,180,182,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,272,327,328,329,331,332,333,336,337,390,425,427,428,429,430,466,473,474,477,515,521,527,537,541,],[-296,-311,-296,297,-259,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-257,-279,-280,-260,-261,-262,-263,-307,-309,-289,-274,-275,-276,-277,-278,-258,-272,-273,-264,-281,-290,-282,-283,-284,]),'PLUSEQUAL':([127,144,163,180,182,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,272,327,328,329,331,332,333,336,337,390,425,427,428,429,430,466,473,474,477,515,521,527,537,541,],[-296,-311,-296,298,-259,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-257,-279,-280,-260,-261,-262,-263,-307,-309,-289,-274,-275,-276,-277,-278,-258,-272,-273,-264,-281,-290,-282,-283,-284,]),'MINUSEQUAL':([127,144,163,180,182,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,272,327,328,329,331,332,333,336,337,390,425,427,428,429,430,466,473,474,477,515,521,527,537,541,],[-296,-311,-296,299,-259,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-257,-279,-280,-260,-261,-262,-263,-307,-309,-289,-274,-275,-276,-277,-278,-258,-272,-273,-264,-281,-290,-282,-283,-284,]),'LSHIFTEQUAL':([127,144,163,180,182,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,272,327,328,329,331,332,333,336,337,390,425,427,428,429,430,466,473,474,477,515,521,527,537,541,],[-296,-311,-296,300,-259,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-257,-279,-280,-260,-261,-262,-263,-307,-309,-289,-274,-275,-276,-277,-278,-258,-272,-273,-264,-281,-290,-282,-283,-284,]),'RSHIFTEQUAL':([127,144,163,180,182,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,272,327,328,329,331,332,333,336,337,390,425,427,428,429,430,466,473,474,477,515,521,527,537,541,],[-296,-311,-296,301,-259,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-257,-279,-280,-260,-261,-262,-263,-307,-309,-289,-274,-275,-276,-277,-278,-258,-272,-273,-264,-281,-290,-282,-283,-284,]),'ANDEQUAL':([127,144,163,180,182,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,272,327,328,329,331,332,333,336,337,390,425,427,428,429,430,466,473,474,477,515,521,527,537,541,],[-296,-311,-296,302,-259,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-257,-279,-280,-260,-261,-262,-263,-307,-309,-289,-274,-275,-276,-277,-278,-258,-272,-273,-264,-281,-290,-282,-283,-284,]),'OREQUAL':([127,144,163,180,182,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,272,327,328,329,331,332,333,336,337,390,425,427,428,429,430,466,473,474,477,515,521,527,537,541,],[-296,-311,-296,303,-259,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-257,-279,-280,-260,-261,-262,-263,-307,-309,-289,-274,-275,-276,-277,-278,-258,-272,-273,-264,-281,-290,-282,-283,-284,]),'CONDOP':([127,144,163,180,181,182,186,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,272,327,328,329,331,332,333,336,337,390,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,425,427,428,429,430,466,473,474,477,515,521,527,537,541,],[-296,-311,-296,-257,304,-259,-238,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-257,-279,-280,-260,-261,-262,-263,-307,-309,-289,-239,-240,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-274,-275,-276,-277,-278,-258,-272,-273,-264,-281,-290,-282,-283,-284,]),'DIVIDE':([127,144,163,180,181,182,186,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,272,327,328,329,331,332,333,336,337,390,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,425,427,428,429,430,466,473,474,477,515,521,527,537,541,],[-296,-311,-296,-257,306,-259,-238,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-257,-279,-280,-260,-261,-262,-263,-307,-309,-289,-239,-240,-241,306,306,306,306,306,306,306,306,306,306,306,306,306,306,306,-274,-275,-276,-277,-278,-258,-272,-273,-264,-281,-290,-282,-283,-284,]),'MOD':([127,144,163,180,181,182,186,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,272,327,328,329,331,332,333,336,337,390,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,425,427,428,429,430,466,473,474,477,515,521,527,537,541,],[-296,-311,-296,-257,307,-259,-238,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-257,-279,-280,-260,-261,-262,-263,-307,-309,-289,-239,-240,-241,307,307,307,307,307,307,307,307,307,307,307,307,307,307,307,-274,-275,-276,-277,-278,-258,-272,-273,-264,-281,-290,-282,-283,-284,]),'RSHIFT':([127,144,163,180,181,182,186,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,272,327,328,329,331,332,333,336,337,390,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,425,427,428,429,430,466,473,474,477,515,521,527,537,541,],[-296,-311,-296,-257,310,-259,-238,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-257,-279,-280,-260,-261,-262,-263,-307,-309,-289,-239,-240,-241,-242,-243,-244,-245,310,310,310,310,310,310,310,310,310,310,310,-274,-275,-276,-277,-278,-258,-272,-273,-264,-281,-290,-282,-283,-284,]),'LSHIFT':([127,144,163,180,181,182,186,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,272,327,328,329,331,332,333,336,337,390,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,425,427,428,429,430,466,473,474,477,515,521,527,537,541,],[-296,-311,-296,-257,311,-259,-238,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-257,-279,-280,-260,-261,-262,-263,-307,-309,-289,-239,-240,-241,-242,-243,-244,-245,311,311,311,311,311,311,311,311,311,311,311,-274,-275,-276,-277,-278,-258,-272,-273,-264,-281,-290,-282,-283,-284,]),'LT':([127,144,163,180,181,182,186,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,272,327,328,329,331,332,333,336,337,390,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,425,427,428,429,430,466,473,474,477,515,521,527,537,541,],[-296,-311,-296,-257,312,-259,-238,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-257,-279,-280,-260,-261,-262,-263,-307,-309,-289,-239,-240,-241,-242,-243,-244,-245,-246,-247,-248,-249,312,312,312,312,312,312,312,-274,-275,-276,-277,-278,-258,-272,-273,-264,-281,-290,-282,-283,-284,]),'LE':([127,144,163,180,181,182,186,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,272,327,328,329,331,332,333,336,337,390,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,425,427,428,429,430,466,473,474,477,515,521,527,537,541,],[-296,-311,-296,-257,313,-259,-238,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-257,-279,-280,-260,-261,-262,-263,-307,-309,-289,-239,-240,-241,-242,-243,-244,-245,-246,-247,-248,-249,313,313,313,313,313,313,313,-274,-275,-276,-277,-278,-258,-272,-273,-264,-281,-290,-282,-283,-284,]),'GE':([127,144,163,180,181,182,186,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,272,327,328,329,331,332,333,336,337,390,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,425,427,428,429,430,466,473,474,477,515,521,527,537,541,],[-296,-311,-296,-257,314,-259,-238,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-257,-279,-280,-260,-261,-262,-263,-307,-309,-289,-239,-240,-241,-242,-243,-244,-245,-246,-247,-248,-249,314,314,314,314,314,314,314,-274,-275,-276,-277,-278,-258,-272,-273,-264,-281,-290,-282,-283,-284,]),'GT':([127,144,163,180,181,182,186,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,272,327,328,329,331,332,333,336,337,390,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,425,427,428,429,430,466,473,474,477,515,521,527,537,541,],[-296,-311,-296,-257,315,-259,-238,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-257,-279,-280,-260,-261,-262,-263,-307,-309,-289,-239,-240,-241,-242,-243,-244,-245,-246,-247,-248,-249,315,315,315,315,315,315,315,-274,-275,-276,-277,-278,-258,-272,-273,-264,-281,-290,-282,-283,-284,]),'EQ':([127,144,163,180,181,182,186,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,272,327,328,329,331,332,333,336,337,390,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,425,427,428,429,430,466,473,474,477,515,521,527,537,541,],[-296,-311,-296,-257,316,-259,-238,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-257,-279,-280,-260,-261,-262,-263,-307,-309,-289,-239,-240,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,316,316,316,316,316,-274,-275,-276,-277,-278,-258,-272,-273,-264,-281,-290,-282,-283,-284,]),'NE':([127,144,163,180,181,182,186,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,272,327,328,329,331,332,333,336,337,390,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,425,427,428,429,430,466,473,474,477,515,521,527,537,541,],[-296,-311,-296,-257,317,-259,-238,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-257,-279,-280,-260,-261,-262,-263,-307,-309,-289,-239,-240,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,317,317,317,317,317,-274,-275,-276,-277,-278,-258,-272,-273,-264,-281,-290,-282,-283,-284,]),'OR':([127,144,163,180,181,182,186,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,272,327,328,329,331,332,333,336,337,390,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,425,427,428,429,430,466,473,474,477,515,521,527,537,541,],[-296,-311,-296,-257,319,-259,-238,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-257,-279,-280,-260,-261,-262,-263,-307,-309,-289,-239,-240,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-252,-253,-254,319,319,-274,-275,-276,-277,-278,-258,-272,-273,-264,-281,-290,-282,-283,-284,]),'XOR':([127,144,163,180,181,182,186,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,272,327,328,329,331,332,333,336,337,390,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,425,427,428,429,430,466,473,474,477,515,521,527,537,541,],[-296,-311,-296,-257,320,-259,-238,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-257,-279,-280,-260,-261,-262,-263,-307,-309,-289,-239,-240,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-252,320,-254,320,320,-274,-275,-276,-277,-278,-258,-272,-273,-264,-281,-290,-282,-283,-284,]),'LAND':([127,144,163,180,181,182,186,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,272,327,328,329,331,332,333,336,337,390,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,425,427,428,429,430,466,473,474,477,515,521,527,537,541,],[-296,-311,-296,-257,321,-259,-238,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-257,-279,-280,-260,-261,-262,-263,-307,-309,-289,-239,-240,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,321,-274,-275,-276,-277,-278,-258,-272,-273,-264,-281,-290,-282,-283,-284,]),'LOR':([127,144,163,180,181,182,186,192,194,197,198,199,200,202,203,204,205,206,207,208,209,210,211,272,327,328,329,331,332,333,336,337,390,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,425,427,428,429,430,466,473,474,477,515,521,527,537,541,],[-296,-311,-296,-257,322,-259,-238,-271,-306,-285,-286,-287,-288,-297,-298,-299,-300,-301,-302,-303,-304,-305,-308,-257,-279,-280,-260,-261,-262,-263,-307,-309,-289,-239,-240,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-274,-275,-276,-277,-278,-258,-272,-273,-264,-281,-290,-282,-283,-284,]),'ELLIPSIS':([231,],[358,]),}
-
-_lr_action = {}
-for _k, _v in _lr_action_items.items():
-   for _x,_y in zip(_v[0],_v[1]):
-      if not _x in _lr_action:  _lr_action[_x] = {}
-      _lr_action[_x][_k] = _y
-del _lr_action_items
-
-_lr_goto_items = {'translation_unit_or_empty':([0,],[1,]),'translation_unit':([0,],[2,]),'empty':([0,10,11,17,18,19,22,26,60,61,62,79,80,106,114,115,116,117,126,145,152,172,217,218,219,240,241,269,274,279,284,286,363,364,370,372,373,385,393,400,436,448,449,464,465,467,468,470,503,514,516,518,530,534,],[3,57,69,83,83,83,89,95,69,89,57,95,122,151,95,122,225,95,238,260,268,268,341,225,95,368,95,268,268,238,268,268,95,122,225,225,368,268,368,268,482,225,95,268,482,268,268,268,268,268,482,268,268,268,]),'external_declaration':([0,2,],[4,55,]),'function_definition':([0,2,],[5,5,]),'declaration':([0,2,10,58,62,106,152,286,],[6,6,59,107,59,154,154,400,]),'pp_directive':([0,2,],[7,7,]),'pppragma_directive':([0,2,104,106,139,140,141,152,172,251,253,269,274,284,385,464,467,468,514,530,534,],[8,8,147,162,147,147,147,162,284,147,147,284,284,162,284,284,284,284,284,284,284,]),'id_declarator':([0,2,11,22,24,60,61,71,111,126,129,145,240,381,],[10,10,62,92,93,108,92,93,108,233,108,108,93,108,]),'declaration_specifiers':([0,2,10,58,62,80,106,115,152,231,240,286,364,373,393,],[11,11,60,60,60,126,60,126,60,126,126,60,126,126,126,]),'decl_body':([0,2,10,58,62,106,152,286,],[12,12,12,12,12,12,12,12,]),'direct_id_declarator':([0,2,11,16,22,24,60,61,68,71,111,126,129,145,236,240,367,381,],[15,15,15,81,15,15,15,15,81,15,15,15,15,15,81,15,81,15,]),'pointer':([0,2,11,22,24,60,61,71,94,111,126,129,145,240,279,381,393,],[16,16,68,16,16,68,16,68,132,68,236,68,68,367,392,68,392,]),'type_qualifier':([0,2,10,11,17,18,19,26,58,60,62,79,80,96,104,106,114,115,117,118,126,139,140,141,145,149,152,168,219,220,231,240,241,251,253,273,279,286,330,334,335,338,363,364,373,393,449,450,],[17,17,17,63,17,17,17,97,17,63,17,97,17,133,97,17,97,17,97,133,63,97,97,97,259,133,17,97,97,133,17,17,97,97,97,97,259,17,97,97,97,97,97,17,17,17,97,133,]),'storage_class_specifier':([0,2,10,11,17,18,19,58,60,62,80,106,115,126,152,231,240,286,364,373,393,],[18,18,18,64,18,18,18,18,64,18,18,18,18,64,18,18,18,18,18,18,18,]),'function_specifier':([0,2,10,11,17,18,19,58,60,62,80,106,115,126,152,231,240,286,364,373,393,],[19,19,19,65,19,19,19,19,65,19,19,19,19,65,19,19,19,19,19,19,19,]),'type_specifier_no_typeid':([0,2,10,11,22,58,60,61,62,80,104,106,115,126,128,139,140,141,145,149,152,168,231,240,251,253,273,279,286,330,334,335,338,364,373,393,],[20,20,20,66,20,20,66,20,20,20,20,20,20,66,20,20,20,20,258,20,20,20,20,20,20,20,20,258,20,20,20,20,20,20,20,20,]),'type_specifier':([0,2,10,22,58,61,62,80,104,106,115,128,139,140,141,149,152,168,231,240,251,253,273,286,330,334,335,338,364,373,393,],[21,21,21,87,21,87,21,21,148,21,21,87,148,148,148,265,21,148,21,21,148,148,148,21,148,148,148,148,21,21,21,]),'declaration_specifiers_no_type':([0,2,10,17,18,19,58,62,80,106,115,152,231,240,286,364,373,393,],[22,22,61,84,84,84,61,61,128,61,128,61,128,128,61,128,128,128,]),'typedef_name':([0,2,10,22,58,61,62,80,104,106,115,128,139,140,141,149,152,168,231,240,251,253,273,286,330,334,335,338,364,373,393,],[27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,]),'enum_specifier':([0,2,10,22,58,61,62,80,104,106,115,128,139,140,141,149,152,168,231,240,251,253,273,286,330,334,335,338,364,373,393,],[28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,]),'struct_or_union_specifier':([0,2,10,22,58,61,62,80,104,106,115,128,139,140,141,149,152,168,231,240,251,253,273,286,330,334,335,338,364,373,393,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'struct_or_union':([0,2,10,22,58,61,62,80,104,106,115,128,139,140,141,149,152,168,231,240,251,253,273,286,330,334,335,338,364,373,393,],[32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'declaration_list_opt':([10,62,],[56,109,]),'declaration_list':([10,62,],[58,58,]),'init_declarator_list_opt':([11,60,],[67,67,]),'init_declarator_list':([11,60,],[70,70,]),'init_declarator':([11,60,111,129,],[72,72,213,244,]),'declarator':([11,60,111,129,145,381,],[73,73,73,73,263,263,]),'typeid_declarator':([11,60,71,111,129,145,381,],[74,74,112,74,74,74,74,]),'direct_typeid_declarator':([11,60,68,71,111,129,145,381,],[75,75,110,75,75,75,75,75,]),'declaration_specifiers_no_type_opt':([17,18,19,],[82,85,86,]),'id_init_declarator_list_opt':([22,61,],[88,88,]),'id_init_declarator_list':([22,61,],[90,90,]),'id_init_declarator':([22,61,],[91,91,]),'type_qualifier_list_opt':([26,79,114,117,219,241,363,449,],[94,116,218,227,350,370,448,488,]),'type_qualifier_list':([26,79,104,114,117,139,140,141,168,219,241,251,253,273,330,334,335,338,363,449,],[96,118,149,220,96,149,149,149,149,96,96,149,149,149,149,149,149,149,450,96,]),'brace_open':([31,32,56,98,99,102,103,106,109,113,130,152,172,269,274,284,342,385,389,463,464,467,468,476,477,481,514,530,534,],[100,104,106,134,135,139,140,106,106,217,217,106,106,106,106,106,217,106,465,465,106,106,106,465,465,217,106,106,106,]),'compound_statement':([56,106,109,152,172,269,274,284,385,464,467,468,514,530,534,],[105,158,212,158,158,158,158,158,158,158,158,158,158,158,158,]),'parameter_type_list':([80,115,240,364,373,393,],[119,221,369,451,369,369,]),'identifier_list_opt':([80,115,364,],[120,222,452,]),'parameter_list':([80,115,240,364,373,393,],[121,121,121,121,121,121,]),'identifier_list':([80,115,364,],[123,123,123,]),'parameter_declaration':([80,115,231,240,364,373,393,],[124,124,359,124,124,124,124,]),'identifier':([80,106,113,115,116,130,152,164,168,172,177,183,184,185,187,218,227,228,232,250,264,269,273,274,276,280,281,282,284,286,292,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,342,346,347,350,351,364,370,372,382,385,389,400,448,463,464,467,468,469,470,472,475,479,481,488,489,503,514,518,520,522,523,530,534,536,],[125,197,197,125,197,197,197,197,197,197,197,197,197,197,197,197,197,197,360,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,441,197,197,125,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,508,197,197,197,197,197,197,197,532,197,197,197,197,]),'enumerator_list':([100,134,135,],[136,246,247,]),'enumerator':([100,134,135,249,],[137,137,137,376,]),'struct_declaration_list':([104,139,140,],[141,251,253,]),'brace_close':([104,136,139,140,141,150,246,247,251,253,339,436,498,516,],[142,248,252,254,255,266,374,375,378,379,435,480,515,527,]),'struct_declaration':([104,139,140,141,251,253,],[143,143,143,256,256,256,]),'specifier_qualifier_list':([104,139,140,141,168,251,253,273,330,334,335,338,],[145,145,145,145,279,145,145,279,279,279,279,279,]),'block_item_list_opt':([106,],[150,]),'block_item_list':([106,],[152,]),'block_item':([106,152,],[153,267,]),'statement':([106,152,172,269,274,284,385,464,467,468,514,530,534,],[155,155,285,285,285,398,285,497,285,285,285,285,285,]),'labeled_statement':([106,152,172,269,274,284,385,464,467,468,514,530,534,],[156,156,156,156,156,156,156,156,156,156,156,156,156,]),'expression_statement':([106,152,172,269,274,284,385,464,467,468,514,530,534,],[157,157,157,157,157,157,157,157,157,157,157,157,157,]),'selection_statement':([106,152,172,269,274,284,385,464,467,468,514,530,534,],[159,159,159,159,159,159,159,159,159,159,159,159,159,]),'iteration_statement':([106,152,172,269,274,284,385,464,467,468,514,530,534,],[160,160,160,160,160,160,160,160,160,160,160,160,160,]),'jump_statement':([106,152,172,269,274,284,385,464,467,468,514,530,534,],[161,161,161,161,161,161,161,161,161,161,161,161,161,]),'expression_opt':([106,152,172,269,274,284,286,385,400,464,467,468,470,503,514,518,530,534,],[166,166,166,166,166,166,399,166,471,166,166,166,502,519,166,529,166,166,]),'expression':([106,152,168,172,177,269,273,274,276,281,282,284,286,304,323,330,334,385,400,464,467,468,469,470,503,514,518,523,530,534,],[169,169,278,169,290,169,278,169,388,395,396,169,169,404,423,278,278,169,169,169,169,169,501,169,169,169,169,533,169,169,]),'assignment_expression':([106,113,116,130,152,168,172,177,218,227,228,269,273,274,276,280,281,282,284,286,292,304,323,324,330,334,342,350,351,370,372,385,400,448,464,467,468,469,470,475,481,488,489,503,514,518,523,530,534,536,],[178,216,226,216,178,178,178,178,226,356,357,178,178,178,178,394,178,178,178,178,403,178,178,426,178,178,216,444,445,226,226,178,178,226,178,178,178,178,178,505,216,512,513,178,178,178,178,178,178,426,]),'conditional_expression':([106,113,116,130,152,164,168,172,177,218,227,228,250,264,269,273,274,276,280,281,282,284,286,292,304,323,324,330,334,342,346,350,351,370,372,382,385,400,448,464,467,468,469,470,472,475,481,488,489,503,514,518,520,523,530,534,536,],[179,179,179,179,179,271,179,179,179,179,179,179,271,271,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,271,179,179,179,179,271,179,179,179,179,179,179,179,179,504,179,179,179,179,179,179,179,271,179,179,179,179,]),'unary_expression':([106,113,116,130,152,164,168,172,177,183,184,185,187,218,227,228,250,264,269,273,274,276,280,281,282,284,286,292,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,342,346,350,351,370,372,382,385,389,400,448,463,464,467,468,469,470,472,475,481,488,489,503,514,518,520,523,530,534,536,],[180,180,180,180,180,272,180,180,180,329,331,272,333,180,180,180,272,272,180,180,180,180,180,180,180,180,180,180,180,272,272,272,272,272,272,272,272,272,272,272,272,272,272,272,272,272,272,180,180,180,180,180,272,180,180,180,180,272,180,272,180,180,272,180,180,180,180,180,272,180,180,180,180,180,180,180,272,180,180,180,180,]),'binary_expression':([106,113,116,130,152,164,168,172,177,218,227,228,250,264,269,273,274,276,280,281,282,284,286,292,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,342,346,350,351,370,372,382,385,400,448,464,467,468,469,470,472,475,481,488,489,503,514,518,520,523,530,534,536,],[181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,]),'postfix_expression':([106,113,116,130,152,164,168,172,177,183,184,185,187,218,227,228,250,264,269,273,274,276,280,281,282,284,286,292,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,342,346,350,351,370,372,382,385,389,400,448,463,464,467,468,469,470,472,475,481,488,489,503,514,518,520,523,530,534,536,],[182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,]),'unary_operator':([106,113,116,130,152,164,168,172,177,183,184,185,187,218,227,228,250,264,269,273,274,276,280,281,282,284,286,292,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,342,346,350,351,370,372,382,385,389,400,448,463,464,467,468,469,470,472,475,481,488,489,503,514,518,520,523,530,534,536,],[185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,]),'cast_expression':([106,113,116,130,152,164,168,172,177,185,218,227,228,250,264,269,273,274,276,280,281,282,284,286,292,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,342,346,350,351,370,372,382,385,389,400,448,463,464,467,468,469,470,472,475,481,488,489,503,514,518,520,523,530,534,536,],[186,186,186,186,186,186,186,186,186,332,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,466,186,186,466,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,]),'primary_expression':([106,113,116,130,152,164,168,172,177,183,184,185,187,218,227,228,250,264,269,273,274,276,280,281,282,284,286,292,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,342,346,350,351,370,372,382,385,389,400,448,463,464,467,468,469,470,472,475,481,488,489,503,514,518,520,523,530,534,536,],[192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,]),'constant':([106,113,116,130,152,164,168,172,177,183,184,185,187,218,227,228,250,264,269,273,274,276,280,281,282,284,286,292,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,342,346,350,351,370,372,382,385,389,400,448,463,464,467,468,469,470,472,475,481,488,489,503,514,518,520,523,530,534,536,],[198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,]),'unified_string_literal':([106,113,116,130,152,164,168,172,177,183,184,185,187,218,227,228,250,264,269,273,274,276,280,281,282,284,286,292,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,342,346,350,351,370,372,382,385,389,400,448,463,464,467,468,469,470,472,475,481,488,489,503,514,518,520,523,530,534,536,],[199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,]),'unified_wstring_literal':([106,113,116,130,152,164,168,172,177,183,184,185,187,218,227,228,250,264,269,273,274,276,280,281,282,284,286,292,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,330,334,342,346,350,351,370,372,382,385,389,400,448,463,464,467,468,469,470,472,475,481,488,489,503,514,518,520,523,530,534,536,],[200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,]),'initializer':([113,130,342,481,],[215,245,437,509,]),'assignment_expression_opt':([116,218,370,372,448,],[223,348,455,457,486,]),'typeid_noparen_declarator':([126,],[234,]),'abstract_declarator_opt':([126,279,],[235,391,]),'direct_typeid_noparen_declarator':([126,236,],[237,361,]),'abstract_declarator':([126,240,279,393,],[239,365,239,365,]),'direct_abstract_declarator':([126,236,240,279,367,392,393,],[243,362,243,243,362,362,243,]),'struct_declarator_list_opt':([145,],[257,]),'struct_declarator_list':([145,],[261,]),'struct_declarator':([145,381,],[262,460,]),'constant_expression':([164,250,264,346,382,520,],[270,377,383,440,461,531,]),'type_name':([168,273,330,334,335,338,],[277,386,431,432,433,434,]),'pragmacomp_or_statement':([172,269,274,385,464,467,468,514,530,534,],[283,384,387,462,496,499,500,526,535,539,]),'assignment_operator':([180,],[292,]),'initializer_list_opt':([217,],[339,]),'initializer_list':([217,465,],[340,498,]),'designation_opt':([217,436,465,516,],[342,481,342,481,]),'designation':([217,436,465,516,],[343,343,343,343,]),'designator_list':([217,436,465,516,],[344,344,344,344,]),'designator':([217,344,436,465,516,],[345,439,345,345,345,]),'parameter_type_list_opt':([240,373,393,],[366,459,366,]),'argument_expression_list':([324,536,],[424,540,]),'offsetof_member_designator':([479,],[507,]),}
-
-_lr_goto = {}
-for _k, _v in _lr_goto_items.items():
-   for _x, _y in zip(_v[0], _v[1]):
-       if not _x in _lr_goto: _lr_goto[_x] = {}
-       _lr_goto[_x][_k] = _y
-del _lr_goto_items
-_lr_productions = [
-  ("S' -> translation_unit_or_empty","S'",1,None,None,None),
-  ('abstract_declarator_opt -> empty','abstract_declarator_opt',1,'p_abstract_declarator_opt','plyparser.py',43),
-  ('abstract_declarator_opt -> abstract_declarator','abstract_declarator_opt',1,'p_abstract_declarator_opt','plyparser.py',44),
-  ('assignment_expression_opt -> empty','assignment_expression_opt',1,'p_assignment_expression_opt','plyparser.py',43),
-  ('assignment_expression_opt -> assignment_expression','assignment_expression_opt',1,'p_assignment_expression_opt','plyparser.py',44),
-  ('block_item_list_opt -> empty','block_item_list_opt',1,'p_block_item_list_opt','plyparser.py',43),
-  ('block_item_list_opt -> block_item_list','block_item_list_opt',1,'p_block_item_list_opt','plyparser.py',44),
-  ('declaration_list_opt -> empty','declaration_list_opt',1,'p_declaration_list_opt','plyparser.py',43),
-  ('declaration_list_opt -> declaration_list','declaration_list_opt',1,'p_declaration_list_opt','plyparser.py',44),
-  ('declaration_specifiers_no_type_opt -> empty','declaration_specifiers_no_type_opt',1,'p_declaration_specifiers_no_type_opt','plyparser.py',43),
-  ('declaration_specifiers_no_type_opt -> declaration_specifiers_no_type','declaration_specifiers_no_type_opt',1,'p_declaration_specifiers_no_type_opt','plyparser.py',44),
-  ('designation_opt -> empty','designation_opt',1,'p_designation_opt','plyparser.py',43),
-  ('designation_opt -> designation','designation_opt',1,'p_designation_opt','plyparser.py',44),
-  ('expression_opt -> empty','expression_opt',1,'p_expression_opt','plyparser.py',43),
-  ('expression_opt -> expression','expression_opt',1,'p_expression_opt','plyparser.py',44),
-  ('id_init_declarator_list_opt -> empty','id_init_declarator_list_opt',1,'p_id_init_declarator_list_opt','plyparser.py',43),
-  ('id_init_declarator_list_opt -> id_init_declarator_list','id_init_declarator_list_opt',1,'p_id_init_declarator_list_opt','plyparser.py',44),
-  ('identifier_list_opt -> empty','identifier_list_opt',1,'p_identifier_list_opt','plyparser.py',43),
-  ('identifier_list_opt -> identifier_list','identifier_list_opt',1,'p_identifier_list_opt','plyparser.py',44),
-  ('init_declarator_list_opt -> empty','init_declarator_list_opt',1,'p_init_declarator_list_opt','plyparser.py',43),
-  ('init_declarator_list_opt -> init_declarator_list','init_declarator_list_opt',1,'p_init_declarator_list_opt','plyparser.py',44),
-  ('initializer_list_opt -> empty','initializer_list_opt',1,'p_initializer_list_opt','plyparser.py',43),
-  ('initializer_list_opt -> initializer_list','initializer_list_opt',1,'p_initializer_list_opt','plyparser.py',44),
-  ('parameter_type_list_opt -> empty','parameter_type_list_opt',1,'p_parameter_type_list_opt','plyparser.py',43),
-  ('parameter_type_list_opt -> parameter_type_list','parameter_type_list_opt',1,'p_parameter_type_list_opt','plyparser.py',44),
-  ('struct_declarator_list_opt -> empty','struct_declarator_list_opt',1,'p_struct_declarator_list_opt','plyparser.py',43),
-  ('struct_declarator_list_opt -> struct_declarator_list','struct_declarator_list_opt',1,'p_struct_declarator_list_opt','plyparser.py',44),
-  ('type_qualifier_list_opt -> empty','type_qualifier_list_opt',1,'p_type_qualifier_list_opt','plyparser.py',43),
-  ('type_qualifier_list_opt -> type_qualifier_list','type_qualifier_list_opt',1,'p_type_qualifier_list_opt','plyparser.py',44),
-  ('direct_id_declarator -> ID','direct_id_declarator',1,'p_direct_id_declarator_1','plyparser.py',126),
-  ('direct_id_declarator -> LPAREN id_declarator RPAREN','direct_id_declarator',3,'p_direct_id_declarator_2','plyparser.py',126),
-  ('direct_id_declarator -> direct_id_declarator LBRACKET type_qualifier_list_opt assignment_expression_opt RBRACKET','direct_id_declarator',5,'p_direct_id_declarator_3','plyparser.py',126),
-  ('direct_id_declarator -> direct_id_declarator LBRACKET STATIC type_qualifier_list_opt assignment_expression RBRACKET','direct_id_declarator',6,'p_direct_id_declarator_4','plyparser.py',126),
-  ('direct_id_declarator -> direct_id_declarator LBRACKET type_qualifier_list STATIC assignment_expression RBRACKET','direct_id_declarator',6,'p_direct_id_declarator_4','plyparser.py',127),
-  ('direct_id_declarator -> direct_id_declarator LBRACKET type_qualifier_list_opt TIMES RBRACKET','direct_id_declarator',5,'p_direct_id_declarator_5','plyparser.py',126),
-  ('direct_id_declarator -> direct_id_declarator LPAREN parameter_type_list RPAREN','direct_id_declarator',4,'p_direct_id_declarator_6','plyparser.py',126),
-  ('direct_id_declarator -> direct_id_declarator LPAREN identifier_list_opt RPAREN','direct_id_declarator',4,'p_direct_id_declarator_6','plyparser.py',127),
-  ('direct_typeid_declarator -> TYPEID','direct_typeid_declarator',1,'p_direct_typeid_declarator_1','plyparser.py',126),
-  ('direct_typeid_declarator -> LPAREN typeid_declarator RPAREN','direct_typeid_declarator',3,'p_direct_typeid_declarator_2','plyparser.py',126),
-  ('direct_typeid_declarator -> direct_typeid_declarator LBRACKET type_qualifier_list_opt assignment_expression_opt RBRACKET','direct_typeid_declarator',5,'p_direct_typeid_declarator_3','plyparser.py',126),
-  ('direct_typeid_declarator -> direct_typeid_declarator LBRACKET STATIC type_qualifier_list_opt assignment_expression RBRACKET','direct_typeid_declarator',6,'p_direct_typeid_declarator_4','plyparser.py',126),
-  ('direct_typeid_declarator -> direct_typeid_declarator LBRACKET type_qualifier_list STATIC assignment_expression RBRACKET','direct_typeid_declarator',6,'p_direct_typeid_declarator_4','plyparser.py',127),
-  ('direct_typeid_declarator -> direct_typeid_declarator LBRACKET type_qualifier_list_opt TIMES RBRACKET','direct_typeid_declarator',5,'p_direct_typeid_declarator_5','plyparser.py',126),
-  ('direct_typeid_declarator -> direct_typeid_declarator LPAREN parameter_type_list RPAREN','direct_typeid_declarator',4,'p_direct_typeid_declarator_6','plyparser.py',126),
-  ('direct_typeid_declarator -> direct_typeid_declarator LPAREN identifier_list_opt RPAREN','direct_typeid_declarator',4,'p_direct_typeid_declarator_6','plyparser.py',127),
-  ('direct_typeid_noparen_declarator -> TYPEID','direct_typeid_noparen_declarator',1,'p_direct_typeid_noparen_declarator_1','plyparser.py',126),
-  ('direct_typeid_noparen_declarator -> direct_typeid_noparen_declarator LBRACKET type_qualifier_list_opt assignment_expression_opt RBRACKET','direct_typeid_noparen_declarator',5,'p_direct_typeid_noparen_declarator_3','plyparser.py',126),
-  ('direct_typeid_noparen_declarator -> direct_typeid_noparen_declarator LBRACKET STATIC type_qualifier_list_opt assignment_expression RBRACKET','direct_typeid_noparen_declarator',6,'p_direct_typeid_noparen_declarator_4','plyparser.py',126),
-  ('direct_typeid_noparen_declarator -> direct_typeid_noparen_declarator LBRACKET type_qualifier_list STATIC assignment_expression RBRACKET','direct_typeid_noparen_declarator',6,'p_direct_typeid_noparen_declarator_4','plyparser.py',127),
-  ('direct_typeid_noparen_declarator -> direct_typeid_noparen_declarator LBRACKET type_qualifier_list_opt TIMES RBRACKET','direct_typeid_noparen_declarator',5,'p_direct_typeid_noparen_declarator_5','plyparser.py',126),
-  ('direct_typeid_noparen_declarator -> direct_typeid_noparen_declarator LPAREN parameter_type_list RPAREN','direct_typeid_noparen_declarator',4,'p_direct_typeid_noparen_declarator_6','plyparser.py',126),
-  ('direct_typeid_noparen_declarator -> direct_typeid_noparen_declarator LPAREN identifier_list_opt RPAREN','direct_typeid_noparen_declarator',4,'p_direct_typeid_noparen_declarator_6','plyparser.py',127),
-  ('id_declarator -> direct_id_declarator','id_declarator',1,'p_id_declarator_1','plyparser.py',126),
-  ('id_declarator -> pointer direct_id_declarator','id_declarator',2,'p_id_declarator_2','plyparser.py',126),
-  ('typeid_declarator -> direct_typeid_declarator','typeid_declarator',1,'p_typeid_declarator_1','plyparser.py',126),
-  ('typeid_declarator -> pointer direct_typeid_declarator','typeid_declarator',2,'p_typeid_declarator_2','plyparser.py',126),
-  ('typeid_noparen_declarator -> direct_typeid_noparen_declarator','typeid_noparen_declarator',1,'p_typeid_noparen_declarator_1','plyparser.py',126),
-  ('typeid_noparen_declarator -> pointer direct_typeid_noparen_declarator','typeid_noparen_declarator',2,'p_typeid_noparen_declarator_2','plyparser.py',126),
-  ('translation_unit_or_empty -> translation_unit','translation_unit_or_empty',1,'p_translation_unit_or_empty','c_parser.py',514),
-  ('translation_unit_or_empty -> empty','translation_unit_or_empty',1,'p_translation_unit_or_empty','c_parser.py',515),
-  ('translation_unit -> external_declaration','translation_unit',1,'p_translation_unit_1','c_parser.py',523),
-  ('translation_unit -> translation_unit external_declaration','translation_unit',2,'p_translation_unit_2','c_parser.py',530),
-  ('external_declaration -> function_definition','external_declaration',1,'p_external_declaration_1','c_parser.py',541),
-  ('external_declaration -> declaration','external_declaration',1,'p_external_declaration_2','c_parser.py',546),
-  ('external_declaration -> pp_directive','external_declaration',1,'p_external_declaration_3','c_parser.py',551),
-  ('external_declaration -> pppragma_directive','external_declaration',1,'p_external_declaration_3','c_parser.py',552),
-  ('external_declaration -> SEMI','external_declaration',1,'p_external_declaration_4','c_parser.py',557),
-  ('pp_directive -> PPHASH','pp_directive',1,'p_pp_directive','c_parser.py',562),
-  ('pppragma_directive -> PPPRAGMA','pppragma_directive',1,'p_pppragma_directive','c_parser.py',568),
-  ('pppragma_directive -> PPPRAGMA PPPRAGMASTR','pppragma_directive',2,'p_pppragma_directive','c_parser.py',569),
-  ('function_definition -> id_declarator declaration_list_opt compound_statement','function_definition',3,'p_function_definition_1','c_parser.py',580),
-  ('function_definition -> declaration_specifiers id_declarator declaration_list_opt compound_statement','function_definition',4,'p_function_definition_2','c_parser.py',597),
-  ('statement -> labeled_statement','statement',1,'p_statement','c_parser.py',608),
-  ('statement -> expression_statement','statement',1,'p_statement','c_parser.py',609),
-  ('statement -> compound_statement','statement',1,'p_statement','c_parser.py',610),
-  ('statement -> selection_statement','statement',1,'p_statement','c_parser.py',611),
-  ('statement -> iteration_statement','statement',1,'p_statement','c_parser.py',612),
-  ('statement -> jump_statement','statement',1,'p_statement','c_parser.py',613),
-  ('statement -> pppragma_directive','statement',1,'p_statement','c_parser.py',614),
-  ('pragmacomp_or_statement -> pppragma_directive statement','pragmacomp_or_statement',2,'p_pragmacomp_or_statement','c_parser.py',661),
-  ('pragmacomp_or_statement -> statement','pragmacomp_or_statement',1,'p_pragmacomp_or_statement','c_parser.py',662),
-  ('decl_body -> declaration_specifiers init_declarator_list_opt','decl_body',2,'p_decl_body','c_parser.py',681),
-  ('decl_body -> declaration_specifiers_no_type id_init_declarator_list_opt','decl_body',2,'p_decl_body','c_parser.py',682),
-  ('declaration -> decl_body SEMI','declaration',2,'p_declaration','c_parser.py',741),
-  ('declaration_list -> declaration','declaration_list',1,'p_declaration_list','c_parser.py',750),
-  ('declaration_list -> declaration_list declaration','declaration_list',2,'p_declaration_list','c_parser.py',751),
-  ('declaration_specifiers_no_type -> type_qualifier declaration_specifiers_no_type_opt','declaration_specifiers_no_type',2,'p_declaration_specifiers_no_type_1','c_parser.py',761),
-  ('declaration_specifiers_no_type -> storage_class_specifier declaration_specifiers_no_type_opt','declaration_specifiers_no_type',2,'p_declaration_specifiers_no_type_2','c_parser.py',766),
-  ('declaration_specifiers_no_type -> function_specifier declaration_specifiers_no_type_opt','declaration_specifiers_no_type',2,'p_declaration_specifiers_no_type_3','c_parser.py',771),
-  ('declaration_specifiers -> declaration_specifiers type_qualifier','declaration_specifiers',2,'p_declaration_specifiers_1','c_parser.py',777),
-  ('declaration_specifiers -> declaration_specifiers storage_class_specifier','declaration_specifiers',2,'p_declaration_specifiers_2','c_parser.py',782),
-  ('declaration_specifiers -> declaration_specifiers function_specifier','declaration_specifiers',2,'p_declaration_specifiers_3','c_parser.py',787),
-  ('declaration_specifiers -> declaration_specifiers type_specifier_no_typeid','declaration_specifiers',2,'p_declaration_specifiers_4','c_parser.py',792),
-  ('declaration_specifiers -> type_specifier','declaration_specifiers',1,'p_declaration_specifiers_5','c_parser.py',797),
-  ('declaration_specifiers -> declaration_specifiers_no_type type_specifier','declaration_specifiers',2,'p_declaration_specifiers_6','c_parser.py',802),
-  ('storage_class_specifier -> AUTO','storage_class_specifier',1,'p_storage_class_specifier','c_parser.py',808),
-  ('storage_class_specifier -> REGISTER','storage_class_specifier',1,'p_storage_class_specifier','c_parser.py',809),
-  ('storage_class_specifier -> STATIC','storage_class_specifier',1,'p_storage_class_specifier','c_parser.py',810),
-  ('storage_class_specifier -> EXTERN','storage_class_specifier',1,'p_storage_class_specifier','c_parser.py',811),
-  ('storage_class_specifier -> TYPEDEF','storage_class_specifier',1,'p_storage_class_specifier','c_parser.py',812),
-  ('function_specifier -> INLINE','function_specifier',1,'p_function_specifier','c_parser.py',817),
-  ('type_specifier_no_typeid -> VOID','type_specifier_no_typeid',1,'p_type_specifier_no_typeid','c_parser.py',822),
-  ('type_specifier_no_typeid -> _BOOL','type_specifier_no_typeid',1,'p_type_specifier_no_typeid','c_parser.py',823),
-  ('type_specifier_no_typeid -> CHAR','type_specifier_no_typeid',1,'p_type_specifier_no_typeid','c_parser.py',824),
-  ('type_specifier_no_typeid -> SHORT','type_specifier_no_typeid',1,'p_type_specifier_no_typeid','c_parser.py',825),
-  ('type_specifier_no_typeid -> INT','type_specifier_no_typeid',1,'p_type_specifier_no_typeid','c_parser.py',826),
-  ('type_specifier_no_typeid -> LONG','type_specifier_no_typeid',1,'p_type_specifier_no_typeid','c_parser.py',827),
-  ('type_specifier_no_typeid -> FLOAT','type_specifier_no_typeid',1,'p_type_specifier_no_typeid','c_parser.py',828),
-  ('type_specifier_no_typeid -> DOUBLE','type_specifier_no_typeid',1,'p_type_specifier_no_typeid','c_parser.py',829),
-  ('type_specifier_no_typeid -> _COMPLEX','type_specifier_no_typeid',1,'p_type_specifier_no_typeid','c_parser.py',830),
-  ('type_specifier_no_typeid -> SIGNED','type_specifier_no_typeid',1,'p_type_specifier_no_typeid','c_parser.py',831),
-  ('type_specifier_no_typeid -> UNSIGNED','type_specifier_no_typeid',1,'p_type_specifier_no_typeid','c_parser.py',832),
-  ('type_specifier_no_typeid -> __INT128','type_specifier_no_typeid',1,'p_type_specifier_no_typeid','c_parser.py',833),
-  ('type_specifier -> typedef_name','type_specifier',1,'p_type_specifier','c_parser.py',838),
-  ('type_specifier -> enum_specifier','type_specifier',1,'p_type_specifier','c_parser.py',839),
-  ('type_specifier -> struct_or_union_specifier','type_specifier',1,'p_type_specifier','c_parser.py',840),
-  ('type_specifier -> type_specifier_no_typeid','type_specifier',1,'p_type_specifier','c_parser.py',841),
-  ('type_qualifier -> CONST','type_qualifier',1,'p_type_qualifier','c_parser.py',846),
-  ('type_qualifier -> RESTRICT','type_qualifier',1,'p_type_qualifier','c_parser.py',847),
-  ('type_qualifier -> VOLATILE','type_qualifier',1,'p_type_qualifier','c_parser.py',848),
-  ('init_declarator_list -> init_declarator','init_declarator_list',1,'p_init_declarator_list','c_parser.py',853),
-  ('init_declarator_list -> init_declarator_list COMMA init_declarator','init_declarator_list',3,'p_init_declarator_list','c_parser.py',854),
-  ('init_declarator -> declarator','init_declarator',1,'p_init_declarator','c_parser.py',862),
-  ('init_declarator -> declarator EQUALS initializer','init_declarator',3,'p_init_declarator','c_parser.py',863),
-  ('id_init_declarator_list -> id_init_declarator','id_init_declarator_list',1,'p_id_init_declarator_list','c_parser.py',868),
-  ('id_init_declarator_list -> id_init_declarator_list COMMA init_declarator','id_init_declarator_list',3,'p_id_init_declarator_list','c_parser.py',869),
-  ('id_init_declarator -> id_declarator','id_init_declarator',1,'p_id_init_declarator','c_parser.py',874),
-  ('id_init_declarator -> id_declarator EQUALS initializer','id_init_declarator',3,'p_id_init_declarator','c_parser.py',875),
-  ('specifier_qualifier_list -> specifier_qualifier_list type_specifier_no_typeid','specifier_qualifier_list',2,'p_specifier_qualifier_list_1','c_parser.py',882),
-  ('specifier_qualifier_list -> specifier_qualifier_list type_qualifier','specifier_qualifier_list',2,'p_specifier_qualifier_list_2','c_parser.py',887),
-  ('specifier_qualifier_list -> type_specifier','specifier_qualifier_list',1,'p_specifier_qualifier_list_3','c_parser.py',892),
-  ('specifier_qualifier_list -> type_qualifier_list type_specifier','specifier_qualifier_list',2,'p_specifier_qualifier_list_4','c_parser.py',897),
-  ('struct_or_union_specifier -> struct_or_union ID','struct_or_union_specifier',2,'p_struct_or_union_specifier_1','c_parser.py',906),
-  ('struct_or_union_specifier -> struct_or_union TYPEID','struct_or_union_specifier',2,'p_struct_or_union_specifier_1','c_parser.py',907),
-  ('struct_or_union_specifier -> struct_or_union brace_open struct_declaration_list brace_close','struct_or_union_specifier',4,'p_struct_or_union_specifier_2','c_parser.py',917),
-  ('struct_or_union_specifier -> struct_or_union brace_open brace_close','struct_or_union_specifier',3,'p_struct_or_union_specifier_2','c_parser.py',918),
-  ('struct_or_union_specifier -> struct_or_union ID brace_open struct_declaration_list brace_close','struct_or_union_specifier',5,'p_struct_or_union_specifier_3','c_parser.py',935),
-  ('struct_or_union_specifier -> struct_or_union ID brace_open brace_close','struct_or_union_specifier',4,'p_struct_or_union_specifier_3','c_parser.py',936),
-  ('struct_or_union_specifier -> struct_or_union TYPEID brace_open struct_declaration_list brace_close','struct_or_union_specifier',5,'p_struct_or_union_specifier_3','c_parser.py',937),
-  ('struct_or_union_specifier -> struct_or_union TYPEID brace_open brace_close','struct_or_union_specifier',4,'p_struct_or_union_specifier_3','c_parser.py',938),
-  ('struct_or_union -> STRUCT','struct_or_union',1,'p_struct_or_union','c_parser.py',954),
-  ('struct_or_union -> UNION','struct_or_union',1,'p_struct_or_union','c_parser.py',955),
-  ('struct_declaration_list -> struct_declaration','struct_declaration_list',1,'p_struct_declaration_list','c_parser.py',962),
-  ('struct_declaration_list -> struct_declaration_list struct_declaration','struct_declaration_list',2,'p_struct_declaration_list','c_parser.py',963),
-  ('struct_declaration -> specifier_qualifier_list struct_declarator_list_opt SEMI','struct_declaration',3,'p_struct_declaration_1','c_parser.py',971),
-  ('struct_declaration -> SEMI','struct_declaration',1,'p_struct_declaration_2','c_parser.py',1009),
-  ('struct_declaration -> pppragma_directive','struct_declaration',1,'p_struct_declaration_3','c_parser.py',1014),
-  ('struct_declarator_list -> struct_declarator','struct_declarator_list',1,'p_struct_declarator_list','c_parser.py',1019),
-  ('struct_declarator_list -> struct_declarator_list COMMA struct_declarator','struct_declarator_list',3,'p_struct_declarator_list','c_parser.py',1020),
-  ('struct_declarator -> declarator','struct_declarator',1,'p_struct_declarator_1','c_parser.py',1028),
-  ('struct_declarator -> declarator COLON constant_expression','struct_declarator',3,'p_struct_declarator_2','c_parser.py',1033),
-  ('struct_declarator -> COLON constant_expression','struct_declarator',2,'p_struct_declarator_2','c_parser.py',1034),
-  ('enum_specifier -> ENUM ID','enum_specifier',2,'p_enum_specifier_1','c_parser.py',1042),
-  ('enum_specifier -> ENUM TYPEID','enum_specifier',2,'p_enum_specifier_1','c_parser.py',1043),
-  ('enum_specifier -> ENUM brace_open enumerator_list brace_close','enum_specifier',4,'p_enum_specifier_2','c_parser.py',1048),
-  ('enum_specifier -> ENUM ID brace_open enumerator_list brace_close','enum_specifier',5,'p_enum_specifier_3','c_parser.py',1053),
-  ('enum_specifier -> ENUM TYPEID brace_open enumerator_list brace_close','enum_specifier',5,'p_enum_specifier_3','c_parser.py',1054),
-  ('enumerator_list -> enumerator','enumerator_list',1,'p_enumerator_list','c_parser.py',1059),
-  ('enumerator_list -> enumerator_list COMMA','enumerator_list',2,'p_enumerator_list','c_parser.py',1060),
-  ('enumerator_list -> enumerator_list COMMA enumerator','enumerator_list',3,'p_enumerator_list','c_parser.py',1061),
-  ('enumerator -> ID','enumerator',1,'p_enumerator','c_parser.py',1072),
-  ('enumerator -> ID EQUALS constant_expression','enumerator',3,'p_enumerator','c_parser.py',1073),
-  ('declarator -> id_declarator','declarator',1,'p_declarator','c_parser.py',1088),
-  ('declarator -> typeid_declarator','declarator',1,'p_declarator','c_parser.py',1089),
-  ('pointer -> TIMES type_qualifier_list_opt','pointer',2,'p_pointer','c_parser.py',1200),
-  ('pointer -> TIMES type_qualifier_list_opt pointer','pointer',3,'p_pointer','c_parser.py',1201),
-  ('type_qualifier_list -> type_qualifier','type_qualifier_list',1,'p_type_qualifier_list','c_parser.py',1230),
-  ('type_qualifier_list -> type_qualifier_list type_qualifier','type_qualifier_list',2,'p_type_qualifier_list','c_parser.py',1231),
-  ('parameter_type_list -> parameter_list','parameter_type_list',1,'p_parameter_type_list','c_parser.py',1236),
-  ('parameter_type_list -> parameter_list COMMA ELLIPSIS','parameter_type_list',3,'p_parameter_type_list','c_parser.py',1237),
-  ('parameter_list -> parameter_declaration','parameter_list',1,'p_parameter_list','c_parser.py',1245),
-  ('parameter_list -> parameter_list COMMA parameter_declaration','parameter_list',3,'p_parameter_list','c_parser.py',1246),
-  ('parameter_declaration -> declaration_specifiers id_declarator','parameter_declaration',2,'p_parameter_declaration_1','c_parser.py',1265),
-  ('parameter_declaration -> declaration_specifiers typeid_noparen_declarator','parameter_declaration',2,'p_parameter_declaration_1','c_parser.py',1266),
-  ('parameter_declaration -> declaration_specifiers abstract_declarator_opt','parameter_declaration',2,'p_parameter_declaration_2','c_parser.py',1277),
-  ('identifier_list -> identifier','identifier_list',1,'p_identifier_list','c_parser.py',1308),
-  ('identifier_list -> identifier_list COMMA identifier','identifier_list',3,'p_identifier_list','c_parser.py',1309),
-  ('initializer -> assignment_expression','initializer',1,'p_initializer_1','c_parser.py',1318),
-  ('initializer -> brace_open initializer_list_opt brace_close','initializer',3,'p_initializer_2','c_parser.py',1323),
-  ('initializer -> brace_open initializer_list COMMA brace_close','initializer',4,'p_initializer_2','c_parser.py',1324),
-  ('initializer_list -> designation_opt initializer','initializer_list',2,'p_initializer_list','c_parser.py',1332),
-  ('initializer_list -> initializer_list COMMA designation_opt initializer','initializer_list',4,'p_initializer_list','c_parser.py',1333),
-  ('designation -> designator_list EQUALS','designation',2,'p_designation','c_parser.py',1344),
-  ('designator_list -> designator','designator_list',1,'p_designator_list','c_parser.py',1352),
-  ('designator_list -> designator_list designator','designator_list',2,'p_designator_list','c_parser.py',1353),
-  ('designator -> LBRACKET constant_expression RBRACKET','designator',3,'p_designator','c_parser.py',1358),
-  ('designator -> PERIOD identifier','designator',2,'p_designator','c_parser.py',1359),
-  ('type_name -> specifier_qualifier_list abstract_declarator_opt','type_name',2,'p_type_name','c_parser.py',1364),
-  ('abstract_declarator -> pointer','abstract_declarator',1,'p_abstract_declarator_1','c_parser.py',1375),
-  ('abstract_declarator -> pointer direct_abstract_declarator','abstract_declarator',2,'p_abstract_declarator_2','c_parser.py',1383),
-  ('abstract_declarator -> direct_abstract_declarator','abstract_declarator',1,'p_abstract_declarator_3','c_parser.py',1388),
-  ('direct_abstract_declarator -> LPAREN abstract_declarator RPAREN','direct_abstract_declarator',3,'p_direct_abstract_declarator_1','c_parser.py',1398),
-  ('direct_abstract_declarator -> direct_abstract_declarator LBRACKET assignment_expression_opt RBRACKET','direct_abstract_declarator',4,'p_direct_abstract_declarator_2','c_parser.py',1402),
-  ('direct_abstract_declarator -> LBRACKET type_qualifier_list_opt assignment_expression_opt RBRACKET','direct_abstract_declarator',4,'p_direct_abstract_declarator_3','c_parser.py',1413),
-  ('direct_abstract_declarator -> direct_abstract_declarator LBRACKET TIMES RBRACKET','direct_abstract_declarator',4,'p_direct_abstract_declarator_4','c_parser.py',1423),
-  ('direct_abstract_declarator -> LBRACKET TIMES RBRACKET','direct_abstract_declarator',3,'p_direct_abstract_declarator_5','c_parser.py',1434),
-  ('direct_abstract_declarator -> direct_abstract_declarator LPAREN parameter_type_list_opt RPAREN','direct_abstract_declarator',4,'p_direct_abstract_declarator_6','c_parser.py',1443),
-  ('direct_abstract_declarator -> LPAREN parameter_type_list_opt RPAREN','direct_abstract_declarator',3,'p_direct_abstract_declarator_7','c_parser.py',1453),
-  ('block_item -> declaration','block_item',1,'p_block_item','c_parser.py',1464),
-  ('block_item -> statement','block_item',1,'p_block_item','c_parser.py',1465),
-  ('block_item_list -> block_item','block_item_list',1,'p_block_item_list','c_parser.py',1472),
-  ('block_item_list -> block_item_list block_item','block_item_list',2,'p_block_item_list','c_parser.py',1473),
-  ('compound_statement -> brace_open block_item_list_opt brace_close','compound_statement',3,'p_compound_statement_1','c_parser.py',1479),
-  ('labeled_statement -> ID COLON pragmacomp_or_statement','labeled_statement',3,'p_labeled_statement_1','c_parser.py',1485),
-  ('labeled_statement -> CASE constant_expression COLON pragmacomp_or_statement','labeled_statement',4,'p_labeled_statement_2','c_parser.py',1489),
-  ('labeled_statement -> DEFAULT COLON pragmacomp_or_statement','labeled_statement',3,'p_labeled_statement_3','c_parser.py',1493),
-  ('selection_statement -> IF LPAREN expression RPAREN pragmacomp_or_statement','selection_statement',5,'p_selection_statement_1','c_parser.py',1497),
-  ('selection_statement -> IF LPAREN expression RPAREN statement ELSE pragmacomp_or_statement','selection_statement',7,'p_selection_statement_2','c_parser.py',1501),
-  ('selection_statement -> SWITCH LPAREN expression RPAREN pragmacomp_or_statement','selection_statement',5,'p_selection_statement_3','c_parser.py',1505),
-  ('iteration_statement -> WHILE LPAREN expression RPAREN pragmacomp_or_statement','iteration_statement',5,'p_iteration_statement_1','c_parser.py',1510),
-  ('iteration_statement -> DO pragmacomp_or_statement WHILE LPAREN expression RPAREN SEMI','iteration_statement',7,'p_iteration_statement_2','c_parser.py',1514),
-  ('iteration_statement -> FOR LPAREN expression_opt SEMI expression_opt SEMI expression_opt RPAREN pragmacomp_or_statement','iteration_statement',9,'p_iteration_statement_3','c_parser.py',1518),
-  ('iteration_statement -> FOR LPAREN declaration expression_opt SEMI expression_opt RPAREN pragmacomp_or_statement','iteration_statement',8,'p_iteration_statement_4','c_parser.py',1522),
-  ('jump_statement -> GOTO ID SEMI','jump_statement',3,'p_jump_statement_1','c_parser.py',1527),
-  ('jump_statement -> BREAK SEMI','jump_statement',2,'p_jump_statement_2','c_parser.py',1531),
-  ('jump_statement -> CONTINUE SEMI','jump_statement',2,'p_jump_statement_3','c_parser.py',1535),
-  ('jump_statement -> RETURN expression SEMI','jump_statement',3,'p_jump_statement_4','c_parser.py',1539),
-  ('jump_statement -> RETURN SEMI','jump_statement',2,'p_jump_statement_4','c_parser.py',1540),
-  ('expression_statement -> expression_opt SEMI','expression_statement',2,'p_expression_statement','c_parser.py',1545),
-  ('expression -> assignment_expression','expression',1,'p_expression','c_parser.py',1552),
-  ('expression -> expression COMMA assignment_expression','expression',3,'p_expression','c_parser.py',1553),
-  ('typedef_name -> TYPEID','typedef_name',1,'p_typedef_name','c_parser.py',1565),
-  ('assignment_expression -> conditional_expression','assignment_expression',1,'p_assignment_expression','c_parser.py',1569),
-  ('assignment_expression -> unary_expression assignment_operator assignment_expression','assignment_expression',3,'p_assignment_expression','c_parser.py',1570),
-  ('assignment_operator -> EQUALS','assignment_operator',1,'p_assignment_operator','c_parser.py',1583),
-  ('assignment_operator -> XOREQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1584),
-  ('assignment_operator -> TIMESEQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1585),
-  ('assignment_operator -> DIVEQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1586),
-  ('assignment_operator -> MODEQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1587),
-  ('assignment_operator -> PLUSEQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1588),
-  ('assignment_operator -> MINUSEQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1589),
-  ('assignment_operator -> LSHIFTEQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1590),
-  ('assignment_operator -> RSHIFTEQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1591),
-  ('assignment_operator -> ANDEQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1592),
-  ('assignment_operator -> OREQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1593),
-  ('constant_expression -> conditional_expression','constant_expression',1,'p_constant_expression','c_parser.py',1598),
-  ('conditional_expression -> binary_expression','conditional_expression',1,'p_conditional_expression','c_parser.py',1602),
-  ('conditional_expression -> binary_expression CONDOP expression COLON conditional_expression','conditional_expression',5,'p_conditional_expression','c_parser.py',1603),
-  ('binary_expression -> cast_expression','binary_expression',1,'p_binary_expression','c_parser.py',1611),
-  ('binary_expression -> binary_expression TIMES binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1612),
-  ('binary_expression -> binary_expression DIVIDE binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1613),
-  ('binary_expression -> binary_expression MOD binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1614),
-  ('binary_expression -> binary_expression PLUS binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1615),
-  ('binary_expression -> binary_expression MINUS binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1616),
-  ('binary_expression -> binary_expression RSHIFT binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1617),
-  ('binary_expression -> binary_expression LSHIFT binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1618),
-  ('binary_expression -> binary_expression LT binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1619),
-  ('binary_expression -> binary_expression LE binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1620),
-  ('binary_expression -> binary_expression GE binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1621),
-  ('binary_expression -> binary_expression GT binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1622),
-  ('binary_expression -> binary_expression EQ binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1623),
-  ('binary_expression -> binary_expression NE binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1624),
-  ('binary_expression -> binary_expression AND binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1625),
-  ('binary_expression -> binary_expression OR binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1626),
-  ('binary_expression -> binary_expression XOR binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1627),
-  ('binary_expression -> binary_expression LAND binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1628),
-  ('binary_expression -> binary_expression LOR binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1629),
-  ('cast_expression -> unary_expression','cast_expression',1,'p_cast_expression_1','c_parser.py',1637),
-  ('cast_expression -> LPAREN type_name RPAREN cast_expression','cast_expression',4,'p_cast_expression_2','c_parser.py',1641),
-  ('unary_expression -> postfix_expression','unary_expression',1,'p_unary_expression_1','c_parser.py',1645),
-  ('unary_expression -> PLUSPLUS unary_expression','unary_expression',2,'p_unary_expression_2','c_parser.py',1649),
-  ('unary_expression -> MINUSMINUS unary_expression','unary_expression',2,'p_unary_expression_2','c_parser.py',1650),
-  ('unary_expression -> unary_operator cast_expression','unary_expression',2,'p_unary_expression_2','c_parser.py',1651),
-  ('unary_expression -> SIZEOF unary_expression','unary_expression',2,'p_unary_expression_3','c_parser.py',1656),
-  ('unary_expression -> SIZEOF LPAREN type_name RPAREN','unary_expression',4,'p_unary_expression_3','c_parser.py',1657),
-  ('unary_operator -> AND','unary_operator',1,'p_unary_operator','c_parser.py',1665),
-  ('unary_operator -> TIMES','unary_operator',1,'p_unary_operator','c_parser.py',1666),
-  ('unary_operator -> PLUS','unary_operator',1,'p_unary_operator','c_parser.py',1667),
-  ('unary_operator -> MINUS','unary_operator',1,'p_unary_operator','c_parser.py',1668),
-  ('unary_operator -> NOT','unary_operator',1,'p_unary_operator','c_parser.py',1669),
-  ('unary_operator -> LNOT','unary_operator',1,'p_unary_operator','c_parser.py',1670),
-  ('postfix_expression -> primary_expression','postfix_expression',1,'p_postfix_expression_1','c_parser.py',1675),
-  ('postfix_expression -> postfix_expression LBRACKET expression RBRACKET','postfix_expression',4,'p_postfix_expression_2','c_parser.py',1679),
-  ('postfix_expression -> postfix_expression LPAREN argument_expression_list RPAREN','postfix_expression',4,'p_postfix_expression_3','c_parser.py',1683),
-  ('postfix_expression -> postfix_expression LPAREN RPAREN','postfix_expression',3,'p_postfix_expression_3','c_parser.py',1684),
-  ('postfix_expression -> postfix_expression PERIOD ID','postfix_expression',3,'p_postfix_expression_4','c_parser.py',1689),
-  ('postfix_expression -> postfix_expression PERIOD TYPEID','postfix_expression',3,'p_postfix_expression_4','c_parser.py',1690),
-  ('postfix_expression -> postfix_expression ARROW ID','postfix_expression',3,'p_postfix_expression_4','c_parser.py',1691),
-  ('postfix_expression -> postfix_expression ARROW TYPEID','postfix_expression',3,'p_postfix_expression_4','c_parser.py',1692),
-  ('postfix_expression -> postfix_expression PLUSPLUS','postfix_expression',2,'p_postfix_expression_5','c_parser.py',1698),
-  ('postfix_expression -> postfix_expression MINUSMINUS','postfix_expression',2,'p_postfix_expression_5','c_parser.py',1699),
-  ('postfix_expression -> LPAREN type_name RPAREN brace_open initializer_list brace_close','postfix_expression',6,'p_postfix_expression_6','c_parser.py',1704),
-  ('postfix_expression -> LPAREN type_name RPAREN brace_open initializer_list COMMA brace_close','postfix_expression',7,'p_postfix_expression_6','c_parser.py',1705),
-  ('postfix_expression -> __RAW LPAREN type_name COMMA STRING_LITERAL COMMA constant_expression RPAREN','postfix_expression',8,'p_postfix_expression_7','c_parser.py',1710),
-  ('postfix_expression -> __RAW LPAREN type_name COMMA STRING_LITERAL COMMA constant_expression COMMA argument_expression_list RPAREN','postfix_expression',10,'p_postfix_expression_7','c_parser.py',1711),
-  ('primary_expression -> identifier','primary_expression',1,'p_primary_expression_1','c_parser.py',1719),
-  ('primary_expression -> constant','primary_expression',1,'p_primary_expression_2','c_parser.py',1723),
-  ('primary_expression -> unified_string_literal','primary_expression',1,'p_primary_expression_3','c_parser.py',1727),
-  ('primary_expression -> unified_wstring_literal','primary_expression',1,'p_primary_expression_3','c_parser.py',1728),
-  ('primary_expression -> LPAREN expression RPAREN','primary_expression',3,'p_primary_expression_4','c_parser.py',1733),
-  ('primary_expression -> OFFSETOF LPAREN type_name COMMA offsetof_member_designator RPAREN','primary_expression',6,'p_primary_expression_5','c_parser.py',1737),
-  ('offsetof_member_designator -> identifier','offsetof_member_designator',1,'p_offsetof_member_designator','c_parser.py',1745),
-  ('offsetof_member_designator -> offsetof_member_designator PERIOD identifier','offsetof_member_designator',3,'p_offsetof_member_designator','c_parser.py',1746),
-  ('offsetof_member_designator -> offsetof_member_designator LBRACKET expression RBRACKET','offsetof_member_designator',4,'p_offsetof_member_designator','c_parser.py',1747),
-  ('argument_expression_list -> assignment_expression','argument_expression_list',1,'p_argument_expression_list','c_parser.py',1759),
-  ('argument_expression_list -> argument_expression_list COMMA assignment_expression','argument_expression_list',3,'p_argument_expression_list','c_parser.py',1760),
-  ('identifier -> ID','identifier',1,'p_identifier','c_parser.py',1769),
-  ('constant -> INT_CONST_DEC','constant',1,'p_constant_1','c_parser.py',1773),
-  ('constant -> INT_CONST_OCT','constant',1,'p_constant_1','c_parser.py',1774),
-  ('constant -> INT_CONST_HEX','constant',1,'p_constant_1','c_parser.py',1775),
-  ('constant -> INT_CONST_BIN','constant',1,'p_constant_1','c_parser.py',1776),
-  ('constant -> INT_CONST_CHAR','constant',1,'p_constant_1','c_parser.py',1777),
-  ('constant -> FLOAT_CONST','constant',1,'p_constant_2','c_parser.py',1796),
-  ('constant -> HEX_FLOAT_CONST','constant',1,'p_constant_2','c_parser.py',1797),
-  ('constant -> CHAR_CONST','constant',1,'p_constant_3','c_parser.py',1813),
-  ('constant -> WCHAR_CONST','constant',1,'p_constant_3','c_parser.py',1814),
-  ('unified_string_literal -> STRING_LITERAL','unified_string_literal',1,'p_unified_string_literal','c_parser.py',1825),
-  ('unified_string_literal -> unified_string_literal STRING_LITERAL','unified_string_literal',2,'p_unified_string_literal','c_parser.py',1826),
-  ('unified_wstring_literal -> WSTRING_LITERAL','unified_wstring_literal',1,'p_unified_wstring_literal','c_parser.py',1836),
-  ('unified_wstring_literal -> unified_wstring_literal WSTRING_LITERAL','unified_wstring_literal',2,'p_unified_wstring_literal','c_parser.py',1837),
-  ('brace_open -> LBRACE','brace_open',1,'p_brace_open','c_parser.py',1847),
-  ('brace_close -> RBRACE','brace_close',1,'p_brace_close','c_parser.py',1853),
-  ('empty -> <empty>','empty',0,'p_empty','c_parser.py',1859),
-]